@@ -86,8 +86,8 @@ def practice_intervals(device, num_exercises):
 
         # Get profile and run session
         profile = get_device_profile(device)
-        manager = SessionManager(profile, ableton)
-        manager.run_interval_drill(num_exercises)
+        with SessionManager(profile, ableton) as manager:
+            manager.run_interval_drill(num_exercises)
 
     except KeyboardInterrupt:
         click.echo("\n\n👋 Bye! Keep practicing!")
@@ -144,8 +144,8 @@ def practice_chords(device, num_exercises, chord_types):
 
         # Get profile and run session
         profile = get_device_profile(device)
-        manager = SessionManager(profile, ableton)
-        manager.run_chord_drill(num_exercises, chord_types=chord_type_list)
+        with SessionManager(profile, ableton) as manager:
+            manager.run_chord_drill(num_exercises, chord_types=chord_type_list)
 
     except KeyboardInterrupt:
         click.echo("\n\n👋 Bye! Keep practicing!")
@@ -192,8 +192,8 @@ def practice_melody(device, num_exercises, melody_length):
 
         # Get profile and run session
         profile = get_device_profile(device)
-        manager = SessionManager(profile, ableton)
-        manager.run_melody_drill(num_exercises, melody_length=melody_length)
+        with SessionManager(profile, ableton) as manager:
+            manager.run_melody_drill(num_exercises, melody_length=melody_length)
 
     except KeyboardInterrupt:
         click.echo("\n\n👋 Bye! Keep practicing!")
@@ -277,8 +277,8 @@ def practice_lesson(device, lesson_id):
 
         # Get profile and run lesson practice
         profile = get_device_profile(device)
-        manager = SessionManager(profile, ableton)
-        manager.run_lesson_practice(lesson)
+        with SessionManager(profile, ableton) as manager:
+            manager.run_lesson_practice(lesson)
 
     except KeyboardInterrupt:
         click.echo("\n\n👋 Bye! Keep practicing!")
@@ -332,14 +332,13 @@ def practice_rhythm_snare(device, subdivision, tempo, bars):
 
         # Create drum kit profile
         profile = DonnerDrumKitProfile(device)
-        manager = SessionManager(profile, ableton)
-
-        # Run snare drill
-        manager.run_rhythm_snare_drill(
-            subdivision=subdivision,
-            tempo_bpm=tempo,
-            num_bars=bars
-        )
+        with SessionManager(profile, ableton) as manager:
+            # Run snare drill
+            manager.run_rhythm_snare_drill(
+                subdivision=subdivision,
+                tempo_bpm=tempo,
+                num_bars=bars
+            )
 
     except KeyboardInterrupt:
         click.echo("\n\n👋 Bye! Keep grooving!")
@@ -390,14 +389,13 @@ def practice_rhythm_kit(device, pattern, tempo, bars):
 
         # Create drum kit profile
         profile = DonnerDrumKitProfile(device)
-        manager = SessionManager(profile, ableton)
-
-        # Run kit drill
-        manager.run_rhythm_kit_drill(
-            pattern_type=pattern,
-            tempo_bpm=tempo,
-            num_bars=bars
-        )
+        with SessionManager(profile, ableton) as manager:
+            # Run kit drill
+            manager.run_rhythm_kit_drill(
+                pattern_type=pattern,
+                tempo_bpm=tempo,
+                num_bars=bars
+            )
 
     except KeyboardInterrupt:
         click.echo("\n\n👋 Bye! Keep grooving!")
@@ -435,14 +433,13 @@ def practice_voice_pitch(exercises, min_pitch, max_pitch):
         click.echo("🎤 Initializing microphone input...")
         detector = AubioPitchDetector()
 
-        manager = SessionManager(detector, ableton)
-
-        # Run pitch match drill
-        manager.run_voice_pitch_match_drill(
-            num_exercises=exercises,
-            min_pitch=min_pitch,
-            max_pitch=max_pitch
-        )
+        with SessionManager(detector, ableton) as manager:
+            # Run pitch match drill
+            manager.run_voice_pitch_match_drill(
+                num_exercises=exercises,
+                min_pitch=min_pitch,
+                max_pitch=max_pitch
+            )
 
     except KeyboardInterrupt:
         click.echo("\n\n👋 Bye! Keep singing!")
@@ -486,13 +483,12 @@ def practice_voice_scale(exercises, scales):
         click.echo("🎤 Initializing microphone input...")
         detector = AubioPitchDetector()
 
-        manager = SessionManager(detector, ableton)
-
-        # Run scale drill
-        manager.run_voice_scale_drill(
-            num_exercises=exercises,
-            scale_types=scale_types
-        )
+        with SessionManager(detector, ableton) as manager:
+            # Run scale drill
+            manager.run_voice_scale_drill(
+                num_exercises=exercises,
+                scale_types=scale_types
+            )
 
     except KeyboardInterrupt:
         click.echo("\n\n👋 Bye! Keep singing!")
@@ -533,13 +529,12 @@ def practice_voice_sightsing(exercises, length):
         click.echo("🎤 Initializing microphone input...")
         detector = AubioPitchDetector()
 
-        manager = SessionManager(detector, ableton)
-
-        # Run sight-singing drill
-        manager.run_voice_sight_singing_drill(
-            num_exercises=exercises,
-            phrase_length=length
-        )
+        with SessionManager(detector, ableton) as manager:
+            # Run sight-singing drill
+            manager.run_voice_sight_singing_drill(
+                num_exercises=exercises,
+                phrase_length=length
+            )
 
     except KeyboardInterrupt:
         click.echo("\n\n👋 Bye! Keep singing!")
@@ -804,19 +799,18 @@ def practice_improv(tune_name, choruses, device, simulation, index_path):
         click.echo(f"   Choruses: {choruses}\n")
 
         # Create session manager
-        manager = SessionManager(profile, ableton)
-
-        # Run improvisation session
-        click.echo("=" * 60)
-        click.echo("STARTING IMPROVISATION SESSION")
-        click.echo("=" * 60)
-        click.echo()
+        with SessionManager(profile, ableton) as manager:
+            # Run improvisation session
+            click.echo("=" * 60)
+            click.echo("STARTING IMPROVISATION SESSION")
+            click.echo("=" * 60)
+            click.echo()
 
-        results = manager.run_improv_session(
-            tune=tune,
-            chorus_count=choruses,
-            use_simulation=simulation
-        )
+            results = manager.run_improv_session(
+                tune=tune,
+                chorus_count=choruses,
+                use_simulation=simulation
+            )
 
         click.echo("\n" + "=" * 60)
         click.echo("SESSION COMPLETE")
@@ -898,19 +892,18 @@ def practice_improv_audio(tune_name, choruses, simulation, index_path):
         click.echo(f"   Choruses: {choruses}\n")
 
         # Create session manager (no device profile needed for audio)
-        manager = SessionManager(None, ableton)
-
-        # Run audio improvisation session
-        click.echo("=" * 60)
-        click.echo("STARTING AUDIO IMPROVISATION SESSION")
-        click.echo("=" * 60)
-        click.echo()
+        with SessionManager(None, ableton) as manager:
+            # Run audio improvisation session
+            click.echo("=" * 60)
+            click.echo("STARTING AUDIO IMPROVISATION SESSION")
+            click.echo("=" * 60)
+            click.echo()
 
-        results = manager.run_improv_audio_session(
-            tune=tune,
-            chorus_count=choruses,
-            use_simulation=simulation
-        )
+            results = manager.run_improv_audio_session(
+                tune=tune,
+                chorus_count=choruses,
+                use_simulation=simulation
+            )
 
         click.echo("\n" + "=" * 60)
         click.echo("SESSION COMPLETE")
@@ -966,15 +959,18 @@ def show_stats():
         click.echo("=" * 60)
         click.echo()
 
+        # Totals, dates and distributions in one pass over the sessions
+        bundle = progress_stats.compute_bundle(real_sessions)
+
         # Total time
-        total_minutes = progress_stats.compute_totals(real_sessions)
+        total_minutes = bundle.total_minutes
         total_hours = total_minutes / 60.0
         click.echo(f"**Total Practice Time:** {total_minutes:.0f} minutes ({total_hours:.1f} hours)")
         click.echo()
 
         # Practice days and streak
-        practice_days = progress_stats.compute_practice_days(real_sessions)
-        streak = progress_stats.compute_recent_streak(real_sessions, days=30)
+        practice_days = len(bundle.practice_dates)
+        streak = progress_stats.count_streak(bundle.practice_dates, days=30)
         click.echo(f"**Practice Days:** {practice_days} days")
         if streak > 0:
             click.echo(f"**Current Streak:** {streak} consecutive days")
@@ -984,7 +980,7 @@ def show_stats():
 
         # By instrument
         click.echo("**By Instrument:**")
-        minutes_by_instrument = progress_stats.compute_minutes_by_instrument(real_sessions)
+        minutes_by_instrument = bundle.minutes_by_instrument
         for instrument, minutes in sorted(minutes_by_instrument.items(), key=lambda x: -x[1]):
             percentage = (minutes / total_minutes) * 100
             click.echo(f"  • {instrument.capitalize()}: {minutes:.0f} min ({percentage:.0f}%)")
@@ -992,7 +988,7 @@ def show_stats():
 
         # By mode
         click.echo("**By Mode:**")
-        minutes_by_mode = progress_stats.compute_minutes_by_mode(real_sessions)
+        minutes_by_mode = bundle.minutes_by_mode
         for mode, minutes in sorted(minutes_by_mode.items(), key=lambda x: -x[1]):
             percentage = (minutes / total_minutes) * 100
             mode_display = mode.replace('_', ' ').title()
@@ -34,13 +34,13 @@ def run_interval_demo(num_exercises: int = 3, mode: str = "correct"):
     # Set random seed for reproducibility
     random.seed(42)
 
-    # Create test device and session
+    # Create test device
     device = TestDeviceProfile(mode=mode)
     ableton = AbletonMCPClient()
-    manager = SessionManager(device, ableton)
 
     # Run demo
-    results = manager.run_interval_drill(num_exercises)
+    with SessionManager(device, ableton) as manager:
+        results = manager.run_interval_drill(num_exercises)
 
     print("\n📊 Demo Statistics:")
     correct = sum(1 for r in results if r.correct)
@@ -73,16 +73,16 @@ def run_chord_demo(num_exercises: int = 3, mode: str = "correct"):
     # Set random seed for reproducibility
     random.seed(123)
 
-    # Create test device and session
+    # Create test device
     device = TestDeviceProfile(mode=mode)
     ableton = AbletonMCPClient()
-    manager = SessionManager(device, ableton)
 
     # Run demo with triads only
-    results = manager.run_chord_drill(
-        num_exercises,
-        chord_types=["major", "minor", "diminished", "augmented"]
-    )
+    with SessionManager(device, ableton) as manager:
+        results = manager.run_chord_drill(
+            num_exercises,
+            chord_types=["major", "minor", "diminished", "augmented"]
+        )
 
     print("\n📊 Demo Statistics:")
     correct = sum(1 for r in results if r.correct)
@@ -113,10 +113,9 @@ def run_melody_lesson_demo(mode: str = "correct"):
     # Set random seed for reproducibility
     random.seed(456)
 
-    # Create test device and session
+    # Create test device
     device = TestDeviceProfile(mode=mode)
     ableton = AbletonMCPClient()
-    manager = SessionManager(device, ableton)
 
     # Create a demo lesson with recognizable phrases
     lesson = Lesson(
@@ -156,7 +155,8 @@ def run_melody_lesson_demo(mode: str = "correct"):
     lesson.add_phrase(phrase2)
 
     # Run lesson practice
-    results = manager.run_lesson_practice(lesson)
+    with SessionManager(device, ableton) as manager:
+        results = manager.run_lesson_practice(lesson)
 
     print("\n📊 Demo Statistics:")
     correct = sum(1 for r in results if r.correct)
@@ -261,8 +261,8 @@ def run_rhythm_demo(mode: str = "perfect"):
     print()
 
     # Get simulated hits
-    import time
-    start_time = time.time() * 1000
+    from lyra_live.devices.base import monotonic_ms
+    start_time = monotonic_ms()
     hits = device.detect_input(timeout_ms=5000)
 
     if hits:
@@ -351,8 +351,8 @@ def run_rhythm_backbeat_demo(mode: str = "perfect"):
     print()
 
     # Get simulated hits
-    import time
-    start_time = time.time() * 1000
+    from lyra_live.devices.base import monotonic_ms
+    start_time = monotonic_ms()
     hits = device.detect_input(timeout_ms=6000)
 
     if hits:
@@ -7,8 +7,9 @@ along with common data structures for device capabilities and MIDI events.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import List, Optional, Tuple
 import re
+import time
 
 
 @dataclass
@@ -17,7 +18,7 @@ class DeviceCapabilities:
     has_lights: bool = False
     has_aftertouch: bool = False
     is_mpe: bool = False
-    note_range: tuple[int, int] = (21, 108)  # A0 to C8
+    note_range: Tuple[int, int] = (21, 108)  # A0 to C8
 
 
 @dataclass
@@ -26,7 +27,17 @@ class MIDIEvent:
     type: str  # "note_on", "note_off", "cc"
     pitch: Optional[int] = None
     velocity: Optional[int] = None
-    timestamp_ms: int = 0
+    timestamp_ms: int = 0  # On the monotonic_ms() clock
+
+
+def monotonic_ms() -> int:
+    """
+    Current time in whole milliseconds on the clock MIDI events are stamped with.
+
+    Monotonic, so differences between timestamps can't be thrown off by
+    wall-clock adjustments (NTP steps, DST).
+    """
+    return time.monotonic_ns() // 1_000_000
 
 
 class DeviceProfile(ABC):
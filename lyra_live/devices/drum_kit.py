@@ -60,6 +60,7 @@ class DrumKitProfile(DeviceProfile):
         self.note_mapping = note_mapping or GENERAL_MIDI_DRUM_MAP
         self.output_port = None
         self.input_port = None
+        self.input_buffer = None  # MIDIInputBuffer, created on first listen
 
         # Reverse mapping for looking up MIDI notes by drum part name
         self.part_to_note = {v: k for k, v in self.note_mapping.items()}
@@ -98,34 +99,34 @@ class DrumKitProfile(DeviceProfile):
             List of MIDIEvent objects with drum hits, or None if no hits detected
         """
         events = []
-        start_time = time.time() * 1000  # Milliseconds
+        deadline = time.monotonic() + timeout_ms / 1000.0
 
+        # The port stays open between calls, capturing in the background
+        # with each hit's arrival time; hits before this call are dropped
         try:
-            import mido
-            with mido.open_input(self.device_name) as inport:
-                while True:
-                    current_time = time.time() * 1000
-                    if current_time - start_time > timeout_ms:
-                        break
-
-                    # Check for messages (non-blocking)
-                    for msg in inport.iter_pending():
-                        if msg.type == 'note_on' and msg.velocity > 0:
-                            # Record drum hit with precise timestamp
-                            drum_part = self.get_drum_part(msg.note)
-                            events.append(MIDIEvent(
-                                type='note_on',
-                                pitch=msg.note,
-                                velocity=msg.velocity,
-                                timestamp_ms=int(current_time)
-                            ))
-
-                    # Small sleep to avoid busy waiting
-                    time.sleep(0.001)  # 1ms poll rate for precision
-
+            if self.input_buffer is None:
+                from lyra_live.devices.midi_input import MIDIInputBuffer
+                self.input_buffer = MIDIInputBuffer(self.device_name)
+            self.input_buffer.open()
         except (IOError, OSError) as e:
             print(f"Warning: Could not open drum kit input: {e}")
             return None
+        self.input_buffer.clear()
+
+        while True:
+            received = self.input_buffer.get(deadline - time.monotonic())
+            if received is None:
+                break
+
+            arrival_ms, msg = received
+            if msg.type == 'note_on' and msg.velocity > 0:
+                # Record drum hit with precise timestamp
+                events.append(MIDIEvent(
+                    type='note_on',
+                    pitch=msg.note,
+                    velocity=msg.velocity,
+                    timestamp_ms=arrival_ms
+                ))
 
         return events if events else None
 
@@ -135,6 +136,8 @@ class DrumKitProfile(DeviceProfile):
             self.output_port.close()
         if self.input_port:
             self.input_port.close()
+        if self.input_buffer:
+            self.input_buffer.close()
 
 
 class DonnerDrumKitProfile(DrumKitProfile):
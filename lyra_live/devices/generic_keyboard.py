@@ -9,6 +9,7 @@ device-specific features like light guides or MPE.
 import mido
 import time
 from lyra_live.devices.base import DeviceProfile, DeviceCapabilities, MIDIEvent
+from lyra_live.devices.midi_input import MIDIInputBuffer
 from typing import List, Optional
 
 
@@ -22,6 +23,7 @@ class GenericKeyboardProfile(DeviceProfile):
         self.device_name = device_name
         self.output_port = None
         self.input_port = None
+        self.input_buffer = MIDIInputBuffer(device_name)
 
     def connect(self):
         """Open MIDI output port"""
@@ -51,54 +53,55 @@ class GenericKeyboardProfile(DeviceProfile):
     def detect_input(self, timeout_ms: int = 5000) -> Optional[List[MIDIEvent]]:
         """Listen for MIDI input from device"""
         events = []
-        start_time = time.time() * 1000  # Convert to milliseconds
+        deadline = time.monotonic() + timeout_ms / 1000.0
 
+        # The port stays open between calls, capturing in the background;
+        # anything played before this call isn't part of the answer
         try:
-            with mido.open_input(self.device_name) as inport:
-                while True:
-                    # Check timeout
-                    current_time = time.time() * 1000
-                    if current_time - start_time > timeout_ms:
-                        break
-
-                    # Check for messages (non-blocking)
-                    for msg in inport.iter_pending():
-                        if msg.type == 'note_on' and msg.velocity > 0:
-                            events.append(MIDIEvent(
-                                type='note_on',
-                                pitch=msg.note,
-                                velocity=msg.velocity,
-                                timestamp_ms=int(current_time)
-                            ))
-                        elif msg.type == 'note_off' or (msg.type == 'note_on' and msg.velocity == 0):
-                            events.append(MIDIEvent(
-                                type='note_off',
-                                pitch=msg.note,
-                                velocity=0,
-                                timestamp_ms=int(current_time)
-                            ))
-
-                    # If we have note events, wait a bit for any additional notes
-                    # (in case user plays multiple notes for an interval/chord)
-                    if events:
-                        time.sleep(0.5)  # Wait 500ms for additional notes
-                        # Check one more time for any additional notes
-                        for msg in inport.iter_pending():
-                            if msg.type == 'note_on' and msg.velocity > 0:
-                                events.append(MIDIEvent(
-                                    type='note_on',
-                                    pitch=msg.note,
-                                    velocity=msg.velocity,
-                                    timestamp_ms=int(time.time() * 1000)
-                                ))
-                        break
-
-                    # Small sleep to avoid busy waiting
-                    time.sleep(0.01)
-
+            self.input_buffer.open()
         except (IOError, OSError) as e:
             print(f"Warning: Could not open input port for {self.device_name}: {e}")
             return None
+        self.input_buffer.clear()
+
+        while True:
+            received = self.input_buffer.get(deadline - time.monotonic())
+            if received is None:
+                break
+
+            arrival_ms, msg = received
+            if msg.type == 'note_on' and msg.velocity > 0:
+                events.append(MIDIEvent(
+                    type='note_on',
+                    pitch=msg.note,
+                    velocity=msg.velocity,
+                    timestamp_ms=arrival_ms
+                ))
+            elif msg.type == 'note_off' or (msg.type == 'note_on' and msg.velocity == 0):
+                events.append(MIDIEvent(
+                    type='note_off',
+                    pitch=msg.note,
+                    velocity=0,
+                    timestamp_ms=arrival_ms
+                ))
+
+            # If we have note events, wait a bit for any additional notes
+            # (in case user plays multiple notes for an interval/chord)
+            if events:
+                deadline = time.monotonic() + 0.5  # Wait 500ms for additional notes
+                while True:
+                    received = self.input_buffer.get(deadline - time.monotonic())
+                    if received is None:
+                        break
+                    arrival_ms, msg = received
+                    if msg.type == 'note_on' and msg.velocity > 0:
+                        events.append(MIDIEvent(
+                            type='note_on',
+                            pitch=msg.note,
+                            velocity=msg.velocity,
+                            timestamp_ms=arrival_ms
+                        ))
+                break
 
         return events if events else None
 
@@ -108,3 +111,4 @@ class GenericKeyboardProfile(DeviceProfile):
             self.output_port.close()
         if self.input_port:
             self.input_port.close()
+        self.input_buffer.close()
@@ -0,0 +1,76 @@
+"""
+Background capture of MIDI input.
+
+A MIDIInputBuffer keeps a device's input port open and lets mido's
+receive thread push each incoming message into a bounded ring buffer,
+stamped with its arrival time. Device profiles drain the buffer instead
+of opening the port and polling it for every exercise.
+"""
+
+import mido
+import threading
+from collections import deque
+from typing import Optional, Tuple
+from lyra_live.devices.base import monotonic_ms
+
+
+class MIDIInputBuffer:
+    """Ring buffer of (arrival time, message) fed by an open input port"""
+
+    def __init__(self, device_name: str, maxlen: int = 4096):
+        """
+        Initialize input buffer (the port is opened by open()).
+
+        Args:
+            device_name: Name of the MIDI input port
+            maxlen: Most messages kept; the oldest are dropped beyond this
+        """
+        self.device_name = device_name
+        self._messages: deque = deque(maxlen=maxlen)
+        self._ready = threading.Condition()
+        self._port = None
+
+    def open(self):
+        """
+        Open the input port and start capturing, if not already open.
+
+        Raises:
+            IOError/OSError: If the port can't be opened
+        """
+        if self._port is None:
+            self._port = mido.open_input(self.device_name, callback=self.receive)
+
+    def close(self):
+        """Stop capturing and close the input port."""
+        if self._port is not None:
+            self._port.close()
+            self._port = None
+
+    def receive(self, msg: mido.Message):
+        """Store a message (called from mido's receive thread)."""
+        with self._ready:
+            self._messages.append((monotonic_ms(), msg))
+            self._ready.notify()
+
+    def clear(self):
+        """Drop all messages received so far."""
+        with self._ready:
+            self._messages.clear()
+
+    def get(self, timeout_s: float) -> Optional[Tuple[int, mido.Message]]:
+        """
+        Take the oldest message, waiting for one if none is buffered.
+
+        Args:
+            timeout_s: Longest time to wait, in seconds
+
+        Returns:
+            (arrival time on the monotonic_ms() clock, message), or None if
+            nothing arrived in time
+        """
+        with self._ready:
+            if not self._messages and timeout_s > 0:
+                self._ready.wait(timeout_s)
+            if self._messages:
+                return self._messages.popleft()
+            return None
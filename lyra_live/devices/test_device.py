@@ -5,7 +5,7 @@ Provides fake MIDI devices that can simulate user responses
 without requiring actual hardware. Useful for CI/CD and demos.
 """
 
-from lyra_live.devices.base import DeviceProfile, DeviceCapabilities, MIDIEvent
+from lyra_live.devices.base import DeviceProfile, DeviceCapabilities, MIDIEvent, monotonic_ms
 from lyra_live.ear_training.base import Note
 from typing import List, Optional
 import time
@@ -112,7 +112,7 @@ class TestDeviceProfile(DeviceProfile):
                 type='note_on',
                 pitch=note.pitch,
                 velocity=note.velocity,
-                timestamp_ms=int(time.time() * 1000)
+                timestamp_ms=monotonic_ms()
             ))
         return events
 
@@ -127,14 +127,14 @@ class TestDeviceProfile(DeviceProfile):
             type='note_on',
             pitch=self.expected_notes[0].pitch,
             velocity=self.expected_notes[0].velocity,
-            timestamp_ms=int(time.time() * 1000)
+            timestamp_ms=monotonic_ms()
         ))
         # Second note off by 1 semitone
         events.append(MIDIEvent(
             type='note_on',
             pitch=self.expected_notes[1].pitch + 1,
             velocity=self.expected_notes[1].velocity,
-            timestamp_ms=int(time.time() * 1000)
+            timestamp_ms=monotonic_ms()
         ))
         return events
 
@@ -150,7 +150,7 @@ class TestDeviceProfile(DeviceProfile):
                 type='note_on',
                 pitch=self.expected_notes[i].pitch,
                 velocity=self.expected_notes[i].velocity,
-                timestamp_ms=int(time.time() * 1000)
+                timestamp_ms=monotonic_ms()
             ))
 
         # Third note altered by 1 semitone
@@ -159,7 +159,7 @@ class TestDeviceProfile(DeviceProfile):
                 type='note_on',
                 pitch=self.expected_notes[2].pitch + 1,
                 velocity=self.expected_notes[2].velocity,
-                timestamp_ms=int(time.time() * 1000)
+                timestamp_ms=monotonic_ms()
             ))
 
         # Rest correct
@@ -168,7 +168,7 @@ class TestDeviceProfile(DeviceProfile):
                 type='note_on',
                 pitch=self.expected_notes[i].pitch,
                 velocity=self.expected_notes[i].velocity,
-                timestamp_ms=int(time.time() * 1000)
+                timestamp_ms=monotonic_ms()
             ))
 
         return events
@@ -187,7 +187,7 @@ class TestDeviceProfile(DeviceProfile):
                 type='note_on',
                 pitch=pitch,
                 velocity=note.velocity,
-                timestamp_ms=int(time.time() * 1000)
+                timestamp_ms=monotonic_ms()
             ))
         return events
 
@@ -264,7 +264,7 @@ class TestDrumKitProfile(DeviceProfile):
 
         import random
 
-        start_time = time.time() * 1000
+        start_time = monotonic_ms()
         events = []
 
         for beat in self.expected_beats:
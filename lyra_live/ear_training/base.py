@@ -6,10 +6,20 @@ and results that are device-agnostic.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
 
 
+# Default (min, max) MIDI range for randomly chosen root notes: C3 to C5
+DEFAULT_ROOT_RANGE: Tuple[int, int] = (48, 72)
+
+# Chromatic note names for display purposes
+CHROMATIC_NOTES: Tuple[str, ...] = ('C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B')
+
+# Precomputed note name + octave for every MIDI pitch (e.g. 60 -> "C4")
+_MIDI_NAMES = tuple(f"{CHROMATIC_NOTES[p % 12]}{(p // 12) - 1}" for p in range(128))
+
+
 class ExerciseType(Enum):
     """Types of ear training exercises"""
     INTERVAL = "interval"
@@ -33,10 +43,11 @@ class Note:
     role: Optional[str] = None  # "root", "third", "fifth", etc.
 
     def __repr__(self):
-        note_names = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        octave = (self.pitch // 12) - 1
-        note_name = note_names[self.pitch % 12]
-        return f"Note({note_name}{octave}, pitch={self.pitch}, vel={self.velocity})"
+        if 0 <= self.pitch < 128:
+            name = _MIDI_NAMES[self.pitch]
+        else:
+            name = f"{CHROMATIC_NOTES[self.pitch % 12]}{(self.pitch // 12) - 1}"
+        return f"Note({name}, pitch={self.pitch}, vel={self.velocity})"
 
 
 @dataclass
@@ -73,7 +84,3 @@ class ExerciseResult:
     def __repr__(self):
         status = "✓" if self.correct else "✗"
         return f"ExerciseResult({status} {self.feedback})"
-
-
-# Chromatic note names for display purposes
-CHROMATIC_NOTES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
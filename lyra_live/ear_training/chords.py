@@ -9,8 +9,8 @@ Phase 2 feature.
 """
 
 import random
-from lyra_live.ear_training.base import Exercise, Note, ExerciseType
-from typing import List, Dict
+from lyra_live.ear_training.base import Exercise, Note, ExerciseType, DEFAULT_ROOT_RANGE
+from typing import List, Dict, Tuple
 
 
 # Chord formulas: semitone intervals from root
@@ -84,7 +84,7 @@ class ChordQualityExercise:
     @staticmethod
     def generate_random(
         chord_types: List[str] = None,
-        root_range: tuple[int, int] = (48, 72)
+        root_range: Tuple[int, int] = DEFAULT_ROOT_RANGE
     ) -> Exercise:
         """
         Generate random chord quality exercise.
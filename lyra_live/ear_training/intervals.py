@@ -6,8 +6,8 @@ For MVP, focuses on basic interval recognition (unison through octave).
 """
 
 import random
-from lyra_live.ear_training.base import Exercise, Note, ExerciseType
-from typing import List
+from lyra_live.ear_training.base import Exercise, Note, ExerciseType, DEFAULT_ROOT_RANGE
+from typing import List, Tuple
 
 
 # Map interval names to semitone distances
@@ -76,7 +76,7 @@ class IntervalExercise:
         )
 
     @staticmethod
-    def generate_random(root_range: tuple[int, int] = (48, 72)) -> Exercise:
+    def generate_random(root_range: Tuple[int, int] = DEFAULT_ROOT_RANGE) -> Exercise:
         """
         Generate random interval exercise.
 
@@ -8,8 +8,8 @@ Phase 2 feature.
 """
 
 import random
-from lyra_live.ear_training.base import Exercise, Note, ExerciseType
-from typing import List
+from lyra_live.ear_training.base import Exercise, Note, ExerciseType, DEFAULT_ROOT_RANGE
+from typing import List, Tuple
 
 
 # Scale patterns (semitones from root)
@@ -111,7 +111,7 @@ class MelodyImitationExercise:
     def generate_random(
         length: int = None,
         scale: str = "major",
-        root_range: tuple[int, int] = (48, 72),
+        root_range: Tuple[int, int] = DEFAULT_ROOT_RANGE,
         note_duration_ms: int = 500
     ) -> Exercise:
         """
@@ -135,27 +135,29 @@ class MelodyImitationExercise:
         root_note = random.randint(root_range[0], root_range[1])
         scale_intervals = SCALES[scale]
 
-        notes = []
-        for i in range(length):
-            # Random walk through scale
-            scale_degree = random.randint(0, len(scale_intervals) - 1)
-            pitch = root_note + scale_intervals[scale_degree]
-
-            notes.append(Note(
-                pitch=pitch,
+        # Draw every scale step in one call rather than one randint per note
+        steps = random.choices(scale_intervals, k=length)
+        notes = [
+            Note(
+                pitch=root_note + step,
                 duration_ms=note_duration_ms,
                 velocity=80,
                 role=f"note_{i}"
-            ))
+            )
+            for i, step in enumerate(steps)
+        ]
 
         exercise_id = f"melody_random_{root_note}_{length}notes"
         return MelodyImitationExercise.generate(notes, exercise_id)
 
     @staticmethod
-    def validate_sequence(expected: List[Note], actual: List[Note]) -> tuple[bool, float]:
+    def validate_sequence(expected: List[Note], actual: List[Note]) -> Tuple[bool, float]:
         """
         Validate melody sequence with partial credit.
 
+        Notes are aligned rather than compared position by position, so a
+        single skipped or extra note doesn't mark every following note wrong.
+
         Args:
             expected: Expected note sequence
             actual: User's played sequence
@@ -163,22 +165,49 @@ class MelodyImitationExercise:
         Returns:
             Tuple of (is_perfect_match, accuracy_percentage)
         """
+        matches = _aligned_matches(
+            [note.pitch for note in expected],
+            [note.pitch for note in actual]
+        )
+
         if len(expected) != len(actual):
             # Penalize length mismatch heavily
             max_len = max(len(expected), len(actual))
             min_len = min(len(expected), len(actual))
             length_penalty = min_len / max_len
 
-            # Check matching notes up to shorter length
-            matches = sum(1 for i in range(min_len)
-                         if expected[i].pitch == actual[i].pitch)
             accuracy = (matches / max_len) * length_penalty
             return False, accuracy
 
-        # Same length - check note-by-note
-        matches = sum(1 for i in range(len(expected))
-                     if expected[i].pitch == actual[i].pitch)
+        # Same length
         accuracy = matches / len(expected)
         is_perfect = (matches == len(expected))
 
         return is_perfect, accuracy
+
+
+def _aligned_matches(expected: List[int], actual: List[int]) -> int:
+    """
+    Count matching pitches in the best in-order alignment of two sequences.
+
+    Global alignment with unit credit for a match and no credit for a
+    substitution, skipped note or extra note (the longest common
+    subsequence), filled one row at a time.
+
+    Args:
+        expected: Expected pitches
+        actual: Played pitches
+
+    Returns:
+        Number of aligned matching pitches
+    """
+    previous = [0] * (len(actual) + 1)
+    for exp_pitch in expected:
+        current = [0]
+        for j, act_pitch in enumerate(actual):
+            if exp_pitch == act_pitch:
+                current.append(previous[j] + 1)
+            else:
+                current.append(max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
@@ -6,11 +6,19 @@ Supports single-limb exercises, full-kit patterns, and adaptive difficulty.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
-from lyra_live.ear_training.base import Exercise, ExerciseType
+from itertools import islice
+from typing import List, Optional, Dict, Tuple
+from lyra_live.ear_training.base import Exercise, ExerciseType, Note
 import random
 
 
+# Common time, the default time signature for grids and generated patterns
+_FOUR_FOUR: Tuple[int, int] = (4, 4)
+
+# Hits per beat for each supported subdivision
+_HITS_PER_BEAT: Dict[str, int] = {"quarter": 1, "eighth": 2, "sixteenth": 4}
+
+
 @dataclass
 class Beat:
     """
@@ -36,10 +44,38 @@ class RhythmGrid:
     Represents a rhythmic pattern with tempo, time signature, and expected hits.
     """
     tempo_bpm: int
-    time_signature: tuple[int, int] = (4, 4)  # (beats_per_bar, note_value)
+    time_signature: Tuple[int, int] = _FOUR_FOUR  # (beats_per_bar, note_value)
     num_bars: int = 1
     beats: List[Beat] = field(default_factory=list)
 
+    def __post_init__(self):
+        # Sort once up front; Timsort is linear on the usual already-ordered input
+        self.beats.sort(key=lambda b: b.time_ms)
+
+    def get_sorted_beats(self, drum_part: Optional[str] = None) -> List[Beat]:
+        """
+        Get beats in time order, optionally for a single drum part.
+
+        Beats are sorted at construction, so usually this is only a linear
+        check of the order. Generators may assign ``beats`` afterwards in
+        musical rather than chronological order, and callers may edit it in
+        place, so the check runs on every call and a sorted copy is made
+        when it fails.
+
+        Args:
+            drum_part: If set, only return beats on this drum part
+
+        Returns:
+            List of beats sorted by time_ms (the grid's own list when no
+            drum part is given and it is already in order; don't modify it)
+        """
+        beats = self.beats
+        if drum_part is not None:
+            beats = [b for b in beats if b.drum_part == drum_part]
+        if all(a.time_ms <= b.time_ms for a, b in zip(beats, islice(beats, 1, None))):
+            return beats
+        return sorted(beats, key=lambda b: b.time_ms)
+
     def get_duration_ms(self) -> int:
         """Calculate total duration of the pattern in milliseconds."""
         beats_per_bar, note_value = self.time_signature
@@ -69,7 +105,6 @@ class RhythmExercise:
     def to_exercise(self) -> Exercise:
         """Convert to generic Exercise object."""
         # Convert beats to Notes for compatibility
-        from lyra_live.ear_training.base import Note
         notes = [
             Note(pitch=0, duration_ms=beat.time_ms, velocity=beat.velocity)
             for beat in self.grid.beats
@@ -111,7 +146,7 @@ class RhythmExerciseGenerator:
         subdivision: str,  # "quarter", "eighth", "sixteenth"
         tempo_bpm: int = 80,
         num_bars: int = 1,
-        time_signature: tuple[int, int] = (4, 4)
+        time_signature: Tuple[int, int] = _FOUR_FOUR
     ) -> RhythmExercise:
         """
         Generate a straight rhythm pattern (all hits on the grid).
@@ -135,15 +170,8 @@ class RhythmExerciseGenerator:
         beat_duration_ms = grid.get_beat_duration_ms()
         beats_per_bar, _ = time_signature
 
-        # Determine hits per beat based on subdivision
-        if subdivision == "quarter":
-            hits_per_beat = 1
-        elif subdivision == "eighth":
-            hits_per_beat = 2
-        elif subdivision == "sixteenth":
-            hits_per_beat = 4
-        else:
-            hits_per_beat = 1
+        # Determine hits per beat based on subdivision (unknown -> quarter)
+        hits_per_beat = _HITS_PER_BEAT.get(subdivision, 1)
 
         # Generate hits
         beats = []
@@ -189,7 +217,7 @@ class RhythmExerciseGenerator:
         """
         grid = RhythmGrid(
             tempo_bpm=tempo_bpm,
-            time_signature=(4, 4),
+            time_signature=_FOUR_FOUR,
             num_bars=num_bars
         )
 
@@ -254,7 +282,7 @@ class RhythmExerciseGenerator:
         """
         grid = RhythmGrid(
             tempo_bpm=tempo_bpm,
-            time_signature=(4, 4),
+            time_signature=_FOUR_FOUR,
             num_bars=num_bars
         )
 
@@ -298,6 +326,64 @@ class RhythmExerciseGenerator:
 class RhythmValidator:
     """Validate rhythm performance with timing analysis."""
 
+    @staticmethod
+    def _match_hits(
+        expected_times: List[int],
+        actual_times: List[int],
+        tolerance_ms: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Optimally pair expected beats with actual hits.
+
+        Finds the assignment that matches the most hits within tolerance and,
+        among those, minimizes the total absolute timing error. Unlike a greedy
+        nearest-match, a hit sitting between two close expected beats can't
+        steal the only viable partner of its neighbour.
+
+        With |error| costs an optimal assignment never crosses in time, so a
+        dynamic program over both time-sorted sequences is exact.
+
+        Args:
+            expected_times: Expected beat times in milliseconds, sorted
+            actual_times: Actual hit times in milliseconds
+            tolerance_ms: Timing window in milliseconds (±tolerance)
+
+        Returns:
+            List of (expected_index, actual_index) pairs in expected order
+        """
+        exp_order = range(len(expected_times))
+        act_order = sorted(range(len(actual_times)), key=actual_times.__getitem__)
+        n, m = len(exp_order), len(act_order)
+
+        # best[i][j] = (matches, -total_error) for the first i expected / j actual
+        best = [[(0, 0)] * (m + 1) for _ in range(n + 1)]
+        for i in range(1, n + 1):
+            exp_time = expected_times[exp_order[i - 1]]
+            row, prev_row = best[i], best[i - 1]
+            for j in range(1, m + 1):
+                candidate = max(prev_row[j], row[j - 1])
+                error = abs(actual_times[act_order[j - 1]] - exp_time)
+                if error <= tolerance_ms:
+                    matches, neg_error = prev_row[j - 1]
+                    candidate = max(candidate, (matches + 1, neg_error - error))
+                row[j] = candidate
+
+        # Walk back through the table to recover the chosen pairs
+        pairs = []
+        i, j = n, m
+        while i > 0 and j > 0:
+            if best[i][j] == best[i - 1][j]:
+                i -= 1
+            elif best[i][j] == best[i][j - 1]:
+                j -= 1
+            else:
+                pairs.append((exp_order[i - 1], act_order[j - 1]))
+                i -= 1
+                j -= 1
+
+        pairs.sort()
+        return pairs
+
     @staticmethod
     def validate_rhythm(
         expected_grid: RhythmGrid,
@@ -317,11 +403,10 @@ class RhythmValidator:
         Returns:
             RhythmResult with detailed timing analysis
         """
-        expected_beats = expected_grid.beats
-
-        # Filter by drum part if specified
+        # Filter by drum part if specified (the grid's beats are normally in
+        # order already, so the expected side only needs an order check)
+        expected_beats = expected_grid.get_sorted_beats(drum_part_filter or None)
         if drum_part_filter:
-            expected_beats = [b for b in expected_beats if b.drum_part == drum_part_filter]
             actual_hits = [b for b in actual_hits if b.drum_part == drum_part_filter]
 
         total_expected = len(expected_beats)
@@ -333,28 +418,14 @@ class RhythmValidator:
         expected_times = [b.time_ms for b in expected_beats]
         actual_times = [b.time_ms for b in actual_hits]
 
-        used_actual_indices = set()
-
-        for exp_time in expected_times:
-            best_match_idx = None
-            best_match_error = float('inf')
-
-            for act_idx, act_time in enumerate(actual_times):
-                if act_idx in used_actual_indices:
-                    continue
-
-                error = abs(act_time - exp_time)
-                if error < best_match_error and error <= tolerance_ms:
-                    best_match_error = error
-                    best_match_idx = act_idx
-
-            if best_match_idx is not None:
-                matched_hits.append(best_match_idx)
-                used_actual_indices.add(best_match_idx)
+        for exp_idx, act_idx in RhythmValidator._match_hits(
+            expected_times, actual_times, tolerance_ms
+        ):
+            matched_hits.append(act_idx)
 
-                # Record timing error (positive = late, negative = early)
-                error_signed = actual_times[best_match_idx] - exp_time
-                timing_errors.append(error_signed)
+            # Record timing error (positive = late, negative = early)
+            error_signed = actual_times[act_idx] - expected_times[exp_idx]
+            timing_errors.append(error_signed)
 
         correct_hits = len(matched_hits)
         missed_hits = total_expected - correct_hits
@@ -77,7 +77,8 @@ class ExerciseValidator:
         Validate chord quality exercise.
 
         Checks if the user played the correct chord quality (intervals from root).
-        The starting note can be different (any transposition is valid).
+        The starting note can be different (any transposition is valid), and
+        upper chord tones may be voiced in any octave.
 
         Args:
             expected: Expected chord notes
@@ -106,12 +107,14 @@ class ExerciseValidator:
                 feedback=f"Expected {len(expected)} notes, got {len(actual)}"
             )
 
-        # Calculate intervals from root for both chords
-        expected_intervals = sorted([note.pitch - expected[0].pitch for note in expected])
-        actual_intervals = sorted([note.pitch - actual[0].pitch for note in actual])
+        # Pitch-class intervals from root for both chords (octave-agnostic)
+        expected_root = expected[0].pitch
+        actual_root = actual[0].pitch
+        expected_set = frozenset((note.pitch - expected_root) % 12 for note in expected)
+        actual_set = frozenset((note.pitch - actual_root) % 12 for note in actual)
 
         # Check if interval patterns match
-        correct = (expected_intervals == actual_intervals)
+        correct = (expected_set == actual_set)
 
         # Generate feedback
         if correct:
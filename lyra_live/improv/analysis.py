@@ -5,7 +5,9 @@ Analyzes jazz solos for harmonic awareness, guide-tone usage,
 and rhythmic characteristics.
 """
 
-from typing import List, Tuple, Dict
+import sys
+from functools import lru_cache
+from typing import List, Tuple, Dict, Optional, Iterable
 from lyra_live.improv.core import (
     ImprovNote,
     ImprovChorus,
@@ -42,6 +44,66 @@ CHORD_TONES = {
 TENSIONS = [2, 5, 9, 14, 17, 21]  # 9th, 11th, 13th and their octaves
 
 
+def _interval_mask(intervals: Iterable[int]) -> int:
+    """Pack intervals into a bitmask (bit i set = interval i present)."""
+    mask = 0
+    for interval in intervals:
+        mask |= 1 << interval
+    return mask
+
+
+# Bitmask views of the tables above: membership is a single shift-and-test
+CHORD_MASKS: Dict[str, int] = {q: _interval_mask(v) for q, v in CHORD_TONES.items()}
+_TENSION_MASK = _interval_mask(TENSIONS) | _interval_mask([1, 2, 5, 9])  # 9th, 11th variants
+
+# Note classifications and the functions compared in hot loops. Interned
+# so annotations produced here are shared objects and equality checks
+# short-circuit on identity.
+CHORD_TONE = sys.intern("chord_tone")
+TENSION = sys.intern("tension")
+OUTSIDE = sys.intern("outside")
+ROOT = sys.intern("root")
+THIRD = sys.intern("3rd")
+SEVENTH = sys.intern("7th")
+_GUIDE_TONE_FUNCTIONS = frozenset({THIRD, SEVENTH})
+
+# Function names by interval above the root (0-11)
+_CHORD_TONE_FUNCTIONS = {0: ROOT, 3: THIRD, 4: THIRD, 6: "5th", 7: "5th", 8: "5th", 10: SEVENTH, 11: SEVENTH}
+_TENSION_FUNCTIONS = {1: "9th", 2: "9th", 5: "11th", 9: "13th"}
+
+# Note name to pitch class, and accidental to semitone offset
+_NOTE_MAP = {'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11}
+_ACCIDENTALS = {'#': 1, 'b': -1}
+
+# Common (lowercased) quality suffixes resolved with a single lookup;
+# anything else falls back to _normalize_quality
+_QUALITY_ALIASES = {
+    '': 'maj',
+    'maj': 'maj',
+    'm': 'min',
+    'min': 'min',
+    '-': 'min',
+    'dim': 'dim',
+    'aug': 'aug',
+    'maj7': 'maj7',
+    'δ': 'maj7',
+    'm7': 'min7',
+    'min7': 'min7',
+    '-7': 'min7',
+    '7': '7',
+    'm7b5': 'm7b5',
+    'ø': 'm7b5',
+    'ø7': 'm7b5',
+    'dim7': 'dim7',
+    '°7': 'dim7',
+    'maj9': 'maj9',
+    'min9': 'min9',
+    '9': '9',
+    '13': '13',
+}
+
+
+@lru_cache(maxsize=512)
 def parse_chord_symbol(chord_symbol: str) -> Tuple[int, str]:
     """
     Parse a chord symbol into root note and quality.
@@ -53,48 +115,46 @@ def parse_chord_symbol(chord_symbol: str) -> Tuple[int, str]:
         Tuple of (root_pitch_class, quality)
         where root_pitch_class is 0-11 (C=0) and quality is the chord type
     """
-    # Note name mapping
-    note_map = {'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11}
-
     # Get root note
-    root_letter = chord_symbol[0].upper()
-    root = note_map.get(root_letter, 0)
+    root = _NOTE_MAP.get(chord_symbol[0].upper(), 0)
 
     # Check for sharp/flat
-    if len(chord_symbol) > 1:
-        if chord_symbol[1] == '#':
-            root = (root + 1) % 12
-            quality_start = 2
-        elif chord_symbol[1] == 'b':
-            root = (root - 1) % 12
-            quality_start = 2
-        else:
-            quality_start = 1
+    offset = _ACCIDENTALS.get(chord_symbol[1:2])
+    if offset is not None:
+        root = (root + offset) % 12
+        quality_start = 2
     else:
         quality_start = 1
 
-    # Extract quality
+    # Extract and normalize quality
     quality = chord_symbol[quality_start:].lower()
+    normalized = _QUALITY_ALIASES.get(quality)
+    if normalized is None:
+        normalized = _normalize_quality(quality)
 
-    # Normalize quality
-    if not quality or quality == '':
-        quality = 'maj'
-    elif 'maj7' in quality or 'M7' in quality or 'Δ' in quality:
-        quality = 'maj7'
+    return root, normalized
+
+
+def _normalize_quality(quality: str) -> str:
+    """Normalize an uncommon (lowercased) quality suffix by substring matching."""
+    if not quality:
+        return 'maj'
+    elif 'maj7' in quality or 'δ' in quality:  # Δ, lowercased
+        return 'maj7'
     elif 'm7b5' in quality or 'ø' in quality:
-        quality = 'm7b5'
+        return 'm7b5'
     elif 'dim7' in quality or '°7' in quality:
-        quality = 'dim7'
+        return 'dim7'
     elif 'm7' in quality or 'min7' in quality or '-7' in quality:
-        quality = 'min7'
+        return 'min7'
     elif quality == 'm' or quality == 'min' or quality == '-':
-        quality = 'min'
+        return 'min'
     elif '7' in quality:
-        quality = '7'
-
-    return root, quality
+        return '7'
+    return quality
 
 
+@lru_cache(maxsize=512)
 def get_chord_intervals(chord_symbol: str) -> List[int]:
     """
     Get the intervals (in semitones) for a chord symbol.
@@ -103,7 +163,8 @@ def get_chord_intervals(chord_symbol: str) -> List[int]:
         chord_symbol: E.g. "Cmaj7", "Dm7"
 
     Returns:
-        List of intervals from root (e.g. [0, 4, 7, 11] for maj7)
+        List of intervals from root (e.g. [0, 4, 7, 11] for maj7).
+        The list is shared with CHORD_TONES and must not be mutated.
     """
     _, quality = parse_chord_symbol(chord_symbol)
 
@@ -123,6 +184,43 @@ def get_chord_intervals(chord_symbol: str) -> List[int]:
     return CHORD_TONES['maj']
 
 
+def _classify_interval(interval: int, chord_mask: int) -> Tuple[str, str]:
+    """Classify an interval above the chord root (0-11) against a chord-tone bitmask."""
+    bit = 1 << interval
+
+    # Check if it's a chord tone
+    if chord_mask & bit:
+        return CHORD_TONE, _CHORD_TONE_FUNCTIONS.get(interval, CHORD_TONE)
+
+    # Check if it's a common tension
+    if _TENSION_MASK & bit:
+        return TENSION, _TENSION_FUNCTIONS.get(interval, TENSION)
+
+    # Otherwise it's outside
+    return OUTSIDE, "chromatic"
+
+
+@lru_cache(maxsize=512)
+def _build_classification_table(chord_symbol: str) -> Tuple[Tuple[str, str], ...]:
+    """
+    Precompute the classification of all 12 pitch classes against a chord.
+
+    Args:
+        chord_symbol: Chord to classify against (e.g. "Cmaj7")
+
+    Returns:
+        12-tuple indexed by note pitch class (C=0) of (classification, function)
+    """
+    root_pc, quality = parse_chord_symbol(chord_symbol)
+    chord_mask = CHORD_MASKS.get(quality)
+    if chord_mask is None:
+        chord_mask = _interval_mask(get_chord_intervals(chord_symbol))
+    return tuple(
+        _classify_interval((note_pc - root_pc) % 12, chord_mask)
+        for note_pc in range(12)
+    )
+
+
 def classify_note(note_pitch: int, chord_symbol: str) -> Tuple[str, str]:
     """
     Classify a note relative to the underlying chord.
@@ -136,46 +234,7 @@ def classify_note(note_pitch: int, chord_symbol: str) -> Tuple[str, str]:
         classification: "chord_tone", "tension", or "outside"
         function: "root", "3rd", "5th", "7th", "9th", etc.
     """
-    root_pc, quality = parse_chord_symbol(chord_symbol)
-    note_pc = note_pitch % 12
-
-    # Calculate interval from root
-    interval = (note_pc - root_pc) % 12
-
-    # Get chord intervals
-    chord_intervals = get_chord_intervals(chord_symbol)
-
-    # Check if it's a chord tone
-    if interval in chord_intervals:
-        # Determine function
-        if interval == 0:
-            function = "root"
-        elif interval in [3, 4]:
-            function = "3rd"
-        elif interval in [6, 7, 8]:
-            function = "5th"
-        elif interval in [10, 11]:
-            function = "7th"
-        else:
-            function = "chord_tone"
-
-        return "chord_tone", function
-
-    # Check if it's a common tension
-    if interval in TENSIONS or interval in [1, 2, 5, 9]:  # 9th, 11th variants
-        if interval in [1, 2]:
-            function = "9th"
-        elif interval == 5:
-            function = "11th"
-        elif interval == 9:
-            function = "13th"
-        else:
-            function = "tension"
-
-        return "tension", function
-
-    # Otherwise it's outside
-    return "outside", "chromatic"
+    return _build_classification_table(chord_symbol)[note_pitch % 12]
 
 
 def analyze_improvisation(chorus: ImprovChorus) -> ImprovAnalysisResult:
@@ -188,44 +247,24 @@ def analyze_improvisation(chorus: ImprovChorus) -> ImprovAnalysisResult:
     Returns:
         ImprovAnalysisResult with complete analysis
     """
-    tune = chorus.tune
-
-    # First pass: Annotate each note with harmonic context
-    for note in chorus.notes:
-        # Find the chord at this note's time
-        chord_symbol = tune.get_chord_at_time(note.bar, note.beat)
-        if chord_symbol:
-            note.chord_at_time = chord_symbol
-
-            # Classify the note
-            classification, function = classify_note(note.pitch, chord_symbol)
-            note.classification = classification
-            note.note_function = function
-
-    # Calculate harmonic stats
-    harmonic_stats = _calculate_harmonic_stats(chorus)
-
-    # Calculate rhythmic stats
-    rhythmic_stats = _calculate_rhythmic_stats(chorus)
-
-    # Find guide-tone hits
-    guide_tone_hits = find_guide_tones(chorus)
-
-    # Classify notes by type
-    chord_tone_notes = [n for n in chorus.notes if n.classification == "chord_tone"]
-    tension_notes = [n for n in chorus.notes if n.classification == "tension"]
-    outside_notes = [n for n in chorus.notes if n.classification == "outside"]
+    (
+        harmonic_stats,
+        rhythmic_stats,
+        chord_tone_notes,
+        tension_notes,
+        outside_notes
+    ) = _analyze_core(chorus)
 
     # Generate feedback
     feedback, strengths, suggestions, score = _generate_feedback(
         harmonic_stats,
         rhythmic_stats,
-        guide_tone_hits,
+        harmonic_stats.guide_tone_hits,
         len(chorus.notes)
     )
 
     return ImprovAnalysisResult(
-        tune_title=tune.title,
+        tune_title=chorus.tune.title,
         chorus_number=chorus.chorus_number,
         total_notes=len(chorus.notes),
         harmonic_stats=harmonic_stats,
@@ -240,19 +279,113 @@ def analyze_improvisation(chorus: ImprovChorus) -> ImprovAnalysisResult:
     )
 
 
-def _calculate_harmonic_stats(chorus: ImprovChorus) -> HarmonicStats:
-    """Calculate harmonic statistics for a chorus."""
-    total_notes = len(chorus.notes)
-    if total_notes == 0:
-        return HarmonicStats(0, 0, 0, 0, 0)
+def _analyze_core(
+    chorus: ImprovChorus
+) -> Tuple[HarmonicStats, RhythmicStats, List[ImprovNote], List[ImprovNote], List[ImprovNote]]:
+    """
+    Annotate a chorus and compute its statistics, without any feedback text.
+
+    Returns:
+        Tuple of (harmonic_stats, rhythmic_stats, chord_tone_notes,
+        tension_notes, outside_notes)
+    """
+    tune = chorus.tune
+    notes = chorus.notes
+
+    chord_tone_notes = []
+    tension_notes = []
+    outside_notes = []
+    root_count = 0
+    downbeat_count = 0
+    guide_tones_per_bar: Dict[int, int] = {}
+
+    # Phrases (gaps > 500ms are considered rests), tracked while notes stay
+    # in time order
+    phrases = []
+    phrase_length = 0
+    last_note_end = 0
+    last_time = None
+    in_order = True
+
+    # Chord at each note's time, found in one walk over the changes
+    chords = tune.get_chords_at_times([(note.bar, note.beat) for note in notes])
+
+    # Single pass: annotate each note with harmonic context and accumulate
+    # every per-note statistic. Each distinct chord is parsed once into a
+    # cached pitch-class table, so classifying a note is a single lookup.
+    for note, chord_symbol in zip(notes, chords):
+        if chord_symbol:
+            note.chord_at_time = chord_symbol
+
+            # Classify the note
+            table = _build_classification_table(chord_symbol)
+            note.classification, note.note_function = table[note.pitch % 12]
+
+        # Group by classification
+        classification = note.classification
+        if classification == CHORD_TONE:
+            chord_tone_notes.append(note)
+        elif classification == TENSION:
+            tension_notes.append(note)
+        elif classification == OUTSIDE:
+            outside_notes.append(note)
+
+        function = note.note_function
+        if function == ROOT:
+            root_count += 1
+        elif _is_strong_beat_guide_tone(note):
+            guide_tones_per_bar[note.bar] = guide_tones_per_bar.get(note.bar, 0) + 1
+
+        # Downbeat: within 0.1 beat of an integer beat (inlined, no abs() call)
+        offset = note.beat - round(note.beat)
+        if -0.1 < offset < 0.1:
+            downbeat_count += 1
+
+        # Phrase tracking
+        if in_order:
+            if last_time is not None and note.time_ms < last_time:
+                in_order = False
+            else:
+                if last_note_end > 0 and (note.time_ms - last_note_end) > 500 and phrase_length:
+                    phrases.append(phrase_length)
+                    phrase_length = 0
+                phrase_length += 1
+                last_note_end = note.time_ms + note.duration_ms
+                last_time = note.time_ms
+
+    if in_order:
+        if phrase_length:
+            phrases.append(phrase_length)
+    else:
+        # Rare out-of-order input: fall back to a sorted phrase pass
+        phrases = _phrase_lengths(sorted(notes, key=lambda n: n.time_ms))
+
+    guide_tone_hits = _sum_guide_tones(guide_tones_per_bar, tune)
+
+    harmonic_stats = _build_harmonic_stats(
+        len(chord_tone_notes),
+        len(tension_notes),
+        len(outside_notes),
+        root_count,
+        len(notes),
+        guide_tone_hits
+    )
+    rhythmic_stats = _build_rhythmic_stats(downbeat_count, len(notes), phrases)
+
+    return harmonic_stats, rhythmic_stats, chord_tone_notes, tension_notes, outside_notes
 
-    chord_tone_count = sum(1 for n in chorus.notes if n.classification == "chord_tone")
-    tension_count = sum(1 for n in chorus.notes if n.classification == "tension")
-    outside_count = sum(1 for n in chorus.notes if n.classification == "outside")
-    root_count = sum(1 for n in chorus.notes if n.note_function == "root")
 
-    # Find guide-tone hits
-    guide_tone_hits = find_guide_tones(chorus)
+def _build_harmonic_stats(
+    chord_tone_count: int,
+    tension_count: int,
+    outside_count: int,
+    root_count: int,
+    total_notes: int,
+    guide_tone_hits: int
+) -> HarmonicStats:
+    """Build harmonic statistics from pre-tallied note counts."""
+    if total_notes == 0:
+        return HarmonicStats(0, 0, 0, 0, 0)
 
     return HarmonicStats(
         chord_tone_ratio=(chord_tone_count / total_notes) * 100,
@@ -263,38 +396,48 @@ def _calculate_harmonic_stats(chorus: ImprovChorus) -> HarmonicStats:
     )
 
 
-def _calculate_rhythmic_stats(chorus: ImprovChorus) -> RhythmicStats:
-    """Calculate rhythmic statistics for a chorus."""
-    if not chorus.notes:
-        return RhythmicStats(0, 0, 0, 0, 0)
+def _is_strong_beat_guide_tone(note: ImprovNote) -> bool:
+    """Whether a note is a 3rd or 7th on beat 1 or 3 (±0.25 tolerance)."""
+    if note.note_function not in _GUIDE_TONE_FUNCTIONS:
+        return False
 
-    total_notes = len(chorus.notes)
+    beat = note.beat
+    return abs(beat - 1.0) < 0.25 or abs(beat - 3.0) < 0.25
 
-    # Count downbeat vs offbeat notes
-    downbeat_count = sum(
-        1 for n in chorus.notes
-        if abs(n.beat - round(n.beat)) < 0.1  # Within 0.1 beat of integer
-    )
-    offbeat_count = total_notes - downbeat_count
 
-    # Analyze phrase lengths (gaps > 500ms are considered rests)
+def _sum_guide_tones(guide_tones_per_bar: Dict[int, int], tune: StandardTune) -> int:
+    """Credit each chord change with the guide-tone hits in its bar."""
+    return sum(guide_tones_per_bar.get(change.bar, 0) for change in tune.chord_changes)
+
+
+def _phrase_lengths(notes: List[ImprovNote]) -> List[int]:
+    """Split time-ordered notes into phrases at gaps > 500ms; return note counts."""
     phrases = []
-    current_phrase = []
+    phrase_length = 0
     last_note_end = 0
 
-    for note in sorted(chorus.notes, key=lambda n: n.time_ms):
+    for note in notes:
         # Check if there's a gap since last note
-        if last_note_end > 0 and (note.time_ms - last_note_end) > 500:
-            if current_phrase:
-                phrases.append(len(current_phrase))
-                current_phrase = []
+        if last_note_end > 0 and (note.time_ms - last_note_end) > 500 and phrase_length:
+            phrases.append(phrase_length)
+            phrase_length = 0
 
-        current_phrase.append(note)
+        phrase_length += 1
         last_note_end = note.time_ms + note.duration_ms
 
     # Add last phrase
-    if current_phrase:
-        phrases.append(len(current_phrase))
+    if phrase_length:
+        phrases.append(phrase_length)
+
+    return phrases
+
+
+def _build_rhythmic_stats(downbeat_count: int, total_notes: int, phrases: List[int]) -> RhythmicStats:
+    """Build rhythmic statistics from pre-tallied counts and phrase lengths."""
+    if total_notes == 0:
+        return RhythmicStats(0, 0, 0, 0, 0)
+
+    offbeat_count = total_notes - downbeat_count
 
     avg_phrase = sum(phrases) / len(phrases) if phrases else 0
     longest_phrase = max(phrases) if phrases else 0
@@ -322,31 +465,14 @@ def find_guide_tones(chorus: ImprovChorus) -> int:
     Returns:
         Number of guide-tone hits
     """
-    tune = chorus.tune
-    guide_tone_count = 0
-
-    # Get all chord changes
-    for change in tune.chord_changes:
-        # Look for notes on this chord change
-        # (within ±0.5 beat of the change, on beats 1 or 3)
-        for note in chorus.notes:
-            if note.bar != change.bar:
-                continue
-
-            # Check if note is on beat 1 or 3 (±0.25 tolerance)
-            is_strong_beat = (
-                abs(note.beat - 1.0) < 0.25 or
-                abs(note.beat - 3.0) < 0.25
-            )
-
-            if not is_strong_beat:
-                continue
-
-            # Check if note is a guide tone (3rd or 7th)
-            if note.note_function in ["3rd", "7th"]:
-                guide_tone_count += 1
+    # Tally strong-beat guide tones per bar in one pass over the notes,
+    # rather than rescanning every note per change
+    guide_tones_per_bar: Dict[int, int] = {}
+    for note in chorus.notes:
+        if _is_strong_beat_guide_tone(note):
+            guide_tones_per_bar[note.bar] = guide_tones_per_bar.get(note.bar, 0) + 1
 
-    return guide_tone_count
+    return _sum_guide_tones(guide_tones_per_bar, chorus.tune)
 
 
 def _generate_feedback(
@@ -363,74 +489,104 @@ def _generate_feedback(
     """
     strengths = []
     suggestions = []
+    score = _score_solo(harmonic, rhythmic, guide_tones, total_notes, strengths, suggestions)
+
+    # Generate summary feedback
+    if score >= 80:
+        feedback = "Excellent improvisation! Your harmonic choices and phrasing show strong musicality."
+    elif score >= 65:
+        feedback = "Solid solo with good moments. Keep developing your harmonic vocabulary."
+    elif score >= 50:
+        feedback = "Good foundation. Focus on chord-tone targeting and rhythmic variety."
+    else:
+        feedback = "Keep practicing! Work on hitting chord tones and outlining the changes."
+
+    return feedback, strengths, suggestions, score
+
+
+def _score_solo(
+    harmonic: HarmonicStats,
+    rhythmic: RhythmicStats,
+    guide_tones: int,
+    total_notes: int,
+    strengths: Optional[List[str]] = None,
+    suggestions: Optional[List[str]] = None
+) -> float:
+    """
+    Score a solo from its statistics.
+
+    Strength and suggestion messages are only collected when lists are
+    passed in, so metric-only callers skip building them.
+
+    Returns:
+        Overall score clamped to 0-100
+    """
+    praise = strengths.append if strengths is not None else _ignore
+    suggest = suggestions.append if suggestions is not None else _ignore
     score = 50.0  # Start at 50/100
 
     # Harmonic assessment
     if harmonic.chord_tone_ratio > 70:
-        strengths.append("Strong harmonic awareness - excellent use of chord tones")
+        praise("Strong harmonic awareness - excellent use of chord tones")
         score += 15
     elif harmonic.chord_tone_ratio < 40:
-        suggestions.append("Try targeting more chord tones (1/3/5/7) to strengthen harmonic foundation")
+        suggest("Try targeting more chord tones (1/3/5/7) to strengthen harmonic foundation")
         score -= 10
 
     if harmonic.tension_ratio > 20:
-        strengths.append("Good use of tensions (9/11/13) for color")
+        praise("Good use of tensions (9/11/13) for color")
         score += 10
     elif harmonic.tension_ratio < 5:
-        suggestions.append("Experiment with more tensions (9ths, 11ths, 13ths) to add sophistication")
+        suggest("Experiment with more tensions (9ths, 11ths, 13ths) to add sophistication")
 
     if harmonic.outside_ratio > 30:
-        suggestions.append("High percentage of outside notes - consider resolving chromaticism more")
+        suggest("High percentage of outside notes - consider resolving chromaticism more")
         score -= 5
     elif 5 < harmonic.outside_ratio < 20:
-        strengths.append("Tasteful use of chromatic approaches")
+        praise("Tasteful use of chromatic approaches")
         score += 5
 
     # Guide tones
     if guide_tones > 4:
-        strengths.append(f"Excellent guide-tone targeting ({guide_tones} hits)")
+        if strengths is not None:
+            praise(f"Excellent guide-tone targeting ({guide_tones} hits)")
         score += 15
     elif guide_tones == 0:
-        suggestions.append("Focus on hitting 3rds and 7ths on strong beats at chord changes")
+        suggest("Focus on hitting 3rds and 7ths on strong beats at chord changes")
         score -= 5
 
     # Rhythmic assessment
     if 40 < rhythmic.downbeat_percentage < 70:
-        strengths.append("Good balance between downbeat and offbeat phrases")
+        praise("Good balance between downbeat and offbeat phrases")
         score += 10
     elif rhythmic.downbeat_percentage > 80:
-        suggestions.append("Try more syncopation and offbeat accents for rhythmic interest")
+        suggest("Try more syncopation and offbeat accents for rhythmic interest")
         score -= 5
 
     if rhythmic.average_phrase_length > 3:
-        strengths.append("Confident phrase lengths")
+        praise("Confident phrase lengths")
         score += 5
     elif rhythmic.average_phrase_length < 2:
-        suggestions.append("Try building longer phrases - connect your musical ideas")
+        suggest("Try building longer phrases - connect your musical ideas")
 
     if rhythmic.total_rests > 2:
-        strengths.append("Good use of space and phrasing")
+        praise("Good use of space and phrasing")
         score += 5
     elif rhythmic.total_rests == 0 and total_notes > 20:
-        suggestions.append("Leave more space - rests are musical too!")
-
-    # Generate summary feedback
-    if score >= 80:
-        feedback = "Excellent improvisation! Your harmonic choices and phrasing show strong musicality."
-    elif score >= 65:
-        feedback = "Solid solo with good moments. Keep developing your harmonic vocabulary."
-    elif score >= 50:
-        feedback = "Good foundation. Focus on chord-tone targeting and rhythmic variety."
-    else:
-        feedback = "Keep practicing! Work on hitting chord tones and outlining the changes."
+        suggest("Leave more space - rests are musical too!")
 
     # Clamp score to 0-100
-    score = max(0, min(100, score))
+    return max(0, min(100, score))
 
-    return feedback, strengths, suggestions, score
+
+def _ignore(message: str) -> None:
+    """Discard a feedback message (used when only the score is needed)."""
 
 
-def calculate_metrics(chorus: ImprovChorus) -> Dict[str, float]:
+def calculate_metrics(
+    chorus: ImprovChorus,
+    result: Optional[ImprovAnalysisResult] = None
+) -> Dict[str, float]:
     """
     Calculate raw metrics dictionary for a chorus.
 
@@ -438,18 +594,27 @@ def calculate_metrics(chorus: ImprovChorus) -> Dict[str, float]:
 
     Args:
         chorus: ImprovChorus to analyze
+        result: Existing analysis of this chorus, if already computed
+                (avoids re-running the full analysis)
 
     Returns:
         Dict of metric name to value
     """
-    result = analyze_improvisation(chorus)
+    if result is not None:
+        harmonic = result.harmonic_stats
+        rhythmic = result.rhythmic_stats
+        score = result.overall_score
+    else:
+        # Only the numbers are needed, so skip building feedback text
+        harmonic, rhythmic, _, _, _ = _analyze_core(chorus)
+        score = _score_solo(harmonic, rhythmic, harmonic.guide_tone_hits, len(chorus.notes))
 
     return {
-        'chord_tone_ratio': result.harmonic_stats.chord_tone_ratio,
-        'tension_ratio': result.harmonic_stats.tension_ratio,
-        'outside_ratio': result.harmonic_stats.outside_ratio,
-        'guide_tone_hits': result.harmonic_stats.guide_tone_hits,
-        'downbeat_percentage': result.rhythmic_stats.downbeat_percentage,
-        'average_phrase_length': result.rhythmic_stats.average_phrase_length,
-        'overall_score': result.overall_score
+        'chord_tone_ratio': harmonic.chord_tone_ratio,
+        'tension_ratio': harmonic.tension_ratio,
+        'outside_ratio': harmonic.outside_ratio,
+        'guide_tone_hits': harmonic.guide_tone_hits,
+        'downbeat_percentage': rhythmic.downbeat_percentage,
+        'average_phrase_length': rhythmic.average_phrase_length,
+        'overall_score': score
     }
@@ -5,12 +5,25 @@ Provides simple audio recording from microphone for a specified duration.
 Works with the existing voice/pitch detection infrastructure.
 """
 
+import struct
 import wave
 import tempfile
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 import time
 
+# Size of the PCM blocks SimulatedAudioCapture hands to on_chunk
+_WRITE_BLOCK_BYTES = 64 * 1024
+
+# Audio held between PortAudio's callback and the thread writing the WAV
+# file; the writer drains it ten times a second
+_RING_SECONDS = 5.0
+
+
+def print_progress(seconds_remaining: float):
+    """Console progress line for AudioCapture.record(progress_cb=...)."""
+    print(f"   Recording... {seconds_remaining:.1f}s remaining", end='\r')
+
 
 class AudioCapture:
     """
@@ -20,16 +33,28 @@ class AudioCapture:
     and saves to a temporary WAV file.
     """
 
-    def __init__(self, sample_rate: int = 44100, channels: int = 1):
+    def __init__(self, sample_rate: int = 44100, channels: int = 1,
+                 max_duration_seconds: Optional[float] = 600.0):
         """
         Initialize audio capture.
 
         Args:
             sample_rate: Audio sample rate in Hz (default: 44100)
             channels: Number of audio channels (default: 1 for mono)
+            max_duration_seconds: Longest recording accepted, as a guard against
+                miscomputed durations (default: 10 minutes; None for no limit)
         """
         self.sample_rate = sample_rate
         self.channels = channels
+        self.max_duration_seconds = max_duration_seconds
+
+    def _check_duration(self, duration_seconds: float):
+        """Reject recording lengths above the configured cap."""
+        if self.max_duration_seconds is not None and duration_seconds > self.max_duration_seconds:
+            raise ValueError(
+                f"Requested recording of {duration_seconds:.1f}s exceeds the "
+                f"{self.max_duration_seconds:.1f}s limit"
+            )
 
     def calculate_duration(self, tune_tempo: int, time_signature: Tuple[int, int],
                           chorus_bars: int, chorus_count: int) -> float:
@@ -59,21 +84,34 @@ class AudioCapture:
         # Add a small buffer (0.5 seconds) to ensure we capture everything
         return duration_seconds + 0.5
 
-    def record(self, duration_seconds: float, output_path: Optional[Path] = None) -> Path:
+    def record(self, duration_seconds: float, output_path: Optional[Path] = None,
+               on_chunk: Optional[Callable[[bytes], None]] = None,
+               progress_cb: Optional[Callable[[float], None]] = None) -> Path:
         """
         Record audio from the microphone for a specified duration.
 
         Args:
             duration_seconds: How long to record in seconds
             output_path: Optional path to save the WAV file. If None, uses a temp file.
+            on_chunk: Optional callable receiving each chunk of PCM bytes as it
+                is captured, e.g. to analyze audio while recording continues.
+                Called from this thread as the WAV file is written, about ten
+                times a second, never from the audio thread.
+            progress_cb: Optional callable receiving the seconds left to record,
+                about once a second (e.g. print_progress). Not called from the
+                audio thread.
 
         Returns:
             Path to the recorded WAV file
 
         Raises:
             ImportError: If pyaudio is not installed
-            OSError: If no microphone is available
+            OSError: If no microphone is available, or the file writes fell
+                too far behind the audio
+            ValueError: If duration_seconds exceeds max_duration_seconds
         """
+        self._check_duration(duration_seconds)
+
         try:
             import pyaudio
         except ImportError:
@@ -96,47 +134,88 @@ class AudioCapture:
         format = pyaudio.paInt16  # 16-bit audio
         chunk_size = 1024  # Frames per buffer
 
-        try:
-            # Open audio stream
-            stream = p.open(
-                format=format,
-                channels=self.channels,
-                rate=self.sample_rate,
-                input=True,
-                frames_per_buffer=chunk_size
-            )
-
-            print(f"🎤 Recording for {duration_seconds:.1f} seconds...")
+        # PortAudio's callback only copies each chunk into a small ring
+        # buffer, so the audio thread never blocks on the disk or on
+        # on_chunk. This thread drains the ring into the WAV file as the
+        # recording goes, so memory stays bounded whatever the duration.
+        frame_bytes = self.channels * p.get_sample_size(format)
+        bytes_per_second = self.sample_rate * frame_bytes
+        total_bytes = int(self.sample_rate * duration_seconds) * frame_bytes
+        ring_bytes = int(self.sample_rate * _RING_SECONDS) * frame_bytes
+        ring = memoryview(bytearray(ring_bytes))
+        captured = 0  # Bytes copied into the ring by the audio thread
+        written = 0  # Bytes drained from the ring by this thread
+        overrun = False
+
+        def on_audio(in_data, frame_count, time_info, status):
+            nonlocal captured, overrun
+            n = min(len(in_data), total_bytes - captured)
+            if captured + n - written > ring_bytes:
+                # The writer fell a whole ring behind; stop rather than
+                # overwrite audio that hasn't been saved yet
+                overrun = True
+                return (None, pyaudio.paAbort)
+            start = captured % ring_bytes
+            first = min(n, ring_bytes - start)
+            ring[start:start + first] = in_data[:first]
+            ring[:n - first] = in_data[first:n]
+            captured += n
+            flag = pyaudio.paComplete if captured >= total_bytes else pyaudio.paContinue
+            return (None, flag)
+
+        def drain(wf):
+            nonlocal written
+            end = captured
+            while written < end:
+                start = written % ring_bytes
+                data = ring[start:start + min(end - written, ring_bytes - start)]
+                wf.writeframes(data)
+                if on_chunk is not None:
+                    on_chunk(bytes(data))
+                written += len(data)
 
-            frames = []
-            num_chunks = int(self.sample_rate / chunk_size * duration_seconds)
-
-            start_time = time.time()
-
-            # Record audio
-            for i in range(num_chunks):
-                data = stream.read(chunk_size)
-                frames.append(data)
-
-                # Show progress
-                elapsed = time.time() - start_time
-                if int(elapsed) != int(elapsed - 0.5):  # Print once per second
-                    remaining = duration_seconds - elapsed
-                    if remaining > 0:
-                        print(f"   Recording... {remaining:.1f}s remaining", end='\r')
-
-            print(f"\n✓ Recording complete")
-
-            # Stop and close stream
-            stream.stop_stream()
-            stream.close()
-
-            # Write to WAV file
-            with wave.open(str(output_path), 'wb') as wf:
+        try:
+            with open(output_path, 'wb') as f, wave.open(f, 'wb') as wf:
                 wf.setnchannels(self.channels)
                 wf.setsampwidth(p.get_sample_size(format))
                 wf.setframerate(self.sample_rate)
-                wf.writeframes(b''.join(frames))
+
+                print(f"🎤 Recording for {duration_seconds:.1f} seconds...")
+
+                # Open audio stream (starts capturing immediately)
+                stream = p.open(
+                    format=format,
+                    channels=self.channels,
+                    rate=self.sample_rate,
+                    input=True,
+                    frames_per_buffer=chunk_size,
+                    stream_callback=on_audio
+                )
+
+                # Wait for the requested duration to be captured. The audio
+                # thread only copies into the ring and counts the bytes;
+                # the file writes, on_chunk and progress (once a second)
+                # all happen on this thread
+                polls = 0
+                while stream.is_active():
+                    time.sleep(0.1)
+                    drain(wf)
+                    polls += 1
+                    if progress_cb is not None and captured < total_bytes and polls % 10 == 0:
+                        progress_cb((total_bytes - captured) / bytes_per_second)
+
+                # Stop and close stream, then save what is still buffered
+                stream.stop_stream()
+                stream.close()
+                drain(wf)
+
+            if overrun:
+                raise OSError(
+                    f"Recording stopped after {written / bytes_per_second:.1f}s: "
+                    "audio was not saved fast enough"
+                )
+
+            print(f"\n✓ Recording complete")
 
         finally:
             p.terminate()
@@ -145,7 +224,8 @@ class AudioCapture:
 
     def record_for_tune(self, tune_tempo: int, time_signature: Tuple[int, int],
                        chorus_bars: int, chorus_count: int,
-                       output_path: Optional[Path] = None) -> Path:
+                       output_path: Optional[Path] = None,
+                       progress_cb: Optional[Callable[[float], None]] = None) -> Path:
         """
         Record audio for a specific number of choruses of a tune.
 
@@ -157,6 +237,7 @@ class AudioCapture:
             chorus_bars: Number of bars per chorus
             chorus_count: Number of choruses to record
             output_path: Optional output path
+            progress_cb: Optional progress callable, see record()
 
         Returns:
             Path to the recorded WAV file
@@ -165,7 +246,7 @@ class AudioCapture:
             tune_tempo, time_signature, chorus_bars, chorus_count
         )
 
-        return self.record(duration, output_path)
+        return self.record(duration, output_path, progress_cb=progress_cb)
 
 
 class SimulatedAudioCapture(AudioCapture):
@@ -175,8 +256,9 @@ class SimulatedAudioCapture(AudioCapture):
     Generates silent audio or accepts pre-generated audio buffers.
     """
 
-    def __init__(self, sample_rate: int = 44100, channels: int = 1):
-        super().__init__(sample_rate, channels)
+    def __init__(self, sample_rate: int = 44100, channels: int = 1,
+                 max_duration_seconds: Optional[float] = 600.0):
+        super().__init__(sample_rate, channels, max_duration_seconds)
         self.simulated_audio_path: Optional[Path] = None
 
     def set_simulated_audio(self, audio_path: Path):
@@ -188,18 +270,35 @@ class SimulatedAudioCapture(AudioCapture):
         """
         self.simulated_audio_path = audio_path
 
-    def record(self, duration_seconds: float, output_path: Optional[Path] = None) -> Path:
+    def record(self, duration_seconds: float, output_path: Optional[Path] = None,
+               on_chunk: Optional[Callable[[bytes], None]] = None,
+               progress_cb: Optional[Callable[[float], None]] = None) -> Path:
         """
         Simulate recording by either copying a pre-set audio file or generating silence.
 
         Args:
             duration_seconds: Duration (used for generating silence if no audio set)
             output_path: Optional output path
+            on_chunk: Optional callable receiving the simulated PCM in blocks
+            progress_cb: Accepted for compatibility; simulated recording is instant
 
         Returns:
             Path to the audio file
+
+        Raises:
+            ValueError: If duration_seconds exceeds max_duration_seconds
         """
+        self._check_duration(duration_seconds)
+
         if self.simulated_audio_path and self.simulated_audio_path.exists():
+            if on_chunk is not None:
+                with wave.open(str(self.simulated_audio_path), 'rb') as wf:
+                    frames_per_block = _WRITE_BLOCK_BYTES // (wf.getnchannels() * wf.getsampwidth())
+                    data = wf.readframes(frames_per_block)
+                    while data:
+                        on_chunk(data)
+                        data = wf.readframes(frames_per_block)
+
             # Use pre-set audio file
             if output_path is None:
                 return self.simulated_audio_path
@@ -219,12 +318,45 @@ class SimulatedAudioCapture(AudioCapture):
 
             # Create silent WAV file
             num_samples = int(self.sample_rate * duration_seconds)
-
-            with wave.open(str(output_path), 'wb') as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(2)  # 16-bit
-                wf.setframerate(self.sample_rate)
-                # Write silence
-                wf.writeframes(b'\x00\x00' * num_samples * self.channels)
+            _write_silent_wav(output_path, self.sample_rate, self.channels, num_samples)
+
+            if on_chunk is not None:
+                frame_bytes = self.channels * 2  # 16-bit
+                remaining = num_samples * frame_bytes
+                block_bytes = (_WRITE_BLOCK_BYTES // frame_bytes) * frame_bytes
+                silence = bytes(min(remaining, block_bytes))
+                while remaining > 0:
+                    block = silence[:remaining]
+                    on_chunk(block)
+                    remaining -= len(block)
 
             return output_path
+
+
+def _write_silent_wav(path: Path, sample_rate: int, channels: int, num_samples: int):
+    """
+    Write a 16-bit PCM WAV file of silence.
+
+    The payload is known up front, so the 44-byte header is packed once
+    and the zero samples are produced by extending the file, without
+    building them in memory.
+
+    Args:
+        path: Output file path
+        sample_rate: Sample rate in Hz
+        channels: Number of channels
+        num_samples: Number of frames (samples per channel)
+    """
+    block_align = channels * 2  # 16-bit
+    data_bytes = num_samples * block_align
+
+    header = struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_bytes, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, sample_rate * block_align, block_align, 16,
+        b'data', data_bytes
+    )
+
+    with open(path, 'wb') as f:
+        f.write(header)
+        f.truncate(len(header) + data_bytes)
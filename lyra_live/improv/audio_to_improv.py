@@ -5,13 +5,52 @@ Takes pitch-over-time data from audio recordings and groups stable
 segments into note events suitable for harmonic/rhythmic analysis.
 """
 
-from typing import List, Tuple
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from itertools import groupby
+from operator import itemgetter
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Sequence, Tuple
 from lyra_live.voice.pitch import PitchReading
+from lyra_live.improv.audio_capture import AudioCapture
 from lyra_live.improv.core import ImprovNote, ImprovChorus
 from lyra_live.standards.core import StandardTune
 import math
 
 
+class _NoteAcc:
+    """Running totals for one in-flight note while grouping pitch readings."""
+
+    __slots__ = ('pitch', 'start_time_ms', 'end_time_ms',
+                 'cents_sum', 'cents_n', 'confidence_sum', 'confidence_n')
+
+    def __init__(self, pitch: int, start_time_ms: int):
+        self.pitch = pitch
+        self.start_time_ms = start_time_ms
+        self.end_time_ms = start_time_ms
+        self.cents_sum = 0.0
+        self.cents_n = 0
+        self.confidence_sum = 0.0
+        self.confidence_n = 0
+
+    def add(self, timestamp_ms: int, cents: Optional[float], confidence: float):
+        self.end_time_ms = timestamp_ms
+        if cents is not None:
+            self.cents_sum += cents
+            self.cents_n += 1
+        self.confidence_sum += confidence
+        self.confidence_n += 1
+
+    def to_dict(self, duration_ms: int) -> dict:
+        return {
+            'pitch': self.pitch,
+            'start_time_ms': self.start_time_ms,
+            'duration_ms': duration_ms,
+            'cents_offset': self.cents_sum / self.cents_n if self.cents_n else 0.0,
+            'confidence': self.confidence_sum / self.confidence_n,
+        }
+
+
 def group_pitch_readings_into_notes(
     readings: List[PitchReading],
     min_duration_ms: int = 100,
@@ -36,89 +75,82 @@ def group_pitch_readings_into_notes(
             - cents_offset: Average cents deviation from tempered pitch
             - confidence: Average confidence
     """
-    if not readings:
-        return []
+    hops = (
+        (reading.pitch, reading.timestamp_ms, reading.cents_from_pitch, reading.confidence)
+        for reading in readings
+    )
+    return _group_hops_into_notes(hops, min_duration_ms)
+
+
+def group_pitch_track_into_notes(
+    midi_pitches: Sequence[float],
+    confidences: Sequence[float],
+    timestamps_ms: Sequence[int],
+    min_duration_ms: int = 100,
+    min_confidence: float = 0.6
+) -> List[dict]:
+    """
+    Group a raw pitch track into note events without building PitchReadings.
+
+    Takes the per-hop output of the pitch detector as parallel sequences
+    (lists or numpy arrays) and gives the same result as creating a
+    PitchReading per hop and calling group_pitch_readings_into_notes().
+    Cents are taken directly from the fractional MIDI value, so no
+    frequency round trip or logarithm is needed per hop.
+
+    Args:
+        midi_pitches: Fractional MIDI pitch per hop (<= 0 when unpitched)
+        confidences: Detection confidence per hop (0.0 to 1.0)
+        timestamps_ms: Time of each hop in milliseconds
+        min_duration_ms: Minimum note duration to keep (milliseconds)
+        min_confidence: Minimum confidence for a hop to count as pitched
+
+    Returns:
+        List of note dicts, as returned by group_pitch_readings_into_notes()
+    """
+    def hops():
+        for midi_pitch, confidence, timestamp_ms in zip(midi_pitches, confidences, timestamps_ms):
+            if midi_pitch > 0 and confidence >= min_confidence:
+                pitch = int(round(midi_pitch))
+                yield pitch, timestamp_ms, 100.0 * (midi_pitch - pitch), confidence
+            else:
+                yield None, timestamp_ms, None, confidence
+
+    return _group_hops_into_notes(hops(), min_duration_ms)
+
+
+def _group_hops_into_notes(
+    hops: Iterable[Tuple[Optional[int], int, Optional[float], float]],
+    min_duration_ms: int
+) -> List[dict]:
+    """
+    Shared grouping step of the two functions above.
+
+    Args:
+        hops: (MIDI pitch or None, timestamp_ms, cents or None, confidence)
+            per detector hop, in time order
+        min_duration_ms: Minimum note duration to keep (milliseconds)
 
+    Returns:
+        List of note dicts, as returned by group_pitch_readings_into_notes()
+    """
     notes = []
-    current_note = None
-
-    for reading in readings:
-        # Skip invalid/silent readings
-        if reading.pitch is None:
-            # End current note if exists
-            if current_note is not None:
-                # Only add if long enough
-                duration = current_note['end_time_ms'] - current_note['start_time_ms']
-                if duration >= min_duration_ms:
-                    current_note['duration_ms'] = duration
-                    # Calculate averages
-                    current_note['cents_offset'] = (
-                        sum(current_note['cents_samples']) / len(current_note['cents_samples'])
-                    )
-                    current_note['confidence'] = (
-                        sum(current_note['confidence_samples']) / len(current_note['confidence_samples'])
-                    )
-                    # Remove temporary fields
-                    del current_note['cents_samples']
-                    del current_note['confidence_samples']
-                    del current_note['end_time_ms']
-                    notes.append(current_note)
-
-                current_note = None
+
+    # Run-length encode on MIDI pitch: each run of identical pitches is one
+    # candidate note, and runs of None (silence) separate notes
+    for pitch, run in groupby(hops, key=itemgetter(0)):
+        if pitch is None:
             continue
 
-        # Check if this continues the current note
-        if current_note is not None:
-            # Check if pitch is similar
-            if reading.pitch == current_note['pitch']:
-                # Same MIDI note - extend current note
-                current_note['end_time_ms'] = reading.timestamp_ms
-                if reading.cents_from_pitch is not None:
-                    current_note['cents_samples'].append(reading.cents_from_pitch)
-                current_note['confidence_samples'].append(reading.confidence)
-                continue
-            else:
-                # Different pitch - finish current note and start new one
-                duration = current_note['end_time_ms'] - current_note['start_time_ms']
-                if duration >= min_duration_ms:
-                    current_note['duration_ms'] = duration
-                    current_note['cents_offset'] = (
-                        sum(current_note['cents_samples']) / len(current_note['cents_samples'])
-                        if current_note['cents_samples'] else 0.0
-                    )
-                    current_note['confidence'] = (
-                        sum(current_note['confidence_samples']) / len(current_note['confidence_samples'])
-                    )
-                    del current_note['cents_samples']
-                    del current_note['confidence_samples']
-                    del current_note['end_time_ms']
-                    notes.append(current_note)
-
-        # Start new note
-        current_note = {
-            'pitch': reading.pitch,
-            'start_time_ms': reading.timestamp_ms,
-            'end_time_ms': reading.timestamp_ms,
-            'cents_samples': [reading.cents_from_pitch] if reading.cents_from_pitch is not None else [],
-            'confidence_samples': [reading.confidence],
-        }
+        _, start_time_ms, cents, confidence = next(run)
+        acc = _NoteAcc(pitch, start_time_ms)
+        acc.add(start_time_ms, cents, confidence)
+        for _, timestamp_ms, cents, confidence in run:
+            acc.add(timestamp_ms, cents, confidence)
 
-    # Don't forget the last note
-    if current_note is not None:
-        duration = current_note['end_time_ms'] - current_note['start_time_ms']
+        duration = acc.end_time_ms - acc.start_time_ms
         if duration >= min_duration_ms:
-            current_note['duration_ms'] = duration
-            current_note['cents_offset'] = (
-                sum(current_note['cents_samples']) / len(current_note['cents_samples'])
-                if current_note['cents_samples'] else 0.0
-            )
-            current_note['confidence'] = (
-                sum(current_note['confidence_samples']) / len(current_note['confidence_samples'])
-            )
-            del current_note['cents_samples']
-            del current_note['confidence_samples']
-            del current_note['end_time_ms']
-            notes.append(current_note)
+            notes.append(acc.to_dict(duration))
 
     return notes
 
@@ -181,20 +213,61 @@ def pitch_readings_to_improv_notes(
     # Group readings into notes
     note_dicts = group_pitch_readings_into_notes(readings, min_duration_ms)
 
-    # Convert to ImprovNote objects
-    improv_notes = []
+    return _note_dicts_to_improv_notes(note_dicts, tune)
+
+
+def pitch_track_to_improv_notes(
+    midi_pitches: Sequence[float],
+    confidences: Sequence[float],
+    timestamps_ms: Sequence[int],
+    tune: StandardTune,
+    min_duration_ms: int = 100,
+    min_confidence: float = 0.6
+) -> List[ImprovNote]:
+    """
+    Convert a raw pitch track to ImprovNote objects.
+
+    Array-based counterpart of pitch_readings_to_improv_notes() for
+    callers holding the detector output as parallel sequences.
+
+    Args:
+        midi_pitches: Fractional MIDI pitch per hop (<= 0 when unpitched)
+        confidences: Detection confidence per hop (0.0 to 1.0)
+        timestamps_ms: Time of each hop in milliseconds
+        tune: StandardTune to provide tempo, time signature, and chord context
+        min_duration_ms: Minimum note duration to keep
+        min_confidence: Minimum confidence for a hop to count as pitched
+
+    Returns:
+        List of ImprovNote objects ready for analysis
+    """
+    note_dicts = group_pitch_track_into_notes(
+        midi_pitches, confidences, timestamps_ms, min_duration_ms, min_confidence
+    )
+
+    return _note_dicts_to_improv_notes(note_dicts, tune)
+
 
+def _note_dicts_to_improv_notes(note_dicts: List[dict], tune: StandardTune) -> List[ImprovNote]:
+    """Place grouped notes in the tune's form and wrap them as ImprovNotes."""
+    # Tempo and meter are fixed for the tune, so hoist them out of the loop
+    # (same arithmetic as calculate_bar_and_beat)
+    beats_per_second = tune.tempo / 60.0
+    beats_per_bar = tune.time_signature[0]
+
+    # Calculate bar (0-indexed) and beat (1-indexed) for every note
+    positions = []
     for note_dict in note_dicts:
-        # Calculate bar and beat
-        bar, beat = calculate_bar_and_beat(
-            note_dict['start_time_ms'],
-            tune.tempo,
-            tune.time_signature
-        )
+        beats_elapsed = (note_dict['start_time_ms'] / 1000.0) * beats_per_second
+        positions.append((int(beats_elapsed / beats_per_bar), (beats_elapsed % beats_per_bar) + 1.0))
+
+    # Look up all chords in one walk over the changes (notes are in time order)
+    chords = tune.get_chords_at_times(positions)
 
-        # Get chord at this position
-        chord_at_time = tune.get_chord_at_time(bar, beat)
+    # Convert to ImprovNote objects
+    improv_notes = []
 
+    for note_dict, (bar, beat), chord_at_time in zip(note_dicts, positions, chords):
         # Create ImprovNote
         improv_note = ImprovNote(
             time_ms=note_dict['start_time_ms'],
@@ -251,6 +324,78 @@ def audio_to_improv_chorus(
     pitch_readings = detect_pitch_over_time(audio_path)
     print(f"   Detected {len(pitch_readings)} pitch readings")
 
+    return _readings_to_chorus(pitch_readings, tune, chorus_number, min_note_duration_ms)
+
+
+def record_to_improv_chorus(
+    capture: AudioCapture,
+    tune: StandardTune,
+    duration_seconds: float,
+    output_path: Optional[Path] = None,
+    chorus_number: int = 1,
+    min_note_duration_ms: int = 100,
+    progress_cb: Optional[Callable[[float], None]] = None
+) -> ImprovChorus:
+    """
+    Record a solo and detect its pitches while recording is still going on.
+
+    The capture hands each chunk of audio to a worker thread running
+    incremental pitch detection, so by the time recording stops most of
+    the analysis is already done. The WAV file is still written as usual.
+
+    Args:
+        capture: AudioCapture (or SimulatedAudioCapture) to record with
+        tune: StandardTune for tempo/time sig/chord context
+        duration_seconds: How long to record in seconds
+        output_path: Optional path to save the WAV file
+        chorus_number: Which chorus this is (default: 1)
+        min_note_duration_ms: Minimum note duration to keep
+        progress_cb: Optional callable passed on to capture.record()
+
+    Returns:
+        ImprovChorus ready for harmonic/rhythmic analysis
+
+    Raises:
+        ImportError: If aubio is not installed
+        ValueError: If the capture is not mono
+    """
+    from lyra_live.voice.pitch import PitchTracker
+
+    if capture.channels != 1:
+        raise ValueError("Audio capture must be mono (1 channel)")
+
+    tracker = PitchTracker(sample_rate=capture.sample_rate)
+    chunks: "queue.Queue[Optional[bytes]]" = queue.Queue()
+
+    def analyze() -> List[PitchReading]:
+        while True:
+            pcm = chunks.get()
+            if pcm is None:
+                return tracker.readings
+            tracker.feed(pcm)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending_readings = pool.submit(analyze)
+        try:
+            audio_path = capture.record(duration_seconds, output_path,
+                                        on_chunk=chunks.put, progress_cb=progress_cb)
+        finally:
+            chunks.put(None)
+        pitch_readings = pending_readings.result()
+
+    print(f"\n✓ Recording saved to: {audio_path}\n")
+    print(f"   Detected {len(pitch_readings)} pitch readings")
+
+    return _readings_to_chorus(pitch_readings, tune, chorus_number, min_note_duration_ms)
+
+
+def _readings_to_chorus(
+    pitch_readings: List[PitchReading],
+    tune: StandardTune,
+    chorus_number: int,
+    min_note_duration_ms: int
+) -> ImprovChorus:
+    """Steps 2-4 of the audio pipeline: group readings and wrap in a chorus."""
     # Step 2 & 3: Convert to ImprovNotes
     improv_notes = pitch_readings_to_improv_notes(
         pitch_readings,
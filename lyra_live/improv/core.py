@@ -7,6 +7,7 @@ Represents improvised notes, choruses, and analysis results.
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional
 from lyra_live.standards.core import StandardTune, ChordChange
+from lyra_live.ear_training.base import CHROMATIC_NOTES
 
 
 @dataclass
@@ -30,11 +31,17 @@ class ImprovNote:
     note_function: Optional[str] = None  # "root", "3rd", "5th", "7th", "9th", etc.
     classification: Optional[str] = None  # "chord_tone", "tension", "outside"
 
-    def __post_init__(self):
-        """Calculate note name for display."""
-        note_names = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        self.note_name = note_names[self.pitch % 12]
-        self.octave = (self.pitch // 12) - 1
+    # Display name and octave are derived on access rather than stored, so
+    # each note only carries its fields
+    @property
+    def note_name(self) -> str:
+        """Note name for display (e.g. "C#")."""
+        return CHROMATIC_NOTES[self.pitch % 12]
+
+    @property
+    def octave(self) -> int:
+        """Octave number (MIDI 60 = C4)."""
+        return (self.pitch // 12) - 1
 
 
 @dataclass
@@ -72,6 +79,9 @@ class ImprovChorus:
 @dataclass
 class RhythmicStats:
     """Rhythmic characteristics of a solo."""
+    __slots__ = ('downbeat_percentage', 'offbeat_percentage', 'average_phrase_length',
+                 'longest_phrase', 'total_rests')
+
     downbeat_percentage: float  # % of notes on downbeats
     offbeat_percentage: float  # % of notes on offbeats
     average_phrase_length: float  # Average notes before rest
@@ -82,6 +92,9 @@ class RhythmicStats:
 @dataclass
 class HarmonicStats:
     """Harmonic characteristics of a solo."""
+    __slots__ = ('chord_tone_ratio', 'tension_ratio', 'outside_ratio',
+                 'guide_tone_hits', 'root_usage')
+
     chord_tone_ratio: float  # % notes that are 1/3/5/7
     tension_ratio: float  # % notes that are 9/11/13
     outside_ratio: float  # % notes outside the chord
@@ -5,11 +5,40 @@ Generates synthetic solos for testing without requiring real-time playback.
 """
 
 import random
-from typing import List
+from functools import lru_cache
+from operator import attrgetter
+from typing import Callable, List, Tuple
 from lyra_live.improv.core import ImprovNote, ImprovChorus
 from lyra_live.standards.core import StandardTune, ChordChange
 from lyra_live.improv.analysis import parse_chord_symbol, get_chord_intervals
 
+# Common tensions: 9th (2 semitones), 11th (5), 13th (9)
+_TENSION_INTERVALS = (2, 5, 9)
+
+
+@lru_cache(maxsize=None)
+def _chord_tone_classes(chord_symbol: str) -> Tuple[int, ...]:
+    """Pitch classes of a chord's tones, in get_chord_intervals() order."""
+    root_pc, _ = parse_chord_symbol(chord_symbol)
+    return tuple((root_pc + interval) % 12 for interval in get_chord_intervals(chord_symbol))
+
+
+@lru_cache(maxsize=None)
+def _tension_classes(chord_symbol: str) -> Tuple[int, ...]:
+    """Pitch classes of a chord's 9th, 11th and 13th."""
+    root_pc, _ = parse_chord_symbol(chord_symbol)
+    return tuple((root_pc + interval) % 12 for interval in _TENSION_INTERVALS)
+
+
+@lru_cache(maxsize=None)
+def _guide_tone_classes(chord_symbol: str) -> Tuple[int, int]:
+    """Pitch classes of the (3rd, 7th) targeted by the guide-tone solo."""
+    root_pc, _ = parse_chord_symbol(chord_symbol)
+    symbol = chord_symbol.lower()
+    third = 4 if 'maj' in symbol else 3  # Major or minor 3rd
+    seventh = 11 if 'maj7' in symbol else 10  # Major or dom 7th
+    return (root_pc + third) % 12, (root_pc + seventh) % 12
+
 
 class TestImprovGenerator:
     """
@@ -24,9 +53,10 @@ class TestImprovGenerator:
         Initialize test generator.
 
         Args:
-            seed: Random seed for reproducibility
+            seed: Random seed for reproducibility. Each generator draws from
+                its own random.Random, leaving the global random state alone.
         """
-        random.seed(seed)
+        self._rng = random.Random(seed)
 
     def generate_simple_blues_solo(
         self,
@@ -81,35 +111,33 @@ class TestImprovGenerator:
         current_time_ms = 0
         beat_duration_ms = (60000 // tune.tempo)  # Duration of one beat
 
+        # One chord per bar, so look each bar up once
+        chord_at_bar = [tune.get_chord_at_time(bar, 1.0) for bar in range(12)]
+
+        bar_duration_ms = beat_duration_ms * 4
+        pick_pitch = self._pitch_picker(style)
+        randint = self._rng.randint
+        add_note = chorus.notes.append
+
         for _ in range(note_count):
             # Calculate position
-            bar = (current_time_ms // (beat_duration_ms * 4)) % 12
-            beat_in_bar = ((current_time_ms % (beat_duration_ms * 4)) / beat_duration_ms) + 1.0
+            bar = (current_time_ms // bar_duration_ms) % 12
+            beat_in_bar = ((current_time_ms % bar_duration_ms) / beat_duration_ms) + 1.0
 
-            # Get current chord
-            chord_symbol = tune.get_chord_at_time(bar, beat_in_bar)
+            # Generate note based on style and current chord
+            pitch = pick_pitch(chord_at_bar[bar])
 
-            # Generate note based on style
-            if style == "chord_tones":
-                pitch = self._generate_chord_tone(chord_symbol)
-            elif style == "tensions":
-                pitch = self._generate_tension_note(chord_symbol)
-            else:  # outside
-                pitch = random.randint(60, 80)
-
-            note = ImprovNote(
+            add_note(ImprovNote(
                 time_ms=current_time_ms,
                 pitch=pitch,
-                velocity=random.randint(70, 100),
-                duration_ms=random.randint(200, 600),
+                velocity=randint(70, 100),
+                duration_ms=randint(200, 600),
                 bar=bar,
                 beat=beat_in_bar
-            )
-
-            chorus.notes.append(note)
+            ))
 
             # Advance time (with some variation)
-            current_time_ms += random.randint(200, 800)
+            current_time_ms += randint(200, 800)
 
         chorus.end_time_ms = current_time_ms
 
@@ -156,59 +184,60 @@ class TestImprovGenerator:
         current_time_ms = 0
         beat_duration_ms = (60000 // tune.tempo)
 
-        for _ in range(note_count):
-            bar = (current_time_ms // (beat_duration_ms * 4)) % 4
-            beat_in_bar = ((current_time_ms % (beat_duration_ms * 4)) / beat_duration_ms) + 1.0
+        # One chord per bar, so look each bar up once
+        chord_at_bar = [tune.get_chord_at_time(bar, 1.0) for bar in range(4)]
+
+        bar_duration_ms = beat_duration_ms * 4
+        pick_pitch = self._pitch_picker(style)
+        randint = self._rng.randint
+        add_note = chorus.notes.append
 
-            chord_symbol = tune.get_chord_at_time(bar, beat_in_bar)
+        for _ in range(note_count):
+            bar = (current_time_ms // bar_duration_ms) % 4
+            beat_in_bar = ((current_time_ms % bar_duration_ms) / beat_duration_ms) + 1.0
 
-            if style == "chord_tones":
-                pitch = self._generate_chord_tone(chord_symbol)
-            elif style == "tensions":
-                pitch = self._generate_tension_note(chord_symbol)
-            else:
-                pitch = random.randint(60, 80)
+            pitch = pick_pitch(chord_at_bar[bar])
 
-            note = ImprovNote(
+            add_note(ImprovNote(
                 time_ms=current_time_ms,
                 pitch=pitch,
-                velocity=random.randint(70, 100),
-                duration_ms=random.randint(150, 400),
+                velocity=randint(70, 100),
+                duration_ms=randint(150, 400),
                 bar=bar,
                 beat=beat_in_bar
-            )
-
-            chorus.notes.append(note)
-            current_time_ms += random.randint(150, 600)
+            ))
+            current_time_ms += randint(150, 600)
 
         chorus.end_time_ms = current_time_ms
 
         return chorus
 
+    def _pitch_picker(self, style: str) -> Callable[[str], int]:
+        """Choose the per-note pitch generator for a style once, up front."""
+        if style == "chord_tones":
+            return self._generate_chord_tone
+        elif style == "tensions":
+            return self._generate_tension_note
+        else:  # outside
+            return lambda chord_symbol: self._rng.randint(60, 80)
+
     def _generate_chord_tone(self, chord_symbol: str) -> int:
         """Generate a pitch that is a chord tone."""
-        root_pc, _ = parse_chord_symbol(chord_symbol)
-        intervals = get_chord_intervals(chord_symbol)
-
         # Pick a random chord tone
-        interval = random.choice(intervals)
+        pitch_class = self._rng.choice(_chord_tone_classes(chord_symbol))
 
         # Random octave (C4-C6)
-        octave = random.randint(4, 5)
-        pitch = 60 + (octave - 4) * 12 + ((root_pc + interval) % 12)
+        octave = self._rng.randint(4, 5)
+        pitch = 60 + (octave - 4) * 12 + pitch_class
 
         return pitch
 
     def _generate_tension_note(self, chord_symbol: str) -> int:
         """Generate a pitch that is a tension (9/11/13)."""
-        root_pc, _ = parse_chord_symbol(chord_symbol)
-
-        # Common tensions: 9th (2 semitones), 11th (5), 13th (9)
-        tensions = [2, 5, 9]
-        interval = random.choice(tensions)
+        pitch_class = self._rng.choice(_tension_classes(chord_symbol))
 
-        octave = random.randint(4, 5)
-        pitch = 60 + (octave - 4) * 12 + ((root_pc + interval) % 12)
+        octave = self._rng.randint(4, 5)
+        pitch = 60 + (octave - 4) * 12 + pitch_class
 
         return pitch
 
@@ -251,15 +280,12 @@ class TestImprovGenerator:
         # Deliberately place 3rds and 7ths on beats 1 and 3 at changes
         for change in tune.chord_changes[:note_count // 2]:
             # Generate a 3rd or 7th at this chord change
-            root_pc, _ = parse_chord_symbol(change.chord_symbol)
+            third_pc, seventh_pc = _guide_tone_classes(change.chord_symbol)
 
             # Choose 3rd or 7th
-            if random.random() < 0.5:
-                interval = 4 if 'maj' in change.chord_symbol.lower() else 3  # Major or minor 3rd
-            else:
-                interval = 11 if 'maj7' in change.chord_symbol.lower() else 10  # Major or dom 7th
+            pitch_class = third_pc if self._rng.random() < 0.5 else seventh_pc
 
-            pitch = 60 + ((root_pc + interval) % 12)
+            pitch = 60 + pitch_class
 
             time_ms = (change.bar * 4 + (change.beat - 1.0)) * beat_duration_ms
 
@@ -274,33 +300,44 @@ class TestImprovGenerator:
 
             chorus.notes.append(note)
 
-        # Fill in with some other chord tones
+        # Every change falls on a whole beat, so the chord anywhere in a beat
+        # is the chord at its start; look each beat of the chorus up once
+        chord_grid = [
+            [tune.get_chord_at_time(bar, beat) for beat in (1.0, 2.0, 3.0, 4.0)]
+            for bar in range(8)
+        ]
+
+        # Fill in with some other chord tones. Pitches and time steps are
+        # drawn alternately, so they're drawn note by note to keep seeded
+        # solos reproducible
+        bar_duration_ms = beat_duration_ms * 4
+        randint = self._rng.randint
+        add_note = chorus.notes.append
+        fillers_needed = note_count - len(chorus.notes)
         current_time = 100
-        while len(chorus.notes) < note_count:
-            bar = (current_time // (beat_duration_ms * 4)) % 8
-            beat_in_bar = ((current_time % (beat_duration_ms * 4)) / beat_duration_ms) + 1.0
+        while fillers_needed > 0:
+            bar = (current_time // bar_duration_ms) % 8
+            beat_in_bar = ((current_time % bar_duration_ms) / beat_duration_ms) + 1.0
 
-            chord_symbol = tune.get_chord_at_time(bar, beat_in_bar)
+            chord_symbol = chord_grid[bar][int(beat_in_bar) - 1]
             if chord_symbol:
-                pitch = self._generate_chord_tone(chord_symbol)
-
-                note = ImprovNote(
+                add_note(ImprovNote(
                     time_ms=current_time,
-                    pitch=pitch,
+                    pitch=self._generate_chord_tone(chord_symbol),
                     velocity=80,
                     duration_ms=300,
                     bar=bar,
                     beat=beat_in_bar
-                )
-
-                chorus.notes.append(note)
-
-            current_time += random.randint(200, 500)
+                ))
+                fillers_needed -= 1
 
-        chorus.end_time_ms = max(n.time_ms for n in chorus.notes) + 500
+            current_time += randint(200, 500)
 
-        # Sort notes by time
-        chorus.notes.sort(key=lambda n: n.time_ms)
+        # Sort notes by time. The targeted and filler notes are each already
+        # in time order, so this is a single merge, and the last note is the
+        # latest one
+        chorus.notes.sort(key=attrgetter('time_ms'))
+        chorus.end_time_ms = chorus.notes[-1].time_ms + 500
 
         return chorus
 
@@ -319,9 +356,10 @@ class AudioImprovGenerator:
         Initialize test audio generator.
 
         Args:
-            seed: Random seed for reproducibility
+            seed: Random seed for reproducibility. Each generator draws from
+                its own random.Random, leaving the global random state alone.
         """
-        random.seed(seed)
+        self._rng = random.Random(seed)
 
     def generate_audio_blues_solo(
         self,
@@ -345,7 +383,7 @@ class AudioImprovGenerator:
             ImprovChorus with synthetic notes
         """
         # Use the existing MIDI generator but wrap the result
-        generator = TestImprovGenerator(seed=random.randint(1, 10000))
+        generator = TestImprovGenerator(seed=self._rng.randint(1, 10000))
 
         # Generate using MIDI approach
         chorus = generator.generate_simple_blues_solo(style=style, note_count=30)
@@ -376,7 +414,7 @@ class AudioImprovGenerator:
             ImprovChorus with synthetic notes
         """
         # Use existing MIDI generator
-        generator = TestImprovGenerator(seed=random.randint(1, 10000))
+        generator = TestImprovGenerator(seed=self._rng.randint(1, 10000))
 
         # Generate using ii-V-I approach
         chorus = generator.generate_ii_v_i_solo(style=style, note_count=24)
@@ -419,13 +457,13 @@ class AudioImprovGenerator:
 
         while current_time < end_time:
             # Add small random pitch variation (vibrato, cents deviation)
-            pitch_variation = random.uniform(-0.3, 0.3)  # ±30 cents
+            pitch_variation = self._rng.uniform(-0.3, 0.3)  # ±30 cents
             actual_pitch = pitch + (pitch_variation / 100.0)
 
             frequency = midi_to_frequency(actual_pitch)
 
             # Confidence is high for stable notes
-            confidence = random.uniform(0.85, 0.95)
+            confidence = self._rng.uniform(0.85, 0.95)
 
             readings.append({
                 'timestamp_ms': current_time,
@@ -0,0 +1,139 @@
+"""
+Lightweight Standard MIDI File reader for note extraction.
+
+Parses only what load_midi_file() needs - the header and the note
+events of a single track - straight from the file bytes, without
+building a mido Message object for every event in every track.
+"""
+
+from typing import List, Optional, Tuple
+
+# Number of data bytes after each channel-message status (by high nibble)
+_DATA_LENGTHS = {0x80: 2, 0x90: 2, 0xA0: 2, 0xB0: 2, 0xC0: 1, 0xD0: 1, 0xE0: 2}
+
+
+class MidiParseError(ValueError):
+    """Raised when the data is not a MIDI file this reader can handle."""
+
+
+def read_track_notes(
+    data: bytes,
+    track_index: int
+) -> Tuple[int, int, Optional[List[Tuple[int, int, int]]]]:
+    """
+    Extract the notes of one track from raw MIDI file bytes.
+
+    Notes are paired the same way load_midi_file() always has: by pitch
+    alone, with a later note_on for a sounding pitch restarting it.
+
+    Args:
+        data: Complete contents of a .mid file
+        track_index: Which track to extract (negative counts from the end)
+
+    Returns:
+        (ticks_per_beat, num_tracks, notes) where notes is a list of
+        (pitch, duration_ticks, velocity) in note-off order, or None if
+        the file has no track at track_index
+
+    Raises:
+        MidiParseError: If the data is malformed or uses unsupported events
+        IndexError: If the data is truncated
+    """
+    if data[:4] != b'MThd':
+        raise MidiParseError("no MThd header at start of file")
+
+    header_size = int.from_bytes(data[4:8], 'big')
+    if header_size < 6:
+        raise MidiParseError("MThd header too short")
+
+    num_tracks = int.from_bytes(data[10:12], 'big')
+    ticks_per_beat = int.from_bytes(data[12:14], 'big')
+
+    # Negative indexes count from the end, as with mid.tracks[track_index]
+    if track_index < 0:
+        track_index += num_tracks
+    if not 0 <= track_index < num_tracks:
+        return ticks_per_beat, num_tracks, None
+
+    # Hop over the chunks before the wanted track using their sizes
+    pos = 8 + header_size
+    for _ in range(track_index):
+        pos += 8 + int.from_bytes(data[pos + 4:pos + 8], 'big')
+
+    if data[pos:pos + 4] != b'MTrk':
+        raise MidiParseError("no MTrk header at start of track")
+
+    start = pos + 8
+    end = start + int.from_bytes(data[pos + 4:pos + 8], 'big')
+    if end > len(data):
+        raise MidiParseError("track chunk runs past end of file")
+
+    return ticks_per_beat, num_tracks, _track_notes(data, start, end)
+
+
+def _read_vlq(data: bytes, pos: int) -> Tuple[int, int]:
+    """Read a variable-length quantity, returning (value, next position)."""
+    byte = data[pos]
+    pos += 1
+    value = byte & 0x7F
+    while byte & 0x80:
+        byte = data[pos]
+        pos += 1
+        value = (value << 7) | (byte & 0x7F)
+    return value, pos
+
+
+def _track_notes(data: bytes, pos: int, end: int) -> List[Tuple[int, int, int]]:
+    """Walk one track's events, pairing note on/off by pitch."""
+    notes = []
+    # Start tick and velocity of the sounding note per pitch (-1 = silent)
+    active_start = [-1] * 128
+    active_velocity = [0] * 128
+    tick = 0
+    running_status = None
+
+    while pos < end:
+        delta, pos = _read_vlq(data, pos)
+        tick += delta
+
+        status = data[pos]
+        if status < 0x80:
+            # Running status: reuse the previous status, this byte is data
+            if running_status is None or running_status >= 0xF0:
+                raise MidiParseError("running status without a channel message")
+            status = running_status
+        else:
+            pos += 1
+            if status == 0xFF:
+                # Meta event: type, length, payload (doesn't set running status)
+                length, pos = _read_vlq(data, pos + 1)
+                pos += length
+                continue
+
+            running_status = status
+            if status == 0xF0 or status == 0xF7:
+                length, pos = _read_vlq(data, pos)
+                pos += length
+                continue
+
+        kind = status & 0xF0
+        num_data = _DATA_LENGTHS.get(kind)
+        if num_data is None:
+            raise MidiParseError(f"unsupported status byte 0x{status:02x}")
+
+        if kind == 0x90 or kind == 0x80:
+            pitch = data[pos]
+            velocity = data[pos + 1]
+            if pitch > 127 or velocity > 127:
+                raise MidiParseError("data byte must be in range 0..127")
+
+            if kind == 0x90 and velocity > 0:
+                active_start[pitch] = tick
+                active_velocity[pitch] = velocity
+            elif active_start[pitch] >= 0:
+                notes.append((pitch, tick - active_start[pitch], active_velocity[pitch]))
+                active_start[pitch] = -1
+
+        pos += num_data
+
+    return notes
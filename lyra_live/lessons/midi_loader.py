@@ -6,9 +6,12 @@ into Lesson objects with LessonPhrase segments.
 """
 
 import mido
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 from typing import List, Optional
 from lyra_live.ear_training.base import Note
-from lyra_live.lessons.core import Lesson, LessonPhrase
+from lyra_live.lessons.core import Lesson, LessonPack, LessonPhrase
+from lyra_live.lessons._midi_fast import MidiParseError, read_track_notes
 
 
 def load_midi_file(file_path: str, track_index: int = 0) -> List[Note]:
@@ -17,53 +20,83 @@ def load_midi_file(file_path: str, track_index: int = 0) -> List[Note]:
 
     Args:
         file_path: Path to MIDI file
-        track_index: Which track to extract (default: 0 = first track)
+        track_index: Which track to extract (default: 0 = first track;
+            negative counts from the end)
 
     Returns:
         List of Note objects from the track
     """
+    # Fast path: parse just the requested track from the raw bytes. Anything
+    # it can't handle goes through mido, which also reports load errors.
+    try:
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        ticks_per_beat, num_tracks, track_notes = read_track_notes(data, track_index)
+    except (OSError, MidiParseError, IndexError):
+        return _load_midi_file_mido(file_path, track_index)
+
+    if track_notes is None:
+        raise ValueError(f"Track {track_index} not found (file has {num_tracks} tracks)")
+
+    # Convert ticks to milliseconds (approximate: 500ms per beat, i.e. 120 BPM,
+    # minimum 100ms). A melody uses only a handful of distinct durations, so
+    # each is converted once and looked up per note.
+    duration_ms = {
+        duration_ticks: max(int((duration_ticks / ticks_per_beat) * 500), 100)
+        for duration_ticks in {note[1] for note in track_notes}
+    }
+    return [
+        Note(pitch, duration_ms[duration_ticks], velocity)
+        for pitch, duration_ticks, velocity in track_notes
+    ]
+
+
+def _load_midi_file_mido(file_path: str, track_index: int = 0) -> List[Note]:
+    """mido-based implementation of load_midi_file()."""
     try:
         mid = mido.MidiFile(file_path)
     except Exception as e:
         raise ValueError(f"Could not load MIDI file {file_path}: {e}")
 
-    if track_index >= len(mid.tracks):
+    if not -len(mid.tracks) <= track_index < len(mid.tracks):
         raise ValueError(f"Track {track_index} not found (file has {len(mid.tracks)} tracks)")
 
     track = mid.tracks[track_index]
     notes = []
     current_time = 0
-    active_notes = {}  # Track note_on events to calculate durations
+
+    # Start time and velocity of the sounding note per pitch (-1 = silent),
+    # used to calculate durations
+    active_start = [-1] * 128
+    active_velocity = [0] * 128
+
+    # Convert ticks to milliseconds (approximate)
+    # MIDI tempo is typically 500000 microseconds per quarter note (120 BPM)
+    # This is a simplification; real tempo changes require parsing
+    ticks_per_beat = mid.ticks_per_beat
 
     for msg in track:
         current_time += msg.time
 
         if msg.type == 'note_on' and msg.velocity > 0:
             # Note start
-            active_notes[msg.note] = {
-                'start_time': current_time,
-                'velocity': msg.velocity
-            }
+            active_start[msg.note] = current_time
+            active_velocity[msg.note] = msg.velocity
 
         elif msg.type == 'note_off' or (msg.type == 'note_on' and msg.velocity == 0):
             # Note end
-            if msg.note in active_notes:
-                note_data = active_notes[msg.note]
-                duration_ticks = current_time - note_data['start_time']
-
-                # Convert ticks to milliseconds (approximate)
-                # MIDI tempo is typically 500000 microseconds per quarter note (120 BPM)
-                # This is a simplification; real tempo changes require parsing
-                ticks_per_beat = mid.ticks_per_beat
+            start_time = active_start[msg.note]
+            if start_time >= 0:
+                duration_ticks = current_time - start_time
                 duration_ms = int((duration_ticks / ticks_per_beat) * 500)  # Rough estimate
 
                 notes.append(Note(
                     pitch=msg.note,
                     duration_ms=max(duration_ms, 100),  # Minimum 100ms
-                    velocity=note_data['velocity']
+                    velocity=active_velocity[msg.note]
                 ))
 
-                del active_notes[msg.note]
+                active_start[msg.note] = -1
 
     return notes
 
@@ -84,30 +117,19 @@ def slice_into_phrases(
     Returns:
         List of phrase note lists
     """
-    if not notes:
+    if not notes or phrase_length <= 0:
         return []
 
-    phrases = []
-    i = 0
-
-    while i < len(notes):
-        end_idx = min(i + phrase_length, len(notes))
-        phrase = notes[i:end_idx]
-
-        if len(phrase) > 0:
-            phrases.append(phrase)
+    num_notes = len(notes)
+    step = max(phrase_length - overlap, 1)
 
-        # Move forward by phrase_length - overlap
-        step = max(phrase_length - overlap, 1)
-        i += step
+    # Phrases start every `step` notes while at least half a phrase remains
+    # after the start; the first start past that takes the rest of the notes
+    # as a final, shorter phrase
+    last_full_start = max(num_notes - phrase_length // 2, 0) // step * step
+    stop = min(last_full_start + 2 * step, num_notes)
 
-        # Stop if the remaining notes are too short
-        if i < len(notes) and len(notes) - i < phrase_length // 2:
-            # Add the remaining as final phrase
-            phrases.append(notes[i:])
-            break
-
-    return phrases
+    return [notes[start:start + phrase_length] for start in range(0, stop, step)]
 
 
 def create_lesson_from_midi(
@@ -161,3 +183,60 @@ def create_lesson_from_midi(
     )
 
     return lesson
+
+
+def create_lesson_pack_from_dir(
+    dir_path: str,
+    pack_id: str,
+    title: str,
+    description: Optional[str] = None,
+    track_index: int = 0,
+    phrase_length: int = 8,
+    difficulty: str = "intermediate",
+    max_workers: Optional[int] = None
+) -> LessonPack:
+    """
+    Create a LessonPack with one lesson per MIDI file in a directory.
+
+    Files are parsed in parallel worker processes. Each lesson's ID is
+    the file name without extension, and its title the same with
+    underscores as spaces; lessons are ordered by file name.
+
+    Args:
+        dir_path: Directory containing .mid files
+        pack_id: Unique ID for the pack
+        title: Pack title
+        description: Pack description
+        track_index: Which track to use from each MIDI file
+        phrase_length: How many notes per phrase
+        difficulty: Difficulty level for every lesson
+        max_workers: Worker processes to use (default: one per CPU;
+            1 loads the files in this process)
+
+    Returns:
+        LessonPack with a lesson per file
+    """
+    files = sorted(str(path) for path in Path(dir_path).glob('*.mid'))
+    args = [(file_path, track_index, phrase_length, difficulty) for file_path in files]
+
+    if max_workers == 1 or len(files) <= 1:
+        lessons = [_lesson_from_file(*file_args) for file_args in args]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            lessons = list(pool.map(_lesson_from_file, *zip(*args)))
+
+    return LessonPack(id=pack_id, title=title, description=description, lessons=lessons)
+
+
+def _lesson_from_file(file_path: str, track_index: int, phrase_length: int,
+                      difficulty: str) -> Lesson:
+    """Worker for create_lesson_pack_from_dir(): one file's lesson."""
+    stem = Path(file_path).stem
+    return create_lesson_from_midi(
+        file_path,
+        lesson_id=stem,
+        title=stem.replace('_', ' '),
+        track_index=track_index,
+        phrase_length=phrase_length,
+        difficulty=difficulty
+    )
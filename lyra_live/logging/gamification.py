@@ -5,8 +5,10 @@ Provides XP calculation, rank determination, and badge system
 to encourage consistent practice and skill development.
 """
 
+import bisect
 from dataclasses import dataclass
-from typing import List
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
 from lyra_live.logging.practice_log import PracticeSessionRecord
 from lyra_live.logging import progress_stats
 
@@ -18,6 +20,8 @@ BASE_XP_PER_MINUTE = 10.0
 @dataclass
 class RankInfo:
     """Information about a player rank."""
+    __slots__ = ('name', 'min_xp', 'description')
+
     name: str
     min_xp: int
     description: str
@@ -36,6 +40,9 @@ RANKS = [
     RankInfo("Wizard", 40000, "Transcendent musicianship"),
 ]
 
+# RANKS' min_xp values, ascending, for bisecting
+_RANK_THRESHOLDS = tuple(rank.min_xp for rank in RANKS)
+
 
 def compute_xp_for_session(record: PracticeSessionRecord) -> int:
     """
@@ -99,23 +106,40 @@ def compute_total_xp(sessions: List[PracticeSessionRecord]) -> int:
     Returns:
         Total XP earned
     """
-    # Base XP from all sessions
-    base_xp = sum(compute_xp_for_session(s) for s in sessions)
+    now = datetime.now()
+    month_cutoff = now - timedelta(days=30)
+    week_cutoff = now - timedelta(days=7)
+
+    # Each session's XP is computed once and counted towards the all-time,
+    # last-month and last-week totals the streak bonuses are based on
+    base_xp = 0
+    month_base = 0
+    week_base = 0
+    practice_dates = set()
+
+    for s in sessions:
+        xp = compute_xp_for_session(s)
+        session_time = s.dt
+
+        base_xp += xp
+        if session_time >= month_cutoff:
+            month_base += xp
+            if session_time >= week_cutoff:
+                week_base += xp
+
+        if s.source != "demo":
+            practice_dates.add(session_time.date())
 
     # Streak bonuses
-    streak = progress_stats.compute_recent_streak(sessions, days=30)
+    streak = progress_stats.count_streak(practice_dates, days=30)
 
     bonus_xp = 0
 
     if streak >= 30:
         # 30-day streak: +20% bonus on last month
-        recent_30 = progress_stats.filter_sessions(sessions, since_days=30)
-        month_base = sum(compute_xp_for_session(s) for s in recent_30)
         bonus_xp += int(month_base * 0.2)
     elif streak >= 7:
         # 7-day streak: +10% bonus on last week
-        recent_7 = progress_stats.filter_sessions(sessions, since_days=7)
-        week_base = sum(compute_xp_for_session(s) for s in recent_7)
         bonus_xp += int(week_base * 0.1)
 
     return base_xp + bonus_xp
@@ -131,19 +155,15 @@ def determine_rank(total_xp: int) -> RankInfo:
     Returns:
         RankInfo for the current rank
     """
-    # Find the highest rank we've achieved
-    current_rank = RANKS[0]
+    return RANKS[_rank_index(total_xp)]
 
-    for rank in RANKS:
-        if total_xp >= rank.min_xp:
-            current_rank = rank
-        else:
-            break
 
-    return current_rank
+def _rank_index(total_xp: int) -> int:
+    """Index in RANKS of the highest rank reached (0 below every threshold)."""
+    return max(bisect.bisect_right(_RANK_THRESHOLDS, total_xp) - 1, 0)
 
 
-def get_next_rank(total_xp: int) -> tuple[RankInfo, int]:
+def get_next_rank(total_xp: int) -> Tuple[RankInfo, int]:
     """
     Get information about the next rank to achieve.
 
@@ -153,10 +173,7 @@ def get_next_rank(total_xp: int) -> tuple[RankInfo, int]:
     Returns:
         Tuple of (next_rank_info, xp_needed)
     """
-    current = determine_rank(total_xp)
-
-    # Find next rank
-    current_index = RANKS.index(current)
+    current_index = _rank_index(total_xp)
 
     if current_index < len(RANKS) - 1:
         next_rank = RANKS[current_index + 1]
@@ -164,7 +181,20 @@ def get_next_rank(total_xp: int) -> tuple[RankInfo, int]:
         return next_rank, xp_needed
     else:
         # Already at max rank
-        return current, 0
+        return RANKS[current_index], 0
+
+
+# Badge group and averaged metrics for each session mode that badges
+# look at; modes not listed only count towards the general badges
+_IMPROV_GROUP = ('improv', ('guide_tone_hits', 'chord_tone_ratio'))
+_BADGE_MODE_GROUPS = {
+    'improv_midi': _IMPROV_GROUP,
+    'improv_audio': _IMPROV_GROUP,
+    'rhythm': ('rhythm', ('rhythm_accuracy',)),
+    'intervals': ('intervals', ('interval_accuracy',)),
+    'chords': ('chords', ('chord_accuracy',)),
+    'melody': ('melody', ('melody_accuracy',)),
+}
 
 
 def compute_badges(sessions: List[PracticeSessionRecord]) -> List[str]:
@@ -194,13 +224,55 @@ def compute_badges(sessions: List[PracticeSessionRecord]) -> List[str]:
     Returns:
         List of badge names earned
     """
-    badges = []
+    # Everything the badges depend on is gathered in one pass over the
+    # sessions; averages are kept as [sum, count] per metric
+    num_sessions = 0
+    total_seconds = 0.0
+    practice_dates = set()
+    instruments = set()
+    tunes = set()
+    mode_counts = {'improv': 0, 'rhythm': 0, 'intervals': 0, 'chords': 0, 'melody': 0}
+    metric_totals = {name: [0, 0] for name in (
+        'guide_tone_hits', 'chord_tone_ratio', 'rhythm_accuracy',
+        'interval_accuracy', 'chord_accuracy', 'melody_accuracy',
+    )}
+
+    for s in sessions:
+        # Skip demos
+        if s.source == "demo":
+            continue
+
+        num_sessions += 1
+        total_seconds += s.duration_seconds
+        practice_dates.add(s.date)
+        instruments.add(s.instrument)
+        if s.tune_id:
+            tunes.add(s.tune_id)
+
+        group = _BADGE_MODE_GROUPS.get(s.mode)
+        if group is None:
+            # Other improv variants still count towards the improv badges
+            if 'improv' not in s.mode:
+                continue
+            group = _IMPROV_GROUP
+
+        group_name, metrics = group
+        mode_counts[group_name] += 1
+
+        for name in metrics:
+            value = getattr(s, name)
+            if value is not None:
+                totals = metric_totals[name]
+                totals[0] += value
+                totals[1] += 1
+
+    def average(name: str) -> Optional[float]:
+        total, count = metric_totals[name]
+        return total / count if count else None
 
-    # Filter out demos
-    real_sessions = [s for s in sessions if s.source != "demo"]
+    badges = []
 
     # Session count badges
-    num_sessions = len(real_sessions)
     if num_sessions >= 1:
         badges.append("First_Steps")
     if num_sessions >= 10:
@@ -211,7 +283,7 @@ def compute_badges(sessions: List[PracticeSessionRecord]) -> List[str]:
         badges.append("Committed")
 
     # Time badges
-    total_minutes = progress_stats.compute_totals(real_sessions)
+    total_minutes = total_seconds / 60.0
     if total_minutes >= 100:
         badges.append("First_100_Minutes")
     if total_minutes >= 500:
@@ -220,44 +292,37 @@ def compute_badges(sessions: List[PracticeSessionRecord]) -> List[str]:
         badges.append("Thousand_Hour_Journey")
 
     # Streak badges
-    streak = progress_stats.compute_recent_streak(real_sessions, days=30)
+    streak = progress_stats.count_streak(practice_dates, days=30)
     if streak >= 7:
         badges.append("Week_Warrior")
     if streak >= 30:
         badges.append("Month_Master")
 
     # Multi-instrument badge
-    num_instruments = progress_stats.count_unique_instruments(real_sessions)
-    if num_instruments >= 3:
+    if len(instruments) >= 3:
         badges.append("Multi_Instrumentalist")
 
     # Improvisation badges
-    improv_sessions = [s for s in real_sessions if 'improv' in s.mode]
-    if len(improv_sessions) >= 10:
-        avg_guide_tones = progress_stats.compute_average_metrics(improv_sessions, 'guide_tone_hits')
+    if mode_counts['improv'] >= 10:
+        avg_guide_tones = average('guide_tone_hits')
         if avg_guide_tones and avg_guide_tones >= 5:
             badges.append("Guide_Tone_Guru")
 
-        avg_chord_tone = progress_stats.compute_average_metrics(improv_sessions, 'chord_tone_ratio')
+        avg_chord_tone = average('chord_tone_ratio')
         if avg_chord_tone and avg_chord_tone >= 70:
             badges.append("Harmonic_Awareness")
 
     # Rhythm badges
-    rhythm_sessions = [s for s in real_sessions if s.mode == 'rhythm']
-    if len(rhythm_sessions) >= 10:
-        avg_accuracy = progress_stats.compute_average_metrics(rhythm_sessions, 'rhythm_accuracy')
+    if mode_counts['rhythm'] >= 10:
+        avg_accuracy = average('rhythm_accuracy')
         if avg_accuracy and avg_accuracy >= 85:
             badges.append("Rhythm_Monk")
 
     # Ear training badges
-    interval_sessions = [s for s in real_sessions if s.mode == 'intervals']
-    chord_sessions = [s for s in real_sessions if s.mode == 'chords']
-    melody_sessions = [s for s in real_sessions if s.mode == 'melody']
-
-    if interval_sessions and chord_sessions and melody_sessions:
-        avg_interval = progress_stats.compute_average_metrics(interval_sessions, 'interval_accuracy')
-        avg_chord = progress_stats.compute_average_metrics(chord_sessions, 'chord_accuracy')
-        avg_melody = progress_stats.compute_average_metrics(melody_sessions, 'melody_accuracy')
+    if mode_counts['intervals'] and mode_counts['chords'] and mode_counts['melody']:
+        avg_interval = average('interval_accuracy')
+        avg_chord = average('chord_accuracy')
+        avg_melody = average('melody_accuracy')
 
         if (avg_interval and avg_interval >= 80 and
             avg_chord and avg_chord >= 80 and
@@ -265,8 +330,7 @@ def compute_badges(sessions: List[PracticeSessionRecord]) -> List[str]:
             badges.append("Ear_Training_Expert")
 
     # Standards exploration badge
-    num_tunes = progress_stats.count_unique_tunes(real_sessions)
-    if num_tunes >= 10:
+    if len(tunes) >= 10:
         badges.append("Standards_Explorer")
 
     return badges
@@ -5,15 +5,28 @@ Provides persistent storage of all practice sessions with detailed metrics.
 Each session is logged as one line of JSON for easy appending and parsing.
 """
 
+import bisect
 import json
 import fcntl
-from dataclasses import dataclass, asdict
-from datetime import datetime
+import math
+import os
+import sys
+from dataclasses import dataclass, field, fields
+from datetime import date, datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; the json module is used without it
+    orjson = None
 
-@dataclass
+# Records are created per log line, so they use slots where dataclasses
+# support it (Python 3.10+); older versions fall back to an instance dict
+_RECORD_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_RECORD_DATACLASS_OPTIONS)
 class PracticeSessionRecord:
     """
     Record of a single practice session.
@@ -59,15 +72,66 @@ class PracticeSessionRecord:
     # Schema version
     version: str = "v1"
 
+    # Cache for dt/date: (timestamp, datetime, date). Not serialized.
+    _parsed: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        # Field values are all scalars, so no deep copy is needed
+        return {name: getattr(self, name) for name in _RECORD_FIELDS}
 
     @classmethod
     def from_dict(cls, data: dict) -> 'PracticeSessionRecord':
         """Create from dictionary (from JSON)."""
         return cls(**data)
 
+    @property
+    def dt(self) -> datetime:
+        """
+        The timestamp as a datetime.
+
+        Parsed on first use and kept until the timestamp is reassigned, so
+        stats that look at the time of every session don't re-parse it.
+        """
+        return self._parsed_timestamp()[1]
+
+    @property
+    def date(self) -> date:
+        """The calendar date of the timestamp (cached like dt)."""
+        return self._parsed_timestamp()[2]
+
+    def _parsed_timestamp(self) -> tuple:
+        """(timestamp, datetime, date), re-parsed if the timestamp has changed."""
+        cached = self._parsed
+        if cached is None or cached[0] is not self.timestamp:
+            dt = datetime.fromisoformat(self.timestamp)
+            cached = self._parsed = (self.timestamp, dt, dt.date())
+        return cached
+
+
+# Serialized PracticeSessionRecord fields, in declaration order
+_RECORD_FIELDS = tuple(f.name for f in fields(PracticeSessionRecord) if f.init)
+
+
+@dataclass
+class _ParsedLog:
+    """Records parsed from a log file, and the file state they reflect."""
+    inode: int
+    mtime_ns: int
+    size: int  # Bytes parsed
+    line_count: int  # Lines parsed, for warning line numbers
+    complete: bool  # Whether the parsed bytes end at a line break
+    sessions: List['PracticeSessionRecord']
+    first_line: bytes = b''  # Raw first and last lines parsed, to tell an
+    last_line: bytes = b''  # appended-to file from a rewritten one
+    ordered: bool = True  # Whether the sessions checked so far are in timestamp order
+    # Timestamps of the leading sessions checked for order (while ordered)
+    times: List[datetime] = field(default_factory=list)
+
+
+# Parsed log per resolved log path
+_session_cache: Dict[Path, _ParsedLog] = {}
+
 
 def get_log_path() -> Path:
     """
@@ -90,24 +154,51 @@ def append_session(record: PracticeSessionRecord) -> None:
     Args:
         record: PracticeSessionRecord to append
     """
+    append_sessions([record])
+
+
+def append_sessions(records: Iterable[PracticeSessionRecord]) -> None:
+    """
+    Append several practice session records to the log file at once.
+
+    Like append_session(), but all records go out in a single write, so
+    the file is opened and locked once per batch instead of once per
+    record.
+
+    Args:
+        records: PracticeSessionRecords to append, in order
+    """
+    # Convert to JSON
+    data = b''.join(_dumps(record.to_dict()) + b'\n' for record in records)
+    if not data:
+        return
+
     log_path = get_log_path()
 
     # Ensure directory exists
     log_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Convert to JSON
-    json_line = json.dumps(record.to_dict()) + '\n'
-
-    # Append with file locking for concurrent safety
-    with open(log_path, 'a') as f:
+    # Unbuffered O_APPEND write under an exclusive lock. Every write lands
+    # at the current end of the file, and the lock keeps a batch that needs
+    # more than one write() from interleaving with other writers
+    fd = os.open(log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+    try:
         # Acquire exclusive lock
-        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        fcntl.flock(fd, fcntl.LOCK_EX)
         try:
-            f.write(json_line)
-            f.flush()
+            _write_all(fd, data)
         finally:
             # Release lock
-            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to fd, continuing after any short write."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
 
 
 def load_sessions() -> List[PracticeSessionRecord]:
@@ -119,29 +210,126 @@ def load_sessions() -> List[PracticeSessionRecord]:
 
     Returns empty list if log file doesn't exist or is empty.
     Skips malformed lines with a warning.
+
+    The parsed records are cached per file. Repeat loads of an unchanged
+    file don't re-read it, and when lines have only been appended since the
+    last load, just the new lines are parsed. The records are shared
+    between calls and should be treated as read-only.
     """
-    log_path = get_log_path()
+    return list(_cached_sessions())
 
-    if not log_path.exists():
-        return []
 
-    sessions = []
+def _cached_sessions() -> List[PracticeSessionRecord]:
+    """The cached record list for the log file, brought up to date (not a copy)."""
+    parsed = _cached_log()
+    return parsed.sessions if parsed is not None else []
+
+
+def _cached_log() -> Optional[_ParsedLog]:
+    """The cached parse of the log file, brought up to date (None if no file)."""
+    log_path = get_log_path().resolve()
+
+    try:
+        stat = log_path.stat()
+    except FileNotFoundError:
+        _session_cache.pop(log_path, None)
+        return None
+
+    cached = _session_cache.get(log_path)
+    if cached is not None and cached.inode == stat.st_ino:
+        if cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+            return cached
+
+        if cached.complete and stat.st_size > cached.size:
+            with open(log_path, 'rb') as f:
+                # Only extend if the first and last parsed lines are still
+                # in place, i.e. the file looks appended to rather than
+                # rewritten (possibly as a new file on a reused inode)
+                if _unchanged_ends(f, cached):
+                    _parse_log_lines(f, cached)
+                    cached.mtime_ns = stat.st_mtime_ns
+                    return cached
+
+    parsed = _ParsedLog(stat.st_ino, stat.st_mtime_ns, 0, 0, True, [])
+    with open(log_path, 'rb') as f:
+        _parse_log_lines(f, parsed)
+    _session_cache[log_path] = parsed
+
+    return parsed
+
 
-    with open(log_path, 'r') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue  # Skip empty lines
+def _unchanged_ends(f, parsed: _ParsedLog) -> bool:
+    """Whether f still has parsed's first and last lines where they were parsed.
 
-            try:
-                data = json.loads(line)
-                session = PracticeSessionRecord.from_dict(data)
-                sessions.append(session)
-            except (json.JSONDecodeError, TypeError) as e:
-                print(f"Warning: Skipping malformed line {line_num} in practice log: {e}")
-                continue
+    Leaves f positioned at the end of the parsed bytes.
+    """
+    if f.read(len(parsed.first_line)) != parsed.first_line:
+        return False
+
+    f.seek(parsed.size - len(parsed.last_line))
+    return f.read(len(parsed.last_line)) == parsed.last_line
+
+
+def _parse_log_lines(f, parsed: _ParsedLog) -> None:
+    """Parse the lines from f's position to EOF into parsed, updating its state."""
+    for line in f:
+        if not parsed.line_count:
+            parsed.first_line = line
+        parsed.last_line = line
+        parsed.line_count += 1
+        parsed.size += len(line)
+        parsed.complete = line.endswith(b'\n')
 
-    return sessions
+        line = line.strip()
+        if not line:
+            continue  # Skip empty lines
+
+        try:
+            data = _loads(line)
+            _intern_vocabulary(data)
+            session = PracticeSessionRecord.from_dict(data)
+            parsed.sessions.append(session)
+        except (json.JSONDecodeError, TypeError) as e:
+            print(f"Warning: Skipping malformed line {parsed.line_count} in practice log: {e}")
+            continue
+
+
+# Fields whose values come from a small vocabulary; interning them makes
+# every record share one string object per value
+_INTERNED_FIELDS = ('mode', 'instrument', 'source', 'tune_id', 'version')
+
+
+def _intern_vocabulary(data: dict) -> None:
+    """Intern the _INTERNED_FIELDS string values of a decoded log line in place."""
+    if type(data) is not dict:
+        return
+    for key in _INTERNED_FIELDS:
+        value = data.get(key)
+        if type(value) is str:
+            data[key] = sys.intern(value)
+
+
+def _dumps(data: dict) -> bytes:
+    """Encode one log line's JSON, with orjson when it's installed."""
+    # orjson writes NaN/Infinity as null, so those records keep going
+    # through json to read back the same
+    if orjson is not None and not any(
+        isinstance(value, float) and not math.isfinite(value) for value in data.values()
+    ):
+        return orjson.dumps(data)
+    return json.dumps(data).encode()
+
+
+def _loads(line: bytes) -> dict:
+    """Decode one log line's JSON, with orjson when it's installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity tokens json writes; let json
+            # decide whether the line is really malformed
+            pass
+    return json.loads(line)
 
 
 def load_sessions_since(since: datetime) -> List[PracticeSessionRecord]:
@@ -154,15 +342,41 @@ def load_sessions_since(since: datetime) -> List[PracticeSessionRecord]:
     Returns:
         List of PracticeSessionRecord objects since the given time
     """
-    all_sessions = load_sessions()
+    parsed = _cached_log()
+    if parsed is None:
+        return []
+
+    sessions = parsed.sessions
+    if not _in_time_order(parsed):
+        return [session for session in sessions if session.dt >= since]
+
+    # Sessions are appended as they happen, so the log is normally in time
+    # order and the recent ones can be found by bisecting their timestamps
+    return sessions[bisect.bisect_left(parsed.times, since):]
+
+
+def _in_time_order(parsed: _ParsedLog) -> bool:
+    """Whether parsed's sessions are in timestamp order, checking only new ones."""
+    sessions = parsed.sessions
+    times = parsed.times
+    if parsed.ordered and len(times) < len(sessions):
+        previous = times[-1] if times else None
+        try:
+            for session in sessions[len(times):]:
+                current = session.dt
+                if previous is not None and current < previous:
+                    parsed.ordered = False
+                    break
+                times.append(current)
+                previous = current
+        except TypeError:
+            # Naive and timezone-aware timestamps mixed
+            parsed.ordered = False
 
-    filtered = []
-    for session in all_sessions:
-        session_time = datetime.fromisoformat(session.timestamp)
-        if session_time >= since:
-            filtered.append(session)
+        if not parsed.ordered:
+            times.clear()
 
-    return filtered
+    return parsed.ordered
 
 
 def count_sessions() -> int:
@@ -172,7 +386,9 @@ def count_sessions() -> int:
     Returns:
         Number of sessions in the log
     """
-    return len(load_sessions())
+    # Parsing is still needed to skip malformed lines, but it only happens
+    # when the log has changed since it was last read
+    return len(_cached_sessions())
 
 
 def clear_log() -> None:
@@ -183,6 +399,7 @@ def clear_log() -> None:
     Only use for testing or explicit user request.
     """
     log_path = get_log_path()
+    _session_cache.pop(log_path.resolve(), None)
 
     if log_path.exists():
         log_path.unlink()
@@ -5,12 +5,150 @@ Pure data processing functions that operate on PracticeSessionRecord objects
 to compute totals, averages, streaks, and other useful metrics.
 """
 
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+import operator
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Dict, Optional, Set
 from collections import defaultdict
 from lyra_live.logging.practice_log import PracticeSessionRecord
 
 
+# Optional numeric PracticeSessionRecord fields that StatsBundle averages
+METRIC_FIELDS = (
+    'chord_tone_ratio', 'tension_ratio', 'outside_ratio', 'guide_tone_hits',
+    'avg_cents_deviation', 'rhythm_accuracy', 'avg_timing_error_ms', 'rush_drag_bias',
+    'interval_accuracy', 'chord_accuracy', 'melody_accuracy',
+)
+
+
+@dataclass
+class StatsBundle:
+    """
+    Totals, distributions and metric sums for a list of sessions.
+
+    Built in one pass by compute_bundle(), so a report that needs many
+    statistics doesn't rescan the sessions for each one.
+    """
+    num_sessions: int = 0
+    total_seconds: float = 0
+    minutes_by_instrument: Dict[str, float] = field(default_factory=dict)
+    minutes_by_mode: Dict[str, float] = field(default_factory=dict)
+    practice_dates: Set[date] = field(default_factory=set)  # Non-demo sessions only
+    tunes: Set[str] = field(default_factory=set)
+    sessions_by_mode: Dict[str, List[PracticeSessionRecord]] = field(default_factory=dict)
+    # metric group (see compute_bundle()) -> metric -> [sum, count] of the non-None values
+    metrics_by_group: Dict[str, Dict[str, list]] = field(default_factory=dict)
+    # instrument -> metric -> [sum, count] of the non-None values
+    metrics_by_instrument: Dict[str, Dict[str, list]] = field(default_factory=dict)
+
+    @property
+    def total_minutes(self) -> float:
+        """Total minutes practiced (as compute_totals())."""
+        return self.total_seconds / 60.0
+
+    def average(
+        self,
+        metric_name: str,
+        group: Optional[str] = None,
+        instrument: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Average of a metric over a metric group's or an instrument's sessions.
+
+        Args:
+            metric_name: One of METRIC_FIELDS
+            group: Metric group to average over (default: all sessions)
+            instrument: If given, average over this instrument's sessions instead
+
+        Returns:
+            Average value of the metric, or None if no sessions have it
+        """
+        if instrument is not None:
+            groups = [self.metrics_by_instrument.get(instrument, {})]
+        elif group is None:
+            groups = list(self.metrics_by_group.values())
+        else:
+            groups = [self.metrics_by_group.get(group, {})]
+
+        total = 0
+        count = 0
+        for metrics in groups:
+            totals = metrics.get(metric_name)
+            if totals is not None:
+                total += totals[0]
+                count += totals[1]
+
+        if not count:
+            return None
+
+        return total / count
+
+
+def compute_bundle(
+    sessions: List[PracticeSessionRecord],
+    metric_group: Optional[Callable[[str], str]] = None
+) -> StatsBundle:
+    """
+    Compute a StatsBundle for sessions in a single pass.
+
+    Metric sums are kept per metric group, which is the session mode unless
+    metric_group maps modes to groups (e.g. every improv mode to "improv").
+    Each group's sums are taken in session order, so its averages match
+    compute_average_metrics() over the same sessions.
+
+    Args:
+        sessions: List of practice session records
+        metric_group: Maps a session mode to its metric group (default: the mode)
+
+    Returns:
+        StatsBundle over all the given sessions
+    """
+    bundle = StatsBundle()
+    seconds_by_instrument = defaultdict(float)
+    seconds_by_mode = defaultdict(float)
+    group_of_mode = {}
+
+    for session in sessions:
+        bundle.num_sessions += 1
+        bundle.total_seconds += session.duration_seconds
+        seconds_by_instrument[session.instrument] += session.duration_seconds
+        seconds_by_mode[session.mode] += session.duration_seconds
+
+        if session.source != "demo":
+            bundle.practice_dates.add(session.date)
+        if session.tune_id:
+            bundle.tunes.add(session.tune_id)
+
+        mode_sessions = bundle.sessions_by_mode.get(session.mode)
+        if mode_sessions is None:
+            bundle.sessions_by_mode[session.mode] = mode_sessions = []
+            group_of_mode[session.mode] = (
+                metric_group(session.mode) if metric_group else session.mode
+            )
+        mode_sessions.append(session)
+
+        by_group = bundle.metrics_by_group.setdefault(group_of_mode[session.mode], {})
+        by_instrument = bundle.metrics_by_instrument.setdefault(session.instrument, {})
+        for name in METRIC_FIELDS:
+            value = getattr(session, name)
+            if value is not None:
+                for metrics in (by_group, by_instrument):
+                    totals = metrics.get(name)
+                    if totals is None:
+                        metrics[name] = [value, 1]
+                    else:
+                        totals[0] += value
+                        totals[1] += 1
+
+    # Minutes are converted from the summed seconds, as compute_totals() does
+    bundle.minutes_by_instrument = {
+        instrument: seconds / 60.0 for instrument, seconds in seconds_by_instrument.items()
+    }
+    bundle.minutes_by_mode = {mode: seconds / 60.0 for mode, seconds in seconds_by_mode.items()}
+
+    return bundle
+
+
 def compute_totals(sessions: List[PracticeSessionRecord]) -> float:
     """
     Compute total minutes practiced across all sessions.
@@ -35,12 +173,13 @@ def compute_minutes_by_instrument(sessions: List[PracticeSessionRecord]) -> Dict
     Returns:
         Mapping of instrument name → minutes practiced
     """
-    minutes_by_instrument = defaultdict(float)
+    # Sum seconds and convert each total once
+    seconds_by_instrument = defaultdict(float)
 
     for session in sessions:
-        minutes_by_instrument[session.instrument] += session.duration_seconds / 60.0
+        seconds_by_instrument[session.instrument] += session.duration_seconds
 
-    return dict(minutes_by_instrument)
+    return {instrument: seconds / 60.0 for instrument, seconds in seconds_by_instrument.items()}
 
 
 def compute_minutes_by_mode(sessions: List[PracticeSessionRecord]) -> Dict[str, float]:
@@ -53,15 +192,20 @@ def compute_minutes_by_mode(sessions: List[PracticeSessionRecord]) -> Dict[str,
     Returns:
         Mapping of mode name → minutes practiced
     """
-    minutes_by_mode = defaultdict(float)
+    # Sum seconds and convert each total once
+    seconds_by_mode = defaultdict(float)
 
     for session in sessions:
-        minutes_by_mode[session.mode] += session.duration_seconds / 60.0
+        seconds_by_mode[session.mode] += session.duration_seconds
 
-    return dict(minutes_by_mode)
+    return {mode: seconds / 60.0 for mode, seconds in seconds_by_mode.items()}
 
 
-def compute_recent_streak(sessions: List[PracticeSessionRecord], days: int = 7) -> int:
+def compute_recent_streak(
+    sessions: List[PracticeSessionRecord],
+    days: int = 7,
+    now: Optional[datetime] = None
+) -> int:
     """
     Compute how many consecutive recent days have at least one non-demo session.
 
@@ -70,6 +214,7 @@ def compute_recent_streak(sessions: List[PracticeSessionRecord], days: int = 7)
     Args:
         sessions: List of practice session records
         days: Maximum number of days to look back
+        now: Current time to count back from (default: datetime.now())
 
     Returns:
         Number of consecutive days with practice (0 if no practice today/yesterday)
@@ -83,11 +228,27 @@ def compute_recent_streak(sessions: List[PracticeSessionRecord], days: int = 7)
     # Get dates with practice (as date objects, not datetime)
     practice_dates = set()
     for session in real_sessions:
-        session_date = datetime.fromisoformat(session.timestamp).date()
+        session_date = session.date
         practice_dates.add(session_date)
 
+    return count_streak(practice_dates, days, today=now.date() if now else None)
+
+
+def count_streak(practice_dates: Set[date], days: int = 7, today: Optional[date] = None) -> int:
+    """
+    Count consecutive days with practice, backwards from today.
+
+    Args:
+        practice_dates: Dates on which practice occurred
+        days: Maximum number of days to look back
+        today: Date to count back from (default: today)
+
+    Returns:
+        Number of consecutive days with practice (0 if no practice today)
+    """
     # Count backwards from today
-    today = datetime.now().date()
+    if today is None:
+        today = datetime.now().date()
     streak = 0
 
     for i in range(days):
@@ -104,7 +265,8 @@ def compute_recent_streak(sessions: List[PracticeSessionRecord], days: int = 7)
 def compute_average_metrics(
     sessions: List[PracticeSessionRecord],
     metric_name: str,
-    days: Optional[int] = None
+    days: Optional[int] = None,
+    now: Optional[datetime] = None
 ) -> Optional[float]:
     """
     Compute average value for a specific metric over sessions.
@@ -113,24 +275,28 @@ def compute_average_metrics(
         sessions: List of practice session records
         metric_name: Name of the metric field (e.g., "chord_tone_ratio")
         days: If specified, only include sessions from last N days
+        now: Current time for the days cutoff (default: datetime.now())
 
     Returns:
         Average value of the metric, or None if no sessions have this metric
     """
     # Filter by date if specified
     if days is not None:
-        cutoff = datetime.now() - timedelta(days=days)
+        cutoff = (now or datetime.now()) - timedelta(days=days)
         sessions = [
             s for s in sessions
-            if datetime.fromisoformat(s.timestamp) >= cutoff
+            if s.dt >= cutoff
         ]
 
-    # Collect metric values
-    values = []
-    for session in sessions:
-        value = getattr(session, metric_name, None)
-        if value is not None:
-            values.append(value)
+    # Collect metric values (a missing attribute counts as no value)
+    get_metric = operator.attrgetter(metric_name)
+    try:
+        values = [value for value in map(get_metric, sessions) if value is not None]
+    except AttributeError:
+        values = [
+            value for value in (getattr(s, metric_name, None) for s in sessions)
+            if value is not None
+        ]
 
     if not values:
         return None
@@ -144,7 +310,8 @@ def filter_sessions(
     mode: Optional[str] = None,
     tune_id: Optional[str] = None,
     source: Optional[str] = None,
-    since_days: Optional[int] = None
+    since_days: Optional[int] = None,
+    now: Optional[datetime] = None
 ) -> List[PracticeSessionRecord]:
     """
     Filter sessions by various criteria.
@@ -156,6 +323,7 @@ def filter_sessions(
         tune_id: Only include this tune (e.g., "autumn_leaves")
         source: Only include this source (e.g., "cli" to exclude demos)
         since_days: Only include sessions from last N days
+        now: Current time for the since_days cutoff (default: datetime.now())
 
     Returns:
         Filtered list of sessions
@@ -175,10 +343,10 @@ def filter_sessions(
         filtered = [s for s in filtered if s.source == source]
 
     if since_days is not None:
-        cutoff = datetime.now() - timedelta(days=since_days)
+        cutoff = (now or datetime.now()) - timedelta(days=since_days)
         filtered = [
             s for s in filtered
-            if datetime.fromisoformat(s.timestamp) >= cutoff
+            if s.dt >= cutoff
         ]
 
     return filtered
@@ -194,20 +362,17 @@ def get_most_practiced_tune(sessions: List[PracticeSessionRecord]) -> Optional[s
     Returns:
         Tune ID with most practice time, or None if no tunes practiced
     """
-    # Only consider sessions with tune_id
-    tune_sessions = [s for s in sessions if s.tune_id]
+    # Sum time by tune (only sessions with tune_id)
+    time_by_tune = defaultdict(float)
+    for session in sessions:
+        if session.tune_id:
+            time_by_tune[session.tune_id] += session.duration_seconds
 
-    if not tune_sessions:
+    if not time_by_tune:
         return None
 
-    # Sum time by tune
-    time_by_tune = defaultdict(float)
-    for session in tune_sessions:
-        time_by_tune[session.tune_id] += session.duration_seconds
-
-    # Find max
-    most_practiced = max(time_by_tune.items(), key=lambda x: x[1])
-    return most_practiced[0]
+    # Find max (ties go to the tune practiced first)
+    return max(time_by_tune, key=time_by_tune.__getitem__)
 
 
 def count_unique_tunes(sessions: List[PracticeSessionRecord]) -> int:
@@ -248,12 +413,11 @@ def compute_practice_days(sessions: List[PracticeSessionRecord]) -> int:
     Returns:
         Number of unique days with practice
     """
-    # Filter out demo sessions
-    real_sessions = [s for s in sessions if s.source != "demo"]
-
+    # Dates of the non-demo sessions
     practice_dates = {
-        datetime.fromisoformat(s.timestamp).date()
-        for s in real_sessions
+        s.date
+        for s in sessions
+        if s.source != "demo"
     }
 
     return len(practice_dates)
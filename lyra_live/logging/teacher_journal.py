@@ -6,12 +6,16 @@ using rule-based templates (no LLM required - deterministic and testable).
 """
 
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Optional
 from lyra_live.logging.practice_log import PracticeSessionRecord
 from lyra_live.logging import progress_stats
 
 
-def generate_teacher_entry(sessions: List[PracticeSessionRecord], days: int = 7) -> str:
+def generate_teacher_entry(
+    sessions: List[PracticeSessionRecord],
+    days: int = 7,
+    now: Optional[datetime] = None
+) -> str:
     """
     Generate a teacher's journal entry from recent practice sessions.
 
@@ -21,34 +25,38 @@ def generate_teacher_entry(sessions: List[PracticeSessionRecord], days: int = 7)
     Args:
         sessions: List of all practice session records
         days: Number of days to analyze (default: 7)
+        now: Time the entry is written at (default: datetime.now())
 
     Returns:
         Markdown-formatted teacher journal entry
     """
+    # One clock reading for the whole entry
+    if now is None:
+        now = datetime.now()
+
     # Filter to last N days and exclude demos
-    cutoff = datetime.now() - timedelta(days=days)
+    cutoff = now - timedelta(days=days)
     recent = [
         s for s in sessions
-        if datetime.fromisoformat(s.timestamp) >= cutoff and s.source != "demo"
+        if s.dt >= cutoff and s.source != "demo"
     ]
 
     if not recent:
         return f"# Practice Journal ({days}-Day Summary)\n\nNo practice sessions logged in the past {days} days.\n"
 
-    # Compute key stats
-    total_minutes = progress_stats.compute_totals(recent)
-    practice_days = progress_stats.compute_practice_days(recent)
-    streak = progress_stats.compute_recent_streak(sessions, days=days)
-    minutes_by_instrument = progress_stats.compute_minutes_by_instrument(recent)
-    minutes_by_mode = progress_stats.compute_minutes_by_mode(recent)
-    num_instruments = len(minutes_by_instrument)
-    num_tunes = progress_stats.count_unique_tunes(recent)
+    # Compute key stats (one pass over the recent sessions)
+    bundle = progress_stats.compute_bundle(recent, metric_group=_metric_group)
+    total_minutes = bundle.total_minutes
+    practice_days = len(bundle.practice_dates)
+    streak = progress_stats.compute_recent_streak(sessions, days=days, now=now)
+    minutes_by_instrument = bundle.minutes_by_instrument
+    minutes_by_mode = bundle.minutes_by_mode
 
     # Build the entry
     lines = []
     lines.append(f"# Practice Journal ({days}-Day Summary)")
     lines.append("")
-    lines.append(f"*{datetime.now().strftime('%B %d, %Y')}*")
+    lines.append(f"*{now.strftime('%B %d, %Y')}*")
     lines.append("")
 
     # === Consistency ===
@@ -80,26 +88,26 @@ def generate_teacher_entry(sessions: List[PracticeSessionRecord], days: int = 7)
 
     # By instrument
     lines.append("**By Instrument:**")
-    for instrument, minutes in sorted(minutes_by_instrument.items(), key=lambda x: -x[1]):
-        percentage = (minutes / total_minutes) * 100
-        lines.append(f"- {instrument.capitalize()}: {minutes:.1f} min ({percentage:.0f}%)")
+    lines.extend(
+        f"- {instrument.capitalize()}: {minutes:.1f} min ({(minutes / total_minutes) * 100:.0f}%)"
+        for instrument, minutes in sorted(minutes_by_instrument.items(), key=lambda x: -x[1])
+    )
     lines.append("")
 
     # By mode
     lines.append("**By Mode:**")
-    for mode, minutes in sorted(minutes_by_mode.items(), key=lambda x: -x[1]):
-        percentage = (minutes / total_minutes) * 100
-        mode_display = mode.replace('_', ' ').title()
-        lines.append(f"- {mode_display}: {minutes:.1f} min ({percentage:.0f}%)")
+    lines.extend(
+        f"- {mode.replace('_', ' ').title()}: {minutes:.1f} min ({(minutes / total_minutes) * 100:.0f}%)"
+        for mode, minutes in sorted(minutes_by_mode.items(), key=lambda x: -x[1])
+    )
     lines.append("")
 
     # === Strengths ===
     lines.append("## Strengths")
     lines.append("")
 
-    strengths = _identify_strengths(recent, minutes_by_instrument, minutes_by_mode)
-    for strength in strengths:
-        lines.append(f"- {strength}")
+    strengths = _identify_strengths(bundle)
+    lines.extend(f"- {strength}" for strength in strengths)
 
     if not strengths:
         lines.append("- Keep building your practice foundation!")
@@ -110,9 +118,8 @@ def generate_teacher_entry(sessions: List[PracticeSessionRecord], days: int = 7)
     lines.append("## Areas for Growth")
     lines.append("")
 
-    suggestions = _generate_suggestions(recent, minutes_by_instrument, minutes_by_mode, num_instruments, num_tunes)
-    for suggestion in suggestions:
-        lines.append(f"- {suggestion}")
+    suggestions = _generate_suggestions(bundle)
+    lines.extend(f"- {suggestion}" for suggestion in suggestions)
 
     if not suggestions:
         lines.append("- Excellent work! Keep up the balanced practice.")
@@ -132,46 +139,49 @@ def generate_teacher_entry(sessions: List[PracticeSessionRecord], days: int = 7)
     return '\n'.join(lines)
 
 
-def _identify_strengths(
-    sessions: List[PracticeSessionRecord],
-    minutes_by_instrument: dict,
-    minutes_by_mode: dict
-) -> List[str]:
+def _metric_group(mode: str) -> str:
+    """Metric group for a mode: all improvisation modes are averaged together."""
+    return 'improv' if 'improv' in mode else mode
+
+
+def _improv_modes(bundle: progress_stats.StatsBundle) -> List[str]:
+    """Modes in bundle that are improvisation modes."""
+    return [mode for mode in bundle.minutes_by_mode if 'improv' in mode]
+
+
+def _identify_strengths(bundle: progress_stats.StatsBundle) -> List[str]:
     """Identify strengths based on session data."""
     strengths = []
+    minutes_by_instrument = bundle.minutes_by_instrument
+    minutes_by_mode = bundle.minutes_by_mode
 
     # Check improvisation metrics
-    improv_sessions = [s for s in sessions if 'improv' in s.mode]
-    if improv_sessions:
-        avg_chord_tone = progress_stats.compute_average_metrics(improv_sessions, 'chord_tone_ratio')
-        avg_guide_tones = progress_stats.compute_average_metrics(improv_sessions, 'guide_tone_hits')
+    improv_modes = _improv_modes(bundle)
+    avg_chord_tone = bundle.average('chord_tone_ratio', group='improv')
+    avg_guide_tones = bundle.average('guide_tone_hits', group='improv')
 
-        if avg_chord_tone and avg_chord_tone >= 70:
-            strengths.append(f"Strong harmonic awareness - averaging {avg_chord_tone:.0f}% chord tones in improvisation")
+    if avg_chord_tone and avg_chord_tone >= 70:
+        strengths.append(f"Strong harmonic awareness - averaging {avg_chord_tone:.0f}% chord tones in improvisation")
 
-        if avg_guide_tones and avg_guide_tones >= 5:
-            strengths.append(f"Excellent guide-tone targeting ({avg_guide_tones:.1f} hits per chorus on average)")
+    if avg_guide_tones and avg_guide_tones >= 5:
+        strengths.append(f"Excellent guide-tone targeting ({avg_guide_tones:.1f} hits per chorus on average)")
 
     # Check rhythm metrics
-    rhythm_sessions = [s for s in sessions if s.mode == 'rhythm']
-    if rhythm_sessions:
-        avg_accuracy = progress_stats.compute_average_metrics(rhythm_sessions, 'rhythm_accuracy')
-        if avg_accuracy and avg_accuracy >= 85:
-            strengths.append(f"Solid rhythm accuracy ({avg_accuracy:.0f}%)")
+    avg_accuracy = bundle.average('rhythm_accuracy', group='rhythm')
+    if avg_accuracy and avg_accuracy >= 85:
+        strengths.append(f"Solid rhythm accuracy ({avg_accuracy:.0f}%)")
 
     # Check ear training metrics
-    interval_sessions = [s for s in sessions if s.mode == 'intervals']
-    if interval_sessions:
-        avg_interval_acc = progress_stats.compute_average_metrics(interval_sessions, 'interval_accuracy')
-        if avg_interval_acc and avg_interval_acc >= 80:
-            strengths.append(f"Strong interval recognition ({avg_interval_acc:.0f}% accuracy)")
+    avg_interval_acc = bundle.average('interval_accuracy', group='intervals')
+    if avg_interval_acc and avg_interval_acc >= 80:
+        strengths.append(f"Strong interval recognition ({avg_interval_acc:.0f}% accuracy)")
 
     # Check multi-instrument practice
     if len(minutes_by_instrument) >= 3:
         strengths.append(f"Great variety - practicing on {len(minutes_by_instrument)} different instruments")
 
     # Check improv focus
-    improv_minutes = sum(m for mode, m in minutes_by_mode.items() if 'improv' in mode)
+    improv_minutes = sum(minutes_by_mode[mode] for mode in improv_modes)
     if improv_minutes > 0:
         percentage = (improv_minutes / sum(minutes_by_mode.values())) * 100
         if percentage >= 40:
@@ -180,55 +190,48 @@ def _identify_strengths(
     return strengths
 
 
-def _generate_suggestions(
-    sessions: List[PracticeSessionRecord],
-    minutes_by_instrument: dict,
-    minutes_by_mode: dict,
-    num_instruments: int,
-    num_tunes: int
-) -> List[str]:
+def _generate_suggestions(bundle: progress_stats.StatsBundle) -> List[str]:
     """Generate suggestions for improvement."""
     suggestions = []
+    minutes_by_mode = bundle.minutes_by_mode
 
     # Check for lack of variety in instruments
-    if num_instruments == 1 and len(sessions) > 3:
+    if len(bundle.minutes_by_instrument) == 1 and bundle.num_sessions > 3:
         suggestions.append("Consider exploring other instruments to develop well-rounded musicianship")
 
     # Check for lack of variety in tunes
-    improv_sessions = [s for s in sessions if 'improv' in s.mode and s.tune_id]
-    if len(improv_sessions) > 5 and num_tunes == 1:
-        tune_id = improv_sessions[0].tune_id
-        suggestions.append(f"Try branching out from '{tune_id}' to practice different harmonic contexts")
+    improv_modes = _improv_modes(bundle)
+    if len(bundle.tunes) == 1:
+        num_improv_tune_sessions = sum(
+            1 for mode in improv_modes for s in bundle.sessions_by_mode[mode] if s.tune_id
+        )
+        if num_improv_tune_sessions > 5:
+            tune_id = next(iter(bundle.tunes))
+            suggestions.append(f"Try branching out from '{tune_id}' to practice different harmonic contexts")
 
     # Check voice intonation if applicable
-    voice_sessions = [s for s in sessions if s.instrument == 'voice']
-    if voice_sessions:
-        avg_cents = progress_stats.compute_average_metrics(voice_sessions, 'avg_cents_deviation')
-        if avg_cents and avg_cents > 30:
-            suggestions.append(f"Focus on intonation - current average deviation is {avg_cents:.0f} cents")
+    avg_cents = bundle.average('avg_cents_deviation', instrument='voice')
+    if avg_cents and avg_cents > 30:
+        suggestions.append(f"Focus on intonation - current average deviation is {avg_cents:.0f} cents")
 
     # Check rhythm timing
-    rhythm_sessions = [s for s in sessions if s.mode == 'rhythm']
-    if rhythm_sessions:
-        avg_accuracy = progress_stats.compute_average_metrics(rhythm_sessions, 'rhythm_accuracy')
-        if avg_accuracy and avg_accuracy < 70:
-            suggestions.append("Work on rhythm accuracy with slower tempos and metronome practice")
+    avg_accuracy = bundle.average('rhythm_accuracy', group='rhythm')
+    if avg_accuracy and avg_accuracy < 70:
+        suggestions.append("Work on rhythm accuracy with slower tempos and metronome practice")
 
-        avg_timing_error = progress_stats.compute_average_metrics(rhythm_sessions, 'avg_timing_error_ms')
-        if avg_timing_error and avg_timing_error > 50:
-            suggestions.append(f"Tighten timing precision (currently ±{avg_timing_error:.0f}ms on average)")
+    avg_timing_error = bundle.average('avg_timing_error_ms', group='rhythm')
+    if avg_timing_error and avg_timing_error > 50:
+        suggestions.append(f"Tighten timing precision (currently ±{avg_timing_error:.0f}ms on average)")
 
     # Check improvisation metrics
-    improv_sessions = [s for s in sessions if 'improv' in s.mode]
-    if improv_sessions:
-        avg_chord_tone = progress_stats.compute_average_metrics(improv_sessions, 'chord_tone_ratio')
-        avg_outside = progress_stats.compute_average_metrics(improv_sessions, 'outside_ratio')
+    avg_chord_tone = bundle.average('chord_tone_ratio', group='improv')
+    avg_outside = bundle.average('outside_ratio', group='improv')
 
-        if avg_chord_tone and avg_chord_tone < 50:
-            suggestions.append("Focus on targeting chord tones in your improvisation")
+    if avg_chord_tone and avg_chord_tone < 50:
+        suggestions.append("Focus on targeting chord tones in your improvisation")
 
-        if avg_outside and avg_outside > 40:
-            suggestions.append("Practice outlining chord changes more clearly before adding outside notes")
+    if avg_outside and avg_outside > 40:
+        suggestions.append("Practice outlining chord changes more clearly before adding outside notes")
 
     # Check ear training balance
     total_minutes = sum(minutes_by_mode.values())
@@ -5,7 +5,7 @@ Coordinates the flow of exercises, device input, validation, and feedback.
 This is the main orchestrator that ties together all components.
 """
 
-from lyra_live.devices.base import DeviceProfile, MIDIEvent
+from lyra_live.devices.base import DeviceProfile, MIDIEvent, monotonic_ms
 from lyra_live.ear_training.base import Exercise, ExerciseResult, Note
 from lyra_live.ear_training.intervals import IntervalExercise
 from lyra_live.ear_training.chords import ChordQualityExercise
@@ -16,25 +16,141 @@ from lyra_live.ableton_backend.client import AbletonMCPClient
 from lyra_live.lessons.core import Lesson
 from lyra_live.devices.test_device import TestDeviceProfile
 from lyra_live.devices.drum_kit import DrumKitProfile
-from lyra_live.logging.practice_log import PracticeSessionRecord, append_session
+from lyra_live.logging.practice_log import PracticeSessionRecord, append_sessions
+from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Callable, Iterable, List, Optional, Tuple
+import sys
 import time
 
 
+@dataclass
+class DrillSpec:
+    """What sets one listen-and-play-back drill apart from the others"""
+    noun: str  # What is played back: "interval", "chord", ...
+    note_duration_ms: int  # Duration given to the user's notes
+    timeout_ms: int  # How long to wait for the user's response
+    validate: Callable[[List[Note], List[Note]], ExerciseResult]  # (expected, played)
+    describe_notes: Callable[[Exercise], str]  # Text shown for what's played
+    item_name: str = "exercise"  # What one step of the drill is called
+    show_played: bool = False  # Show the user's notes with wrong answers
+
+
+_INTERVAL_DRILL = DrillSpec(
+    noun="interval",
+    note_duration_ms=1000,
+    timeout_ms=10000,
+    validate=ExerciseValidator.validate_interval,
+    describe_notes=lambda exercise: f"Exercise plays: {exercise.notes[0]} to {exercise.notes[1]}",
+    show_played=True
+)
+
+_CHORD_DRILL = DrillSpec(
+    noun="chord",
+    note_duration_ms=2000,
+    timeout_ms=10000,
+    validate=ExerciseValidator.validate_chord,
+    describe_notes=lambda exercise: f"Exercise plays: {', '.join([str(n.pitch) for n in exercise.notes])}"
+)
+
+_MELODY_DRILL = DrillSpec(
+    noun="melody",
+    note_duration_ms=500,
+    timeout_ms=15000,
+    validate=ExerciseValidator.validate_melody,
+    describe_notes=lambda exercise: f"Exercise plays: {' -> '.join([str(n.pitch) for n in exercise.notes])}"
+)
+
+_PHRASE_DRILL = DrillSpec(
+    noun="phrase",
+    note_duration_ms=500,
+    timeout_ms=15000,
+    validate=ExerciseValidator.validate_melody,
+    describe_notes=lambda exercise: f"Phrase plays: {' -> '.join([str(n.pitch) for n in exercise.notes])}",
+    item_name="phrase"
+)
+
+
+# Encouragement for a session's accuracy: the first band whose minimum
+# percentage is reached
+_FEEDBACK_BANDS = (
+    (100, "🌟 Perfect score! Excellent work!"),
+    (80, "🎵 Great job! You're developing a good ear."),
+    (60, "👍 Good progress! Keep practicing."),
+    (0, "💪 Keep practicing - you'll improve!"),
+)
+
+
+def _feedback_band_message(percentage: float) -> str:
+    """Encouragement message for a session accuracy percentage."""
+    for threshold, message in _FEEDBACK_BANDS:
+        if percentage >= threshold:
+            return message
+    return _FEEDBACK_BANDS[-1][1]
+
+
 class SessionManager:
     """Orchestrate practice sessions"""
 
-    def __init__(self, device: DeviceProfile, ableton_client: AbletonMCPClient):
+    # Logged sessions are buffered and written to the practice log together
+    # once this many are waiting or this many seconds have passed since the
+    # last write (and on close(), or leaving a with block)
+    LOG_BUFFER_MAX = 16
+    LOG_FLUSH_INTERVAL_S = 5.0
+
+    def __init__(self, device: DeviceProfile, ableton_client: AbletonMCPClient,
+                 verbose: bool = True):
         """
         Initialize session manager.
 
         Args:
             device: DeviceProfile for the MIDI device being used
             ableton_client: AbletonMCPClient for playing exercises
+            verbose: Also print the notes each exercise plays
         """
         self.device = device
         self.ableton = ableton_client
+        self.verbose = verbose
+
+        # The device never changes, so classify it once
+        self._instrument = _instrument_for_device(device)  # Logged instrument
+        self._is_test_device = isinstance(device, TestDeviceProfile)
+        self._is_drum_device = isinstance(device, DrumKitProfile)
+
+        # Practice session records not yet written to the log
+        self._log_buffer: List[PracticeSessionRecord] = []
+        self._last_log_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Write any buffered practice sessions to the log."""
+        self._flush_log()
+
+    def __enter__(self) -> 'SessionManager':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        # Also runs when a drill is cut short (e.g. KeyboardInterrupt)
+        self.close()
+
+    def __del__(self):
+        # A manager that was never closed still gets its sessions logged
+        if getattr(self, '_log_buffer', None):
+            self._flush_log()
+
+    def _flush_log(self) -> None:
+        """Append the buffered practice session records to the log."""
+        records = self._log_buffer
+        self._log_buffer = []
+        self._last_log_flush = time.monotonic()
+        if not records:
+            return
+
+        # Append to log (handles file creation, locking, etc.)
+        try:
+            append_sessions(records)
+        except Exception as e:
+            # Don't crash the session if logging fails
+            print(f"Warning: Failed to log practice session: {e}")
 
     def _log_session(
         self,
@@ -46,7 +162,8 @@ class SessionManager:
         """
         Log a practice session to the persistent log.
 
-        Helper method to create and append a PracticeSessionRecord.
+        Helper method to create a PracticeSessionRecord and buffer it for
+        appending (see LOG_BUFFER_MAX and close()).
 
         Args:
             mode: Session mode (e.g., "intervals", "chords", "improv_midi")
@@ -54,20 +171,16 @@ class SessionManager:
             source: Source of the session ("cli", "demo", "test")
             **kwargs: Additional fields for PracticeSessionRecord (metrics, tune_id, etc.)
         """
-        # Determine instrument from device
-        instrument = "unknown"
-        if self.device:
-            device_name = self.device.device_name.lower()
-            if "drum" in device_name or "donner" in device_name:
-                instrument = "drums"
-            elif "test" in device_name:
-                instrument = "test_device"
-            else:
-                instrument = "keyboard"  # Default for MIDI devices
-        else:
+        # Instrument comes from the device; a caller-given one is only used
+        # without a device
+        requested_instrument = kwargs.pop('instrument', None)
+        instrument = self._instrument
+        if instrument is None:
             # No device (e.g., audio improv)
             if mode == "improv_audio":
-                instrument = kwargs.get('instrument', 'sax')  # Could be sax or voice
+                instrument = requested_instrument or 'sax'  # Could be sax or voice
+            else:
+                instrument = "unknown"
 
         # Create record
         record = PracticeSessionRecord(
@@ -79,12 +192,10 @@ class SessionManager:
             **kwargs
         )
 
-        # Append to log (handles file creation, locking, etc.)
-        try:
-            append_session(record)
-        except Exception as e:
-            # Don't crash the session if logging fails
-            print(f"Warning: Failed to log practice session: {e}")
+        self._log_buffer.append(record)
+        if (len(self._log_buffer) >= self.LOG_BUFFER_MAX
+                or time.monotonic() - self._last_log_flush > self.LOG_FLUSH_INTERVAL_S):
+            self._flush_log()
 
     def run_interval_drill(self, num_exercises: int = 10):
         """
@@ -97,95 +208,31 @@ class SessionManager:
             num_exercises: Number of exercises to run in this session
         """
         start_time = time.time()
-        results = []
-
-        print(f"\n🎵 Starting Interval Recognition Drill")
-        print(f"   Device: {self.device.device_name}")
-        print(f"   Exercises: {num_exercises}")
-        print(f"   Instructions: Listen to each interval, then play it back on your device\n")
-
-        for i in range(num_exercises):
-            # Generate exercise
-            exercise = IntervalExercise.generate_random()
-
-            # Set expected answer for test device
-            if isinstance(self.device, TestDeviceProfile):
-                self.device.set_expected_answer(exercise.correct_response)
-
-            # Display exercise info
-            print(f"Exercise {i+1}/{num_exercises}:")
-            print(f"  Listen to the interval...")
-
-            # Play via Ableton (stubbed for MVP)
-            self.ableton.play_exercise(exercise)
-
-            # For MVP without Ableton integration, show the notes
-            print(f"  [Exercise plays: {exercise.notes[0]} to {exercise.notes[1]}]")
-
-            # Get user response
-            print(f"  Now play the interval on your device (or press Ctrl+C to skip)...")
-
-            try:
-                midi_events = self.device.detect_input(timeout_ms=10000)
-
-                if not midi_events:
-                    print(f"  ⏱️  No input detected. Moving to next exercise.\n")
-                    results.append(ExerciseResult(
-                        exercise_id=exercise.id,
-                        user_notes=[],
-                        correct=False,
-                        feedback="No input detected"
-                    ))
-                    continue
 
-                # Convert MIDI events to Notes (filter for note_on events)
-                user_notes = [
-                    Note(pitch=event.pitch, duration_ms=1000, velocity=event.velocity)
-                    for event in midi_events
-                    if event.type == 'note_on'
-                ]
-
-                # Validate
-                result = ExerciseValidator.validate_interval(
-                    exercise.correct_response,
-                    user_notes
-                )
-                result.exercise_id = exercise.id
-
-                # Display feedback
-                if result.correct:
-                    print(f"  ✓ {result.feedback}\n")
-                else:
-                    print(f"  ✗ {result.feedback}")
-                    print(f"    You played: {user_notes}\n")
-
-                results.append(result)
+        _write_lines(
+            f"\n🎵 Starting Interval Recognition Drill",
+            f"   Device: {self.device.device_name}",
+            f"   Exercises: {num_exercises}",
+            f"   Instructions: Listen to each interval, then play it back on your device\n"
+        )
 
-            except KeyboardInterrupt:
-                print("\n\n⏸️  Session paused by user.")
-                break
+        exercises = (
+            (f"Exercise {i+1}/{num_exercises}:", IntervalExercise.generate_random())
+            for i in range(num_exercises)
+        )
+        results, correct_count = self._run_drill(_INTERVAL_DRILL, exercises)
 
         # Session summary
-        correct_count = sum(1 for r in results if r.correct)
         total_attempted = len(results)
 
-        print(f"\n{'='*50}")
-        print(f"Session Complete!")
-        print(f"  Score: {correct_count}/{total_attempted} correct")
+        lines = [f"\n{'='*50}", f"Session Complete!", f"  Score: {correct_count}/{total_attempted} correct"]
         if total_attempted > 0:
             percentage = (correct_count / total_attempted) * 100
-            print(f"  Accuracy: {percentage:.1f}%")
-
-        if correct_count == total_attempted and total_attempted > 0:
-            print(f"  🌟 Perfect score! Excellent work!")
-        elif percentage >= 80:
-            print(f"  🎵 Great job! You're developing a good ear.")
-        elif percentage >= 60:
-            print(f"  👍 Good progress! Keep practicing.")
-        else:
-            print(f"  💪 Keep practicing - you'll improve!")
+            lines.append(f"  Accuracy: {percentage:.1f}%")
+            lines.append(f"  {_feedback_band_message(percentage)}")
 
-        print(f"{'='*50}\n")
+        lines.append(f"{'='*50}\n")
+        _write_lines(*lines)
 
         # Log session
         duration = time.time() - start_time
@@ -207,76 +254,21 @@ class SessionManager:
             num_exercises: Number of exercises to run
             chord_types: List of chord types to practice (default: all triads)
         """
-        results = []
-
-        print(f"\n🎵 Starting Chord Quality Recognition Drill")
-        print(f"   Device: {self.device.device_name}")
-        print(f"   Exercises: {num_exercises}")
-        print(f"   Instructions: Listen to each chord, then play it back on your device\n")
-
-        for i in range(num_exercises):
-            # Generate exercise
-            exercise = ChordQualityExercise.generate_random(chord_types=chord_types)
-
-            # Set expected answer for test device
-            if isinstance(self.device, TestDeviceProfile):
-                self.device.set_expected_answer(exercise.correct_response)
-
-            # Display exercise info
-            print(f"Exercise {i+1}/{num_exercises}:")
-            print(f"  Listen to the chord...")
-
-            # Play via Ableton (stubbed for MVP)
-            self.ableton.play_exercise(exercise)
-
-            # For MVP without Ableton integration, show the notes
-            chord_pitches = [str(n.pitch) for n in exercise.notes]
-            print(f"  [Exercise plays: {', '.join(chord_pitches)}]")
-
-            # Get user response
-            print(f"  Now play the chord on your device (or press Ctrl+C to skip)...")
-
-            try:
-                midi_events = self.device.detect_input(timeout_ms=10000)
-
-                if not midi_events:
-                    print(f"  ⏱️  No input detected. Moving to next exercise.\n")
-                    results.append(ExerciseResult(
-                        exercise_id=exercise.id,
-                        user_notes=[],
-                        correct=False,
-                        feedback="No input detected"
-                    ))
-                    continue
-
-                # Convert MIDI events to Notes
-                user_notes = [
-                    Note(pitch=event.pitch, duration_ms=2000, velocity=event.velocity)
-                    for event in midi_events
-                    if event.type == 'note_on'
-                ]
-
-                # Validate
-                result = ExerciseValidator.validate_chord(
-                    exercise.correct_response,
-                    user_notes
-                )
-                result.exercise_id = exercise.id
-
-                # Display feedback
-                if result.correct:
-                    print(f"  ✓ {result.feedback}\n")
-                else:
-                    print(f"  ✗ {result.feedback}\n")
-
-                results.append(result)
+        _write_lines(
+            f"\n🎵 Starting Chord Quality Recognition Drill",
+            f"   Device: {self.device.device_name}",
+            f"   Exercises: {num_exercises}",
+            f"   Instructions: Listen to each chord, then play it back on your device\n"
+        )
 
-            except KeyboardInterrupt:
-                print("\n\n⏸️  Session paused by user.")
-                break
+        exercises = (
+            (f"Exercise {i+1}/{num_exercises}:", ChordQualityExercise.generate_random(chord_types=chord_types))
+            for i in range(num_exercises)
+        )
+        results, correct_count = self._run_drill(_CHORD_DRILL, exercises)
 
         # Session summary
-        self._print_session_summary(results, "Chord Quality")
+        self._print_session_summary(results, correct_count, "Chord Quality")
 
         return results
 
@@ -288,76 +280,21 @@ class SessionManager:
             num_exercises: Number of exercises to run
             melody_length: Number of notes per melody phrase
         """
-        results = []
-
-        print(f"\n🎵 Starting Melody Imitation Drill")
-        print(f"   Device: {self.device.device_name}")
-        print(f"   Exercises: {num_exercises}")
-        print(f"   Instructions: Listen to each melody, then play it back exactly\n")
-
-        for i in range(num_exercises):
-            # Generate exercise
-            exercise = MelodyImitationExercise.generate_random(length=melody_length)
-
-            # Set expected answer for test device
-            if isinstance(self.device, TestDeviceProfile):
-                self.device.set_expected_answer(exercise.correct_response)
-
-            # Display exercise info
-            print(f"Exercise {i+1}/{num_exercises}:")
-            print(f"  Listen to the melody...")
-
-            # Play via Ableton (stubbed for MVP)
-            self.ableton.play_exercise(exercise)
-
-            # For MVP without Ableton integration, show the notes
-            melody_pitches = [str(n.pitch) for n in exercise.notes]
-            print(f"  [Exercise plays: {' -> '.join(melody_pitches)}]")
-
-            # Get user response
-            print(f"  Now play the melody on your device (or press Ctrl+C to skip)...")
-
-            try:
-                midi_events = self.device.detect_input(timeout_ms=15000)
-
-                if not midi_events:
-                    print(f"  ⏱️  No input detected. Moving to next exercise.\n")
-                    results.append(ExerciseResult(
-                        exercise_id=exercise.id,
-                        user_notes=[],
-                        correct=False,
-                        feedback="No input detected"
-                    ))
-                    continue
-
-                # Convert MIDI events to Notes
-                user_notes = [
-                    Note(pitch=event.pitch, duration_ms=500, velocity=event.velocity)
-                    for event in midi_events
-                    if event.type == 'note_on'
-                ]
-
-                # Validate
-                result = ExerciseValidator.validate_melody(
-                    exercise.correct_response,
-                    user_notes
-                )
-                result.exercise_id = exercise.id
-
-                # Display feedback
-                if result.correct:
-                    print(f"  ✓ {result.feedback}\n")
-                else:
-                    print(f"  ✗ {result.feedback}\n")
-
-                results.append(result)
+        _write_lines(
+            f"\n🎵 Starting Melody Imitation Drill",
+            f"   Device: {self.device.device_name}",
+            f"   Exercises: {num_exercises}",
+            f"   Instructions: Listen to each melody, then play it back exactly\n"
+        )
 
-            except KeyboardInterrupt:
-                print("\n\n⏸️  Session paused by user.")
-                break
+        exercises = (
+            (f"Exercise {i+1}/{num_exercises}:", MelodyImitationExercise.generate_random(length=melody_length))
+            for i in range(num_exercises)
+        )
+        results, correct_count = self._run_drill(_MELODY_DRILL, exercises)
 
         # Session summary
-        self._print_session_summary(results, "Melody Imitation")
+        self._print_session_summary(results, correct_count, "Melody Imitation")
 
         return results
 
@@ -370,8 +307,6 @@ class SessionManager:
             phrase_ids: Optional list of specific phrase IDs to practice
                        If None, practices all phrases
         """
-        results = []
-
         # Determine which phrases to practice
         if phrase_ids:
             phrases = [lesson.get_phrase(pid) for pid in phrase_ids]
@@ -383,40 +318,73 @@ class SessionManager:
             print("No phrases to practice.")
             return []
 
-        print(f"\n🎵 Practicing Lesson: {lesson.title}")
-        if lesson.artist:
-            print(f"   Artist: {lesson.artist}")
-        print(f"   Device: {self.device.device_name}")
-        print(f"   Phrases: {len(phrases)}")
-        print(f"   Instructions: Listen to each phrase, then play it back exactly\n")
+        artist_lines = [f"   Artist: {lesson.artist}"] if lesson.artist else []
+        _write_lines(
+            f"\n🎵 Practicing Lesson: {lesson.title}",
+            *artist_lines,
+            f"   Device: {self.device.device_name}",
+            f"   Phrases: {len(phrases)}",
+            f"   Instructions: Listen to each phrase, then play it back exactly\n"
+        )
+
+        exercises = (
+            (f"Phrase {i+1}/{len(phrases)}: {phrase.description or phrase.id}", phrase.to_exercise())
+            for i, phrase in enumerate(phrases)
+        )
+        results, correct_count = self._run_drill(_PHRASE_DRILL, exercises)
 
-        for i, phrase in enumerate(phrases):
-            # Convert phrase to exercise
-            exercise = phrase.to_exercise()
+        # Session summary
+        self._print_session_summary(results, correct_count, f"Lesson: {lesson.title}")
 
+        return results
+
+    def _run_drill(
+        self,
+        spec: DrillSpec,
+        exercises: Iterable[Tuple[str, Exercise]]
+    ) -> Tuple[List[ExerciseResult], int]:
+        """
+        Run the exercises of a listen-and-play-back drill.
+
+        Plays each exercise, captures the user's response, validates it and
+        shows feedback; the drill itself prints the header and summary.
+
+        Args:
+            spec: How this kind of drill prompts, listens and validates
+            exercises: (label, exercise) per exercise, in order; generated
+                lazily so each is only created when it's reached
+
+        Returns:
+            (exercise results, number correct); stops early if paused by
+            the user
+        """
+        results = []
+        correct_count = 0
+
+        for label, exercise in exercises:
             # Set expected answer for test device
-            if isinstance(self.device, TestDeviceProfile):
+            if self._is_test_device:
                 self.device.set_expected_answer(exercise.correct_response)
 
-            # Display phrase info
-            print(f"Phrase {i+1}/{len(phrases)}: {phrase.description or phrase.id}")
-            print(f"  Listen to the phrase...")
+            # Display exercise info
+            _write_lines(label, f"  Listen to the {spec.noun}...")
 
             # Play via Ableton (stubbed for MVP)
             self.ableton.play_exercise(exercise)
 
-            # For MVP without Ableton integration, show the notes
-            phrase_pitches = [str(n.pitch) for n in exercise.notes]
-            print(f"  [Phrase plays: {' -> '.join(phrase_pitches)}]")
-
-            # Get user response
-            print(f"  Now play the phrase on your device (or press Ctrl+C to skip)...")
+            # For MVP without Ableton integration, show the notes (only
+            # described when they're shown) and ask for the user's response
+            prompt = f"  Now play the {spec.noun} on your device (or press Ctrl+C to skip)..."
+            if self.verbose:
+                _write_lines(f"  [{spec.describe_notes(exercise)}]", prompt)
+            else:
+                _write_lines(prompt)
 
             try:
-                midi_events = self.device.detect_input(timeout_ms=15000)
+                midi_events = self.device.detect_input(timeout_ms=spec.timeout_ms)
 
                 if not midi_events:
-                    print(f"  ⏱️  No input detected. Moving to next phrase.\n")
+                    print(f"  ⏱️  No input detected. Moving to next {spec.item_name}.\n")
                     results.append(ExerciseResult(
                         exercise_id=exercise.id,
                         user_notes=[],
@@ -425,65 +393,50 @@ class SessionManager:
                     ))
                     continue
 
-                # Convert MIDI events to Notes
-                user_notes = [
-                    Note(pitch=event.pitch, duration_ms=500, velocity=event.velocity)
-                    for event in midi_events
-                    if event.type == 'note_on'
-                ]
+                # Convert MIDI events to Notes (filter for note_on events)
+                user_notes = _notes_from_events(midi_events, duration_ms=spec.note_duration_ms)
 
                 # Validate
-                result = ExerciseValidator.validate_melody(
-                    exercise.correct_response,
-                    user_notes
-                )
+                result = spec.validate(exercise.correct_response, user_notes)
                 result.exercise_id = exercise.id
 
                 # Display feedback
                 if result.correct:
                     print(f"  ✓ {result.feedback}\n")
+                elif spec.show_played:
+                    _write_lines(f"  ✗ {result.feedback}", f"    You played: {user_notes}\n")
                 else:
                     print(f"  ✗ {result.feedback}\n")
 
                 results.append(result)
+                correct_count += result.correct
 
             except KeyboardInterrupt:
                 print("\n\n⏸️  Session paused by user.")
                 break
 
-        # Session summary
-        self._print_session_summary(results, f"Lesson: {lesson.title}")
-
-        return results
+        return results, correct_count
 
-    def _print_session_summary(self, results: List[ExerciseResult], session_type: str):
+    def _print_session_summary(self, results: List[ExerciseResult], correct_count: int,
+                               session_type: str):
         """
         Print session summary with statistics.
 
         Args:
             results: List of exercise results
+            correct_count: How many of the results are correct
             session_type: Type of session for display
         """
-        correct_count = sum(1 for r in results if r.correct)
         total_attempted = len(results)
 
-        print(f"\n{'='*50}")
-        print(f"{session_type} Session Complete!")
-        print(f"  Score: {correct_count}/{total_attempted} correct")
+        lines = [f"\n{'='*50}", f"{session_type} Session Complete!", f"  Score: {correct_count}/{total_attempted} correct"]
         if total_attempted > 0:
             percentage = (correct_count / total_attempted) * 100
-            print(f"  Accuracy: {percentage:.1f}%")
-
-            if correct_count == total_attempted:
-                print(f"  🌟 Perfect score! Excellent work!")
-            elif percentage >= 80:
-                print(f"  🎵 Great job! You're developing a good ear.")
-            elif percentage >= 60:
-                print(f"  👍 Good progress! Keep practicing.")
-            else:
-                print(f"  💪 Keep practicing - you'll improve!")
+            lines.append(f"  Accuracy: {percentage:.1f}%")
+            lines.append(f"  {_feedback_band_message(percentage)}")
 
-        print(f"{'='*50}\n")
+        lines.append(f"{'='*50}\n")
+        _write_lines(*lines)
 
     def run_rhythm_snare_drill(
         self,
@@ -502,7 +455,7 @@ class SessionManager:
         Returns:
             RhythmResult with timing analysis
         """
-        if not isinstance(self.device, DrumKitProfile):
+        if not self._is_drum_device:
             print("Error: This drill requires a drum kit device profile")
             return None
 
@@ -524,16 +477,10 @@ class SessionManager:
         # Calculate duration
         duration_ms = exercise.grid.get_duration_ms()
 
-        print(f"Ready? Starting in 3...")
-        time.sleep(1)
-        print("2...")
-        time.sleep(1)
-        print("1...")
-        time.sleep(1)
-        print("GO!\n")
+        _count_in()
 
-        # Record start time
-        start_time = time.time() * 1000
+        # Record start time (on the clock MIDI events are stamped with)
+        start_time = monotonic_ms()
 
         # Capture drum hits
         midi_events = self.device.detect_input(timeout_ms=duration_ms + 1000)
@@ -598,7 +545,7 @@ class SessionManager:
         Returns:
             RhythmResult with timing analysis
         """
-        if not isinstance(self.device, DrumKitProfile):
+        if not self._is_drum_device:
             print("Error: This drill requires a drum kit device profile")
             return None
 
@@ -632,16 +579,10 @@ class SessionManager:
         # Calculate duration
         duration_ms = exercise.grid.get_duration_ms()
 
-        print(f"Ready? Starting in 3...")
-        time.sleep(1)
-        print("2...")
-        time.sleep(1)
-        print("1...")
-        time.sleep(1)
-        print("GO!\n")
+        _count_in()
 
-        # Record start time
-        start_time = time.time() * 1000
+        # Record start time (on the clock MIDI events are stamped with)
+        start_time = monotonic_ms()
 
         # Capture drum hits
         midi_events = self.device.detect_input(timeout_ms=duration_ms + 1000)
@@ -1156,7 +1097,7 @@ class SessionManager:
         This method orchestrates the complete audio-based improvisation workflow:
         1. Sets up Ableton playback of the backing track
         2. Records audio from microphone during playback
-        3. Analyzes pitch over time from the recording
+        3. Analyzes pitch over time while the audio is recorded
         4. Converts pitch curve to ImprovNotes
         5. Runs harmonic/rhythmic analysis
         6. Returns detailed analysis results
@@ -1169,8 +1110,8 @@ class SessionManager:
         Returns:
             List of ImprovAnalysisResult objects (one per chorus analyzed)
         """
-        from lyra_live.improv.audio_capture import AudioCapture, SimulatedAudioCapture
-        from lyra_live.improv.audio_to_improv import audio_to_improv_chorus
+        from lyra_live.improv.audio_capture import AudioCapture, SimulatedAudioCapture, print_progress
+        from lyra_live.improv.audio_to_improv import record_to_improv_chorus
         from lyra_live.improv.analysis import analyze_improvisation
         from pathlib import Path
 
@@ -1219,6 +1160,15 @@ class SessionManager:
             print(f"   Choruses: {chorus_count}")
             print(f"   Duration: {duration:.1f} seconds\n")
 
+            # Refuse over-long sessions up front, before the backing track
+            # starts, rather than failing in capture.record()
+            max_duration = capture.max_duration_seconds
+            if max_duration is not None and duration > max_duration:
+                print(f"❌ Error: {chorus_count} choruses need {duration:.0f}s of recording, "
+                      f"over the {max_duration:.0f}s limit")
+                print("   Try fewer choruses\n")
+                return []
+
             # Get MIDI path for backing track
             midi_path = tune.get_full_midi_path(Path.cwd())
 
@@ -1245,13 +1195,17 @@ class SessionManager:
             else:
                 print("⚠️  Ableton not available - recording without backing track\n")
 
-            # Record audio
+            # Record audio, detecting pitch as it comes in
             print(f"🎤 Recording audio for {duration:.1f} seconds...")
             print("   Start playing now!\n")
 
-            audio_path = capture.record(duration)
-
-            print(f"\n✓ Recording saved to: {audio_path}\n")
+            chorus = record_to_improv_chorus(
+                capture,
+                tune,
+                duration,
+                chorus_number=1,
+                progress_cb=print_progress
+            )
 
             # Stop Ableton playback
             if self.ableton and self.ableton.health_check():
@@ -1259,14 +1213,6 @@ class SessionManager:
                 # For now, playback will end naturally
                 pass
 
-            # Convert audio to ImprovChorus
-            print("🎵 Analyzing recorded audio...")
-            chorus = audio_to_improv_chorus(
-                str(audio_path),
-                tune,
-                chorus_number=1
-            )
-
             print(f"\n📊 Analysis complete: {len(chorus.notes)} notes detected\n")
 
             # Analyze improvisation
@@ -1276,3 +1222,75 @@ class SessionManager:
             result.print_summary()
 
             return [result]
+
+
+def _write_lines(*lines: str) -> None:
+    """
+    Print lines to stdout with a single write.
+
+    Flushes, so a prompt is shown before the session waits for input even
+    when stdout isn't a terminal.
+    """
+    sys.stdout.write('\n'.join(lines) + '\n')
+    sys.stdout.flush()
+
+
+def _count_in(seconds: int = 3) -> None:
+    """
+    Count down to the start of a recording, one number per second.
+
+    Each line is due at a fixed time from the first, so time spent
+    printing doesn't add up and "GO!" comes exactly `seconds` later.
+    """
+    start = time.monotonic()
+    for n in range(seconds, 0, -1):
+        _write_lines(f"Ready? Starting in {n}..." if n == seconds else f"{n}...")
+        time.sleep(max(0.0, start + (seconds - n + 1) - time.monotonic()))
+    _write_lines("GO!\n")
+
+
+def _notes_from_events(midi_events: List[MIDIEvent], duration_ms: int) -> List[Note]:
+    """
+    Notes played in a list of MIDI events (its note_on events).
+
+    Args:
+        midi_events: Events from detect_input()
+        duration_ms: Duration to give every note
+
+    Returns:
+        One Note per note_on event, in order
+    """
+    # Positional arguments: keyword calls cost noticeably more per Note
+    return [
+        Note(event.pitch, duration_ms, event.velocity)
+        for event in midi_events
+        if event.type == 'note_on'
+    ]
+
+
+def _instrument_for_device(device: Optional[DeviceProfile]) -> Optional[str]:
+    """
+    Instrument name to log for sessions on a device.
+
+    Drum kit and test device profiles are recognised by type; other
+    devices by name ("drum"/"donner" for drums, "test" for test devices),
+    defaulting to keyboard.
+
+    Returns:
+        Instrument name, or None without a device
+    """
+    if not device:
+        return None
+
+    if isinstance(device, DrumKitProfile):
+        return "drums"
+    if isinstance(device, TestDeviceProfile):
+        return "test_device"
+
+    device_name = getattr(device, 'device_name', '').lower()
+    if "drum" in device_name or "donner" in device_name:
+        return "drums"
+    elif "test" in device_name:
+        return "test_device"
+    else:
+        return "keyboard"  # Default for MIDI devices
@@ -5,8 +5,9 @@ Manages tune metadata, backing tracks, and chord changes.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import Iterable, List, Dict, Optional, Tuple
 from pathlib import Path
+from bisect import bisect_right
 import yaml
 import json
 
@@ -72,10 +73,9 @@ class StandardTune:
         Returns:
             Chord symbol or None if not found
         """
-        if not self.chord_changes:
-            return None
-
-        # Find the active chord at this time
+        # Changes are listed in time order, so stop at the first one after
+        # this position. Nothing is cached, so in-place edits to
+        # chord_changes are always seen
         current_chord = None
         for change in self.chord_changes:
             if change.bar > bar:
@@ -86,6 +86,44 @@ class StandardTune:
 
         return current_chord
 
+    def get_chords_at_times(self, positions: Iterable[Tuple[int, float]]) -> List[Optional[str]]:
+        """
+        Get the chord symbol at each of many bar/beat positions.
+
+        Equivalent to calling get_chord_at_time() per position, but for
+        positions in time order (as notes in a solo usually are) it walks
+        the changes once instead of searching for every position.
+
+        Args:
+            positions: (bar, beat) pairs, bar 0-indexed and beat 1.0-based
+
+        Returns:
+            Chord symbol (or None) for each position, in order
+        """
+        if not self.chord_changes:
+            return [None for _ in positions]
+
+        # Sorted once per call rather than cached, so in-place edits to
+        # chord_changes are always seen
+        changes = sorted(self.chord_changes, key=lambda c: (c.bar, c.beat))
+        keys = [(c.bar, c.beat) for c in changes]
+        symbols = [c.chord_symbol for c in changes]
+        num_changes = len(keys)
+
+        chords = []
+        i = 0
+        previous = None
+        for position in positions:
+            if previous is not None and position >= previous:
+                while i < num_changes and keys[i] <= position:
+                    i += 1
+            else:
+                i = bisect_right(keys, position)
+            chords.append(symbols[i - 1] if i else None)
+            previous = position
+
+        return chords
+
     def get_chords_in_range(self, start_bar: int, end_bar: int) -> List[ChordChange]:
         """
         Get all chord changes within a bar range.
@@ -307,11 +307,6 @@ def detect_pitch_over_time(
     if not audio_path.exists():
         raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-    # Create aubio pitch detector
-    pitch_detector = aubio.pitch(method, buffer_size, hop_size, sample_rate)
-    pitch_detector.set_unit("midi")
-    pitch_detector.set_silence(-40)  # dB threshold for silence
-
     # Read the WAV file
     with wave.open(str(audio_path), 'rb') as wf:
         # Verify it's mono
@@ -322,11 +317,63 @@ def detect_pitch_over_time(
         num_frames = wf.getnframes()
         audio_bytes = wf.readframes(num_frames)
 
-        # Convert to numpy array
-        # Most WAV files are 16-bit int
-        audio_samples = np.frombuffer(audio_bytes, dtype=np.int16)
-        # Convert to float32 in range [-1.0, 1.0]
-        audio_samples = audio_samples.astype(np.float32) / 32768.0
+    # View the bytes as int16 without copying (most WAV files are 16-bit)
+    audio_samples = np.frombuffer(audio_bytes, dtype=np.int16)
+
+    return detect_pitch_in_samples(
+        audio_samples, sample_rate, buffer_size, hop_size, method, min_confidence
+    )
+
+
+def detect_pitch_in_samples(
+    audio_samples,
+    sample_rate: int = 44100,
+    buffer_size: int = 2048,
+    hop_size: int = 512,
+    method: str = "yinfft",
+    min_confidence: float = 0.6
+) -> List[PitchReading]:
+    """
+    Detect pitch over time from audio samples already in memory.
+
+    Lets callers that hold the audio buffer skip the WAV encode/decode
+    round trip of detect_pitch_over_time().
+
+    Args:
+        audio_samples: Mono numpy array, either int16 PCM or float in [-1.0, 1.0]
+        sample_rate: Audio sample rate of the samples
+        buffer_size: Size of analysis buffer
+        hop_size: Number of samples between analyses
+        method: Pitch detection method (yinfft, yin, mcomb, fcomb, schmitt)
+        min_confidence: Minimum confidence for valid detection
+
+    Returns:
+        List of PitchReading objects with timestamps
+
+    Raises:
+        ImportError: If aubio is not installed
+    """
+    try:
+        import aubio
+        import numpy as np
+    except ImportError as e:
+        raise ImportError(
+            f"Pitch detection requires aubio: {e}\n"
+            "Install with: pip install aubio"
+        )
+
+    # aubio needs float32; int16 PCM is converted with a single copy and
+    # scaled in place to the range [-1.0, 1.0], other float input only cast
+    if audio_samples.dtype == np.int16:
+        audio_samples = audio_samples.astype(np.float32)
+        audio_samples *= 1.0 / 32768.0
+    elif audio_samples.dtype != np.float32:
+        audio_samples = audio_samples.astype(np.float32)
+
+    # Create aubio pitch detector
+    pitch_detector = aubio.pitch(method, buffer_size, hop_size, sample_rate)
+    pitch_detector.set_unit("midi")
+    pitch_detector.set_silence(-40)  # dB threshold for silence
 
     # Process audio in chunks
     readings: List[PitchReading] = []
@@ -343,24 +390,116 @@ def detect_pitch_over_time(
         # Calculate timestamp in milliseconds
         timestamp_ms = int((i / sample_rate) * 1000)
 
-        # Convert MIDI to frequency
-        if midi_pitch > 0 and confidence >= min_confidence:
-            frequency = 440.0 * (2.0 ** ((midi_pitch - 69) / 12.0))
-            pitch_int = int(round(midi_pitch))
-
-            readings.append(PitchReading(
-                frequency=frequency,
-                pitch=pitch_int,
-                confidence=confidence,
-                timestamp_ms=timestamp_ms
-            ))
-        else:
-            # No valid pitch detected (silence, noise, etc.)
-            readings.append(PitchReading(
-                frequency=0.0,
-                pitch=None,
-                confidence=confidence,
-                timestamp_ms=timestamp_ms
-            ))
+        readings.append(_make_reading(midi_pitch, confidence, timestamp_ms, min_confidence))
 
     return readings
+
+
+def _make_reading(
+    midi_pitch: float,
+    confidence: float,
+    timestamp_ms: int,
+    min_confidence: float
+) -> PitchReading:
+    """Build a PitchReading from one aubio detection."""
+    # Convert MIDI to frequency
+    if midi_pitch > 0 and confidence >= min_confidence:
+        frequency = 440.0 * (2.0 ** ((midi_pitch - 69) / 12.0))
+        pitch_int = int(round(midi_pitch))
+
+        return PitchReading(
+            frequency=frequency,
+            pitch=pitch_int,
+            confidence=confidence,
+            timestamp_ms=timestamp_ms
+        )
+
+    # No valid pitch detected (silence, noise, etc.)
+    return PitchReading(
+        frequency=0.0,
+        pitch=None,
+        confidence=confidence,
+        timestamp_ms=timestamp_ms
+    )
+
+
+class PitchTracker:
+    """
+    Incremental pitch detection over 16-bit PCM arriving in chunks.
+
+    Lets pitch detection run while audio is still being recorded, instead
+    of after the whole file has been written. Chunks need not be aligned
+    to the hop size; leftover samples are carried into the next feed().
+    As in detect_pitch_in_samples(), a hop is only analyzed once at least
+    one sample follows it, so the readings match the batch ones.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 44100,
+        buffer_size: int = 2048,
+        hop_size: int = 512,
+        method: str = "yinfft",
+        min_confidence: float = 0.6
+    ):
+        """
+        Initialize the tracker.
+
+        Args:
+            sample_rate: Sample rate of the incoming audio (Hz)
+            buffer_size: Size of analysis buffer
+            hop_size: Number of samples between analyses
+            method: Pitch detection method (yinfft, yin, mcomb, fcomb, schmitt)
+            min_confidence: Minimum confidence for valid detection
+        """
+        try:
+            import aubio
+            import numpy as np
+        except ImportError as e:
+            raise ImportError(
+                f"Pitch detection requires aubio: {e}\n"
+                "Install with: pip install aubio"
+            )
+
+        self.sample_rate = sample_rate
+        self.hop_size = hop_size
+        self.min_confidence = min_confidence
+
+        self.pitch_detector = aubio.pitch(method, buffer_size, hop_size, sample_rate)
+        self.pitch_detector.set_unit("midi")
+        self.pitch_detector.set_silence(-40)  # dB threshold for silence
+
+        self.readings: List[PitchReading] = []
+        self._pending = np.zeros(0, dtype=np.float32)
+        self._samples_done = 0
+
+    def feed(self, pcm: bytes) -> None:
+        """
+        Analyze a chunk of mono 16-bit PCM, appending to self.readings.
+
+        Args:
+            pcm: Raw little-endian int16 sample bytes
+        """
+        import numpy as np
+
+        samples = np.frombuffer(pcm, dtype=np.int16).astype(np.float32)
+        samples *= 1.0 / 32768.0
+        if len(self._pending):
+            samples = np.concatenate((self._pending, samples))
+
+        # Hold back the last full hop until more audio arrives, matching
+        # the batch loop's range(0, num_samples - hop_size, hop_size)
+        hop_size = self.hop_size
+        usable = max(0, (len(samples) - 1) // hop_size * hop_size)
+
+        for i in range(0, usable, hop_size):
+            midi_pitch = self.pitch_detector(samples[i:i + hop_size])[0]
+            confidence = self.pitch_detector.get_confidence()
+            timestamp_ms = int((self._samples_done / self.sample_rate) * 1000)
+
+            self.readings.append(
+                _make_reading(midi_pitch, confidence, timestamp_ms, self.min_confidence)
+            )
+            self._samples_done += hop_size
+
+        self._pending = samples[usable:]
@@ -10,6 +10,7 @@ from lyra_live.devices.test_device import TestDeviceProfile
 from lyra_live.sessions.manager import SessionManager
 from lyra_live.ableton_backend.client import AbletonMCPClient
 from lyra_live.lessons.core import Lesson, LessonPhrase
+from lyra_live.standards.core import StandardTune
 from lyra_live.ear_training.base import Note
 
 
@@ -190,3 +191,50 @@ def test_melody_length_variation(ableton_client):
         results = manager.run_melody_drill(num_exercises=2, melody_length=length)
         assert len(results) == 2
         assert all(r.correct for r in results)
+
+
+def test_session_instrument_from_device(ableton_client):
+    """Test that the logged instrument is classified from the device"""
+    from lyra_live.devices.drum_kit import DrumKitProfile
+    from lyra_live.devices.test_device import TestDrumKitProfile
+
+    assert SessionManager(TestDeviceProfile(), ableton_client)._instrument == "test_device"
+    assert SessionManager(TestDrumKitProfile(), ableton_client)._instrument == "drums"
+    assert SessionManager(DrumKitProfile("Alesis Nitro"), ableton_client)._instrument == "drums"
+    assert SessionManager(None, ableton_client)._instrument is None
+
+
+def test_quiet_session_hides_exercise_notes(ableton_client, capsys):
+    """Test that a non-verbose session doesn't print the exercise notes"""
+    random.seed(900)
+
+    manager = SessionManager(TestDeviceProfile(mode="correct"), ableton_client, verbose=False)
+    results = manager.run_chord_drill(num_exercises=3)
+
+    assert all(r.correct for r in results)
+    output = capsys.readouterr().out
+    assert "Exercise plays" not in output
+    assert "Now play the chord" in output
+
+
+def test_empty_interval_session(ableton_client):
+    """Test that an interval session with no exercises completes"""
+    device = TestDeviceProfile(mode="correct")
+    manager = SessionManager(device, ableton_client)
+
+    assert manager.run_interval_drill(num_exercises=0) == []
+
+
+def test_improv_audio_session_too_long(ableton_client, monkeypatch, capsys):
+    """Test an audio session over the recording cap stops before playback starts"""
+    calls = []
+    monkeypatch.setattr(ableton_client, 'health_check', lambda: calls.append('health_check') or True)
+    monkeypatch.setattr(ableton_client, 'play_standard', lambda *args, **kwargs: calls.append('play'))
+
+    # 6 choruses of a 32-bar tune at 70 BPM run about 658s
+    tune = StandardTune(id="slow", title="Slow Tune", tempo=70, chorus_length_bars=32)
+    with SessionManager(None, ableton_client) as manager:
+        assert manager.run_improv_audio_session(tune, chorus_count=6) == []
+
+    assert calls == []
+    assert "600s limit" in capsys.readouterr().out
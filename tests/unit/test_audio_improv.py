@@ -5,13 +5,20 @@ Tests the complete pipeline from pitch detection → ImprovNote conversion → a
 """
 
 import pytest
+import sys
+import threading
+import time
+import types
+import wave
 from pathlib import Path
 from lyra_live.voice.pitch import PitchReading
 from lyra_live.improv.audio_to_improv import (
     group_pitch_readings_into_notes,
+    group_pitch_track_into_notes,
     calculate_bar_and_beat,
     pitch_readings_to_improv_notes
 )
+from lyra_live.improv import audio_capture
 from lyra_live.improv.audio_capture import AudioCapture, SimulatedAudioCapture
 from lyra_live.improv.test_utils import AudioImprovGenerator
 from lyra_live.improv.analysis import analyze_improvisation
@@ -123,6 +130,65 @@ class TestPitchReadingGrouping:
         # Should skip the silent readings and group valid ones
         assert len(notes) >= 1
 
+    def test_note_without_cents_before_silence(self):
+        """Test a note with no usable cents data ending in silence"""
+        readings = [
+            PitchReading(frequency=0.0, pitch=69, confidence=0.5, timestamp_ms=t)
+            for t in range(0, 200, 10)
+        ]
+        readings.append(PitchReading(frequency=0.0, pitch=None, confidence=0.1, timestamp_ms=200))
+
+        notes = group_pitch_readings_into_notes(readings, min_duration_ms=100)
+
+        assert len(notes) == 1
+        assert notes[0]['duration_ms'] == 190
+        assert notes[0]['cents_offset'] == 0.0
+        assert notes[0]['confidence'] == pytest.approx(0.5)
+
+    def test_note_averages(self):
+        """Test cents are averaged over usable samples and confidence over all"""
+        from lyra_live.voice.pitch import midi_to_frequency
+
+        readings = [
+            PitchReading(frequency=midi_to_frequency(69.10), pitch=69, confidence=0.6, timestamp_ms=0),
+            PitchReading(frequency=0.0, pitch=69, confidence=0.9, timestamp_ms=50),
+            PitchReading(frequency=midi_to_frequency(68.80), pitch=69, confidence=0.9, timestamp_ms=100),
+        ]
+
+        notes = group_pitch_readings_into_notes(readings, min_duration_ms=100)
+
+        assert len(notes) == 1
+        assert notes[0]['cents_offset'] == pytest.approx(-5.0)
+        assert notes[0]['confidence'] == pytest.approx(0.8)
+
+    def test_group_pitch_track_matches_readings(self):
+        """Test grouping a raw pitch track gives the same notes as PitchReadings"""
+        from lyra_live.voice.pitch import midi_to_frequency
+
+        midi_pitches = [60.1] * 15 + [0.0] * 3 + [64.3] * 12 + [64.6] * 12 + [67.0] * 4
+        confidences = [0.9] * 20 + [0.3] + [0.9] * 25
+        timestamps = [i * 10 for i in range(len(midi_pitches))]
+
+        readings = []
+        for m, c, t in zip(midi_pitches, confidences, timestamps):
+            if m > 0 and c >= 0.6:
+                readings.append(PitchReading(
+                    frequency=midi_to_frequency(m), pitch=int(round(m)), confidence=c, timestamp_ms=t
+                ))
+            else:
+                readings.append(PitchReading(frequency=0.0, pitch=None, confidence=c, timestamp_ms=t))
+
+        expected = group_pitch_readings_into_notes(readings, min_duration_ms=50)
+        notes = group_pitch_track_into_notes(midi_pitches, confidences, timestamps, min_duration_ms=50)
+
+        assert [n['pitch'] for n in notes] == [60, 64, 65]
+        assert len(notes) == len(expected)
+        for note, exp in zip(notes, expected):
+            assert note['start_time_ms'] == exp['start_time_ms']
+            assert note['duration_ms'] == exp['duration_ms']
+            assert note['cents_offset'] == pytest.approx(exp['cents_offset'])
+            assert note['confidence'] == pytest.approx(exp['confidence'])
+
 
 class TestBarBeatCalculation:
     """Test bar and beat position calculations"""
@@ -299,6 +365,50 @@ class TestAudioImprovAnalysis:
         assert result_outside.harmonic_stats.outside_ratio > result_inside.harmonic_stats.outside_ratio
 
 
+class _FakeStream:
+    """pyaudio callback stream delivering preset PCM from its own thread"""
+
+    def __init__(self, pcm, chunk_bytes, callback, on_call, interval_s=0.0):
+        self._active = True
+
+        def run():
+            try:
+                for start in range(0, len(pcm), chunk_bytes):
+                    on_call()
+                    _, flag = callback(pcm[start:start + chunk_bytes], 0, {}, 0)
+                    if flag != _PA_CONTINUE:
+                        break
+                    time.sleep(interval_s)
+            finally:
+                self._active = False
+
+        self._thread = threading.Thread(target=run)
+        self._thread.start()
+
+    def is_active(self):
+        return self._active
+
+    def stop_stream(self):
+        self._thread.join()
+
+    def close(self):
+        pass
+
+
+_PA_CONTINUE = 0
+
+
+def _fake_pyaudio(pyaudio_class) -> types.ModuleType:
+    """Stand-in pyaudio module with the given PyAudio class"""
+    module = types.ModuleType('pyaudio')
+    module.paInt16 = 8
+    module.paContinue = _PA_CONTINUE
+    module.paComplete = 1
+    module.paAbort = 2
+    module.PyAudio = pyaudio_class
+    return module
+
+
 class TestAudioCapture:
     """Test audio capture functionality"""
 
@@ -353,6 +463,208 @@ class TestAudioCapture:
         import os
         os.unlink(audio_path)
 
+    def test_simulated_audio_capture_length(self, tmp_path):
+        """Test silent audio spanning several write blocks has the right length"""
+        import wave
+        sim_capture = SimulatedAudioCapture(sample_rate=22050, channels=3)
+
+        audio_path = sim_capture.record(duration_seconds=1.5, output_path=tmp_path / "silence.wav")
+
+        with wave.open(str(audio_path), 'rb') as wf:
+            assert wf.getnchannels() == 3
+            assert wf.getnframes() == 33075
+            assert wf.readframes(wf.getnframes()) == bytes(33075 * 3 * 2)
+
+    def test_max_duration_rejected(self, tmp_path):
+        """Test recordings longer than the cap are refused before any file is written"""
+        sim_capture = SimulatedAudioCapture(max_duration_seconds=5.0)
+
+        with pytest.raises(ValueError):
+            sim_capture.record(duration_seconds=5.5, output_path=tmp_path / "long.wav")
+        assert not (tmp_path / "long.wav").exists()
+
+        # Ten minutes by default; None lifts the cap
+        with pytest.raises(ValueError):
+            SimulatedAudioCapture(sample_rate=100).record(duration_seconds=658.0)
+        unbounded = SimulatedAudioCapture(sample_rate=100, max_duration_seconds=None)
+        assert unbounded.record(duration_seconds=900.0, output_path=tmp_path / "jam.wav").exists()
+
+    def test_simulated_audio_capture_on_chunk(self, tmp_path):
+        """Test chunks handed to on_chunk add up to the recorded audio"""
+        sim_capture = SimulatedAudioCapture(sample_rate=44100)
+        chunks = []
+
+        audio_path = sim_capture.record(
+            duration_seconds=2.0, output_path=tmp_path / "take.wav", on_chunk=chunks.append
+        )
+
+        assert len(chunks) > 1
+        assert sum(len(c) for c in chunks) == 44100 * 2 * 2
+
+        # Replaying a pre-set file streams the same audio
+        replayed = []
+        sim_capture.set_simulated_audio(audio_path)
+        sim_capture.record(duration_seconds=2.0, on_chunk=replayed.append)
+        assert b''.join(replayed) == b''.join(chunks)
+
+    def test_record_streams_to_file(self, tmp_path, monkeypatch):
+        """Test that the callback only buffers and this thread writes the WAV as audio arrives"""
+        output_path = tmp_path / "take.wav"
+        pcm = bytes(range(256)) * 400  # 51200 bytes, more than 1s at 8kHz
+        sizes_seen_by_audio_thread = []
+
+        class FakePyAudio:
+            def get_sample_size(self, format):
+                return 2
+
+            def open(self, frames_per_buffer, stream_callback, **kwargs):
+                return _FakeStream(
+                    pcm, frames_per_buffer * 2, stream_callback,
+                    lambda: sizes_seen_by_audio_thread.append(output_path.stat().st_size),
+                    interval_s=0.05
+                )
+
+            def terminate(self):
+                pass
+
+        monkeypatch.setitem(sys.modules, 'pyaudio', _fake_pyaudio(FakePyAudio))
+
+        chunks = []
+        chunk_threads = set()
+
+        def on_chunk(data):
+            chunks.append(data)
+            chunk_threads.add(threading.get_ident())
+
+        capture = AudioCapture(sample_rate=8000)
+        audio_path = capture.record(1.0, output_path=output_path, on_chunk=on_chunk)
+
+        # The file grew while the stream was still running
+        assert any(0 < size < 16000 for size in sizes_seen_by_audio_thread)
+        assert len(chunks) > 1
+        assert chunk_threads == {threading.get_ident()}
+        assert b''.join(chunks) == pcm[:16000]
+        with wave.open(str(audio_path), 'rb') as wf:
+            assert wf.getframerate() == 8000
+            assert wf.readframes(wf.getnframes()) == pcm[:16000]
+
+    def test_record_overrun(self, tmp_path, monkeypatch):
+        """Test that audio outrunning the ring buffer stops the recording with an error"""
+        pcm = bytes(4000)
+
+        class FakePyAudio:
+            def get_sample_size(self, format):
+                return 2
+
+            def open(self, frames_per_buffer, stream_callback, **kwargs):
+                return _FakeStream(pcm, 2000, stream_callback, lambda: None)
+
+            def terminate(self):
+                pass
+
+        monkeypatch.setitem(sys.modules, 'pyaudio', _fake_pyaudio(FakePyAudio))
+        monkeypatch.setattr(audio_capture, '_RING_SECONDS', 0.1)  # 1600 bytes at 8kHz
+
+        with pytest.raises(OSError, match="not saved fast enough"):
+            AudioCapture(sample_rate=8000).record(0.25, output_path=tmp_path / "take.wav")
+
+
+
+def _fake_aubio() -> types.ModuleType:
+    """Stand-in aubio module whose detector reads each hop's first int16 sample as its MIDI pitch"""
+
+    class FakePitch:
+        def __init__(self, method, buffer_size, hop_size, sample_rate):
+            self._confidence = 0.0
+
+        def set_unit(self, unit):
+            pass
+
+        def set_silence(self, silence):
+            pass
+
+        def __call__(self, chunk):
+            midi_pitch = round(float(chunk[0]) * 32768.0)
+            self._confidence = 1.0 if midi_pitch > 0 else 0.0
+            return [float(midi_pitch)]
+
+        def get_confidence(self):
+            return self._confidence
+
+    module = types.ModuleType('aubio')
+    module.pitch = FakePitch
+    return module
+
+
+def _melody_pcm(np, pitches, hops_per_pitch, hop_size=512) -> bytes:
+    """Mono int16 PCM holding each pitch value for hops_per_pitch hops"""
+    samples = np.repeat(np.array(pitches, dtype=np.int16), hops_per_pitch * hop_size)
+    return samples.tobytes()
+
+
+class TestStreamingPitchDetection:
+    """Test pitch detection on audio arriving in chunks (aubio mocked)"""
+
+    def test_tracker_matches_batch_detection(self, monkeypatch):
+        """Test PitchTracker gives the batch readings whatever the chunking"""
+        np = pytest.importorskip("numpy")
+        monkeypatch.setitem(sys.modules, 'aubio', _fake_aubio())
+        from lyra_live.voice.pitch import PitchTracker, detect_pitch_in_samples
+
+        pcm = _melody_pcm(np, [60, 0, 64, 67], hops_per_pitch=5)
+        expected = detect_pitch_in_samples(np.frombuffer(pcm, dtype=np.int16))
+        # The batch loop leaves out the final full hop
+        assert len(expected) == 19
+
+        for chunk_bytes in (1024, 1000, 3 * 1024 + 2, len(pcm)):
+            tracker = PitchTracker()
+            for start in range(0, len(pcm), chunk_bytes):
+                tracker.feed(pcm[start:start + chunk_bytes])
+            assert tracker.readings == expected
+
+    def test_detect_pitch_in_float_samples(self, monkeypatch):
+        """Test float input in [-1.0, 1.0] is used as is and only int16 is rescaled"""
+        np = pytest.importorskip("numpy")
+        monkeypatch.setitem(sys.modules, 'aubio', _fake_aubio())
+        from lyra_live.voice.pitch import detect_pitch_in_samples
+
+        samples = np.frombuffer(_melody_pcm(np, [60, 0, 64], hops_per_pitch=4), dtype=np.int16)
+        expected = detect_pitch_in_samples(samples)
+        assert [r.pitch for r in expected if r.pitch] == [60] * 4 + [64] * 3
+
+        for dtype in (np.float32, np.float64):
+            floats = samples.astype(dtype) / 32768.0
+            assert detect_pitch_in_samples(floats) == expected
+
+    def test_record_to_improv_chorus(self, tmp_path, monkeypatch):
+        """Test recording and analyzing in one pass gives the same notes as the file pipeline"""
+        np = pytest.importorskip("numpy")
+        monkeypatch.setitem(sys.modules, 'aubio', _fake_aubio())
+        from lyra_live.improv.audio_to_improv import audio_to_improv_chorus, record_to_improv_chorus
+
+        source = tmp_path / "solo.wav"
+        with wave.open(str(source), 'wb') as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(44100)
+            wf.writeframes(_melody_pcm(np, [60, 0, 64, 0, 67], hops_per_pitch=20))
+
+        tune = StandardTune(
+            id="test", title="Test", tempo=120,
+            chord_changes=[ChordChange(0, 1.0, "C7", 4.0)]
+        )
+        capture = SimulatedAudioCapture()
+        capture.set_simulated_audio(source)
+
+        chorus = record_to_improv_chorus(
+            capture, tune, duration_seconds=1.0, output_path=tmp_path / "take.wav"
+        )
+
+        assert (tmp_path / "take.wav").read_bytes() == source.read_bytes()
+        assert [n.pitch for n in chorus.notes] == [60, 64, 67]
+        assert all(n.chord_at_time == "C7" for n in chorus.notes)
+        assert chorus.notes == audio_to_improv_chorus(str(source), tune).notes
+
 
 class TestAudioImprovGeneratorTests:
     """Test synthetic audio improvisation generator"""
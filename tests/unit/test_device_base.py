@@ -2,8 +2,12 @@
 Unit tests for device profile base classes and data structures.
 """
 
+import mido
 import pytest
-from lyra_live.devices.base import DeviceCapabilities, MIDIEvent, DeviceProfile
+import threading
+from lyra_live.devices.base import DeviceCapabilities, MIDIEvent, DeviceProfile, monotonic_ms
+from lyra_live.devices.generic_keyboard import GenericKeyboardProfile
+from lyra_live.devices.midi_input import MIDIInputBuffer
 
 
 def test_device_capabilities_defaults():
@@ -58,3 +62,57 @@ def test_midi_event_defaults():
     assert event.pitch is None
     assert event.velocity is None
     assert event.timestamp_ms == 0
+
+
+def test_monotonic_ms():
+    """Test the MIDI event clock"""
+    first = monotonic_ms()
+    second = monotonic_ms()
+
+    assert isinstance(first, int)
+    assert second >= first
+
+
+def test_midi_input_buffer():
+    """Test MIDI input buffer ordering, bounds and timeouts"""
+    buffer = MIDIInputBuffer("Test Port", maxlen=3)
+    assert buffer.get(0.01) is None
+
+    for note in range(60, 65):
+        buffer.receive(mido.Message('note_on', note=note, velocity=80))
+
+    # Oldest messages are dropped once the buffer is full
+    notes = [buffer.get(0)[1].note for _ in range(3)]
+    assert notes == [62, 63, 64]
+    assert buffer.get(0) is None
+
+    buffer.receive(mido.Message('note_on', note=60, velocity=80))
+    buffer.clear()
+    assert buffer.get(0) is None
+
+
+def test_keyboard_detect_input_from_buffer():
+    """Test that keyboard input is read from the background buffer"""
+    keyboard = GenericKeyboardProfile("Test Port")
+    keyboard.input_buffer._port = object()  # Treat the port as open
+
+    # Played before listening: not part of the answer
+    keyboard.input_buffer.receive(mido.Message('note_on', note=48, velocity=80))
+
+    def play():
+        keyboard.input_buffer.receive(mido.Message('note_on', note=60, velocity=80))
+        keyboard.input_buffer.receive(mido.Message('note_on', note=64, velocity=90))
+
+    timer = threading.Timer(0.05, play)
+    timer.start()
+    events = keyboard.detect_input(timeout_ms=2000)
+    timer.join()
+
+    assert [(e.type, e.pitch, e.velocity) for e in events] == [
+        ('note_on', 60, 80),
+        ('note_on', 64, 90),
+    ]
+    assert all(e.timestamp_ms <= monotonic_ms() for e in events)
+
+    # Nothing played: times out
+    assert keyboard.detect_input(timeout_ms=20) is None
@@ -0,0 +1,177 @@
+"""
+Unit tests for lessons: MIDI loading, phrase extraction and lookups.
+"""
+
+import pytest
+import mido
+from lyra_live.ear_training.base import Note
+from lyra_live.lessons.core import Lesson, LessonPack, LessonPhrase
+from lyra_live.lessons.midi_loader import (
+    load_midi_file, _load_midi_file_mido, slice_into_phrases, create_lesson_pack_from_dir
+)
+
+
+def _write_midi(path, tracks, ticks_per_beat=480):
+    """Save a MIDI file with one track per list of messages."""
+    mid = mido.MidiFile(ticks_per_beat=ticks_per_beat)
+    for messages in tracks:
+        track = mido.MidiTrack()
+        track.extend(messages)
+        mid.tracks.append(track)
+    mid.save(str(path))
+    return path
+
+
+def test_load_midi_file_notes(tmp_path):
+    """Test notes are paired by pitch with durations at 120 BPM"""
+    path = _write_midi(tmp_path / "melody.mid", [[
+        mido.MetaMessage('track_name', name='Melody'),
+        mido.Message('note_on', note=60, velocity=90, time=0),
+        mido.Message('note_off', note=60, time=480),
+        mido.Message('control_change', control=64, value=127, time=0),
+        mido.Message('note_on', note=64, velocity=80, time=0),
+        mido.Message('note_on', note=67, velocity=70, time=240),
+        mido.Message('note_on', note=64, velocity=0, time=240),  # note_on with velocity 0 ends a note
+        mido.Message('note_off', note=67, time=960),
+        mido.Message('note_on', note=72, velocity=60, time=0),
+        mido.Message('note_off', note=72, time=10),  # Very short: clamped to 100ms
+    ]])
+
+    notes = load_midi_file(str(path))
+
+    assert [(n.pitch, n.duration_ms, n.velocity) for n in notes] == [
+        (60, 500, 90),
+        (64, 500, 80),
+        (67, 1250, 70),
+        (72, 100, 60),
+    ]
+
+
+def test_load_midi_file_matches_mido(tmp_path):
+    """Test the byte-level reader agrees with the mido reader on every track"""
+    melody = []
+    for i in range(40):
+        pitch = 60 + (i * 5) % 12
+        melody.append(mido.Message('note_on', note=pitch, velocity=64 + i % 40, channel=i % 3, time=i % 7 * 30))
+        if i % 5 == 0:
+            melody.append(mido.Message('sysex', data=[1, 2, 3], time=0))
+            melody.append(mido.MetaMessage('set_tempo', tempo=400000, time=0))
+        melody.append(mido.Message('note_off', note=pitch, time=120 + i))
+    bass = [
+        mido.Message('program_change', program=32, time=0),
+        mido.Message('note_on', note=36, velocity=100, time=0),
+        mido.Message('pitchwheel', pitch=1000, time=100),
+        mido.Message('note_off', note=36, time=860),
+    ]
+    path = _write_midi(tmp_path / "song.mid", [[mido.MetaMessage('track_name', name='Conductor')], melody, bass],
+                       ticks_per_beat=96)
+
+    for track_index in range(-3, 3):
+        assert load_midi_file(str(path), track_index) == _load_midi_file_mido(str(path), track_index)
+
+    # Negative indexes count from the end
+    assert load_midi_file(str(path), -1) == load_midi_file(str(path), 2)
+
+
+def test_load_midi_file_errors(tmp_path):
+    """Test missing files and tracks raise ValueError"""
+    path = _write_midi(tmp_path / "one_track.mid", [[mido.Message('note_on', note=60, velocity=90)]])
+
+    with pytest.raises(ValueError, match="Track 1 not found"):
+        load_midi_file(str(path), track_index=1)
+    for load in (load_midi_file, _load_midi_file_mido):
+        with pytest.raises(ValueError, match="Track -2 not found"):
+            load(str(path), track_index=-2)
+
+    with pytest.raises(ValueError, match="Could not load MIDI file"):
+        load_midi_file(str(tmp_path / "missing.mid"))
+
+    not_midi = tmp_path / "not_midi.mid"
+    not_midi.write_bytes(b"RIFF....WAVE")
+    with pytest.raises(ValueError, match="Could not load MIDI file"):
+        load_midi_file(str(not_midi))
+
+
+def test_slice_into_phrases():
+    """Test phrase starts, overlap and the short-tail rule"""
+    notes = list(range(20))
+
+    assert slice_into_phrases(notes, 8) == [notes[0:8], notes[8:16], notes[16:20]]
+    # A tail shorter than half a phrase is still kept as its own phrase
+    assert slice_into_phrases(notes[:17], 8) == [notes[0:8], notes[8:16], notes[16:17]]
+    assert slice_into_phrases(notes[:10], 8, overlap=4) == [notes[0:8], notes[4:10], notes[8:10]]
+    assert slice_into_phrases(notes[:3], 8) == [notes[0:3]]
+    assert slice_into_phrases([], 8) == []
+    assert slice_into_phrases(notes, 0) == []
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_create_lesson_pack_from_dir(tmp_path, max_workers):
+    """Test one lesson per MIDI file, ordered by file name"""
+    for name, pitch in [("b_tune", 62), ("a_tune", 60), ("c_tune", 64)]:
+        _write_midi(tmp_path / f"{name}.mid", [[
+            mido.Message('note_on', note=pitch, velocity=90, time=0),
+            mido.Message('note_off', note=pitch, time=480),
+        ]])
+    (tmp_path / "notes.txt").write_text("not a MIDI file")
+
+    pack = create_lesson_pack_from_dir(str(tmp_path), "pack", "Pack",
+                                       difficulty="beginner", max_workers=max_workers)
+
+    assert [lesson.id for lesson in pack.lessons] == ["a_tune", "b_tune", "c_tune"]
+    assert pack.get_lesson("b_tune").title == "b tune"
+    assert pack.get_lesson("b_tune").phrases[0].notes[0].pitch == 62
+    assert pack.get_lessons_by_difficulty("beginner") == pack.lessons
+
+
+def test_lesson_get_phrase():
+    """Test phrase lookup by ID follows added and replaced phrases"""
+    first = LessonPhrase(id="p1", notes=[Note(60, 500)])
+    lesson = Lesson(id="l1", title="Test", phrases=[first])
+
+    assert lesson.get_phrase("p1") is first
+    assert lesson.get_phrase("p2") is None
+
+    second = LessonPhrase(id="p2", notes=[Note(62, 500)])
+    lesson.add_phrase(second)
+    assert lesson.get_phrase("p2") is second
+
+    # Duplicate IDs resolve to the earliest phrase
+    lesson.add_phrase(LessonPhrase(id="p1", notes=[Note(64, 500)]))
+    assert lesson.get_phrase("p1") is first
+
+    lesson.phrases = [second]
+    assert lesson.get_phrase("p1") is None
+
+    # Replacing a phrase in place is seen by the next lookup
+    third = LessonPhrase(id="p3", notes=[Note(65, 500)])
+    lesson.phrases[0] = third
+    assert lesson.get_phrase("p3") is third
+    assert lesson.get_phrase("p2") is None
+
+
+def test_lesson_pack_lookups():
+    """Test lesson lookup by ID and difficulty"""
+    easy = Lesson(id="a", title="A", difficulty="beginner")
+    hard = Lesson(id="b", title="B", difficulty="advanced")
+    pack = LessonPack(id="pack", title="Pack", lessons=[easy, hard])
+
+    assert pack.get_lesson("b") is hard
+    assert pack.get_lesson("missing") is None
+    assert pack.get_lessons_by_difficulty("beginner") == [easy]
+    assert pack.get_lessons_by_difficulty("intermediate") == []
+
+    medium = Lesson(id="c", title="C")
+    pack.add_lesson(medium)
+    assert pack.get_lesson("c") is medium
+    assert pack.get_lessons_by_difficulty("intermediate") == [medium]
+
+    # Returned lists are copies
+    pack.get_lessons_by_difficulty("beginner").clear()
+    assert pack.get_lessons_by_difficulty("beginner") == [easy]
+
+    # In-place edits are seen by the next lookup
+    hard.difficulty = "beginner"
+    assert pack.get_lessons_by_difficulty("beginner") == [easy, hard]
+    pack.lessons[0] = medium
+    assert pack.get_lesson("a") is None
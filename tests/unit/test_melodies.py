@@ -89,6 +89,18 @@ def test_melody_validation_length_mismatch():
     assert accuracy < 1.0
 
 
+def test_melody_validation_skipped_note_aligns():
+    """Test that a skipped note doesn't mark every later note wrong"""
+    expected = [Note(60, 500), Note(62, 500), Note(64, 500), Note(65, 500), Note(67, 500)]
+    # Skipped 62, added a stray note at the end
+    actual = [Note(60, 500), Note(64, 500), Note(65, 500), Note(67, 500), Note(72, 500)]
+
+    is_perfect, accuracy = MelodyImitationExercise.validate_sequence(expected, actual)
+
+    assert is_perfect is False
+    assert accuracy == 0.8  # 4 of 5 notes aligned
+
+
 def test_invalid_pattern():
     """Test that invalid pattern raises error"""
     with pytest.raises(ValueError):
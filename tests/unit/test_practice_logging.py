@@ -4,13 +4,23 @@ Unit tests for Phase 5: Practice Logging & Progress Tracking.
 Tests logging, stats computation, journal generation, and gamification.
 """
 
+import copy
+import fcntl
+import json
+import math
+import pickle
 import pytest
+import sys
 from datetime import datetime, timedelta
 from pathlib import Path
 from lyra_live.logging.practice_log import (
     PracticeSessionRecord,
     append_session,
+    append_sessions,
+    count_sessions,
+    get_log_path,
     load_sessions,
+    load_sessions_since,
     clear_log
 )
 from lyra_live.logging import progress_stats, gamification
@@ -153,6 +163,41 @@ class TestPracticeLog:
         assert sessions[0].mode == "intervals"
         assert sessions[0].interval_accuracy == 80.0
 
+    def test_record_parsed_timestamp(self):
+        """Test the cached dt/date follow the timestamp and stay out of to_dict()"""
+        record = PracticeSessionRecord(
+            timestamp="2026-01-09T10:30:00",
+            mode="intervals",
+            instrument="keyboard",
+            duration_seconds=600
+        )
+
+        assert record.dt == datetime(2026, 1, 9, 10, 30)
+        assert record.date == datetime(2026, 1, 9).date()
+
+        record.timestamp = "2026-01-10T08:00:00"
+        assert record.dt == datetime(2026, 1, 10, 8, 0)
+        assert record.date == datetime(2026, 1, 10).date()
+
+        data = record.to_dict()
+        assert '_parsed' not in data
+        assert PracticeSessionRecord.from_dict(data) == record
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_record_slots(self):
+        """Test records carry no per-instance __dict__ but still copy and pickle"""
+        record = PracticeSessionRecord(
+            timestamp="2026-01-09T10:30:00",
+            mode="intervals",
+            instrument="keyboard",
+            duration_seconds=600
+        )
+        assert record.date == datetime(2026, 1, 9).date()
+
+        assert not hasattr(record, '__dict__')
+        assert copy.deepcopy(record) == record
+        assert pickle.loads(pickle.dumps(record)) == record
+
     def test_multiple_sessions(self, clean_log, sample_sessions):
         """Test loading multiple sessions"""
         # Append all sample sessions
@@ -163,6 +208,146 @@ class TestPracticeLog:
         loaded = load_sessions()
         assert len(loaded) == len(sample_sessions)
 
+    def test_append_sessions_batch(self, clean_log, sample_sessions, monkeypatch):
+        """Test appending several sessions in one write"""
+        append_session(sample_sessions[0])
+        append_sessions(sample_sessions[1:])
+        append_sessions([])
+
+        assert load_sessions() == sample_sessions
+
+        # Every batch, small or large, is written under the lock
+        locks = []
+        real_flock = fcntl.flock
+
+        def flock(fd, operation):
+            locks.append(operation)
+            real_flock(fd, operation)
+
+        monkeypatch.setattr(fcntl, 'flock', flock)
+        append_sessions(sample_sessions[:1])
+        batch = sample_sessions * 20
+        append_sessions(batch)
+        assert locks == [fcntl.LOCK_EX, fcntl.LOCK_UN] * 2
+        assert load_sessions() == sample_sessions + sample_sessions[:1] + batch
+
+    def test_load_sessions_cache(self, clean_log, sample_sessions):
+        """Test repeat loads reuse parsed records until the file changes"""
+        append_session(sample_sessions[0])
+
+        first = load_sessions()
+        second = load_sessions()
+        assert second == first
+        assert second is not first
+        assert second[0] is first[0]
+
+        # Appended lines are parsed on their own; earlier records are kept
+        append_session(sample_sessions[1])
+        third = load_sessions()
+        assert third == sample_sessions[:2]
+        assert third[0] is first[0]
+
+        # Writes from outside this module are picked up too, including a
+        # final line without a line break
+        with open(get_log_path(), 'a') as f:
+            f.write(json.dumps(sample_sessions[2].to_dict()))
+        assert load_sessions() == sample_sessions[:3]
+
+        append_session(sample_sessions[3])
+        # Joined onto the unterminated line, which is then malformed
+        assert load_sessions() == sample_sessions[:2]
+
+        # A rewritten file is parsed from scratch
+        with open(get_log_path(), 'w') as f:
+            for session in sample_sessions[3:6]:
+                f.write(json.dumps(session.to_dict()) + '\n')
+        assert load_sessions() == sample_sessions[3:6]
+
+        # Also when it's rewritten in place and grows with a line break
+        # right where the parsed bytes ended
+        edited = copy.copy(sample_sessions[3])
+        edited.notes = "xx"  # Same length as null
+        with open(get_log_path(), 'w') as f:
+            for session in [edited] + sample_sessions[4:7]:
+                f.write(json.dumps(session.to_dict()) + '\n')
+        assert load_sessions() == [edited] + sample_sessions[4:7]
+
+        clear_log()
+        assert load_sessions() == []
+
+    def test_non_finite_metrics_round_trip(self, clean_log):
+        """Test NaN/infinite metrics survive the log as written by json"""
+        record = PracticeSessionRecord(
+            timestamp=datetime.now().isoformat(),
+            mode="voice",
+            instrument="voice",
+            duration_seconds=60,
+            avg_cents_deviation=float('nan'),
+            rush_drag_bias=float('inf')
+        )
+
+        append_session(record)
+        loaded = load_sessions()[0]
+
+        assert math.isnan(loaded.avg_cents_deviation)
+        assert loaded.rush_drag_bias == float('inf')
+
+    def test_count_sessions(self, clean_log, sample_sessions):
+        """Test counting skips blank and malformed lines"""
+        assert count_sessions() == 0
+
+        append_sessions(sample_sessions[:3])
+        with open(get_log_path(), 'a') as f:
+            f.write('\n{"not": "a session"}\n')
+        assert count_sessions() == 3
+
+        append_session(sample_sessions[3])
+        assert count_sessions() == 4
+        assert load_sessions() == sample_sessions[:4]
+
+    def test_loaded_vocabulary_is_shared(self, clean_log, sample_sessions):
+        """Test loaded records share one string object per mode/instrument value"""
+        append_sessions(sample_sessions)
+
+        loaded = load_sessions()
+        assert loaded == sample_sessions
+        assert loaded[0].mode is loaded[6].mode
+        assert loaded[0].instrument is loaded[1].instrument
+        assert loaded[0].source is loaded[1].source
+
+    def test_load_sessions_since(self, clean_log, sample_sessions):
+        """Test loading recent sessions from in-order and out-of-order logs"""
+        real_sessions = sample_sessions[:7]
+        since = datetime.fromisoformat(real_sessions[3].timestamp)
+
+        assert load_sessions_since(since) == []
+
+        append_sessions(real_sessions[:5])
+        assert load_sessions_since(since) == real_sessions[3:5]
+
+        append_sessions(real_sessions[5:])
+        assert load_sessions_since(since) == real_sessions[3:]
+
+        # An older session appended late is still left out, and later
+        # ones are still found
+        append_session(real_sessions[0])
+        assert load_sessions_since(since) == real_sessions[3:]
+        append_session(real_sessions[4])
+        assert load_sessions_since(since) == real_sessions[3:] + [real_sessions[4]]
+
+    def test_malformed_line_numbers(self, clean_log, sample_sessions, capsys):
+        """Test warnings give file line numbers, also for appended lines"""
+        append_session(sample_sessions[0])
+        with open(get_log_path(), 'a') as f:
+            f.write('not json\n\n')
+        assert load_sessions() == sample_sessions[:1]
+        assert "malformed line 2 " in capsys.readouterr().out
+
+        with open(get_log_path(), 'a') as f:
+            f.write('{"mode": "chords"}\n')
+        assert load_sessions() == sample_sessions[:1]
+        assert "malformed line 4 " in capsys.readouterr().out
+
     def test_empty_log(self, clean_log):
         """Test loading from empty/non-existent log"""
         sessions = load_sessions()
@@ -197,6 +382,22 @@ class TestProgressStats:
         # Voice: 8 min
         assert minutes["voice"] == 8.0
 
+    def test_minutes_totals_agree(self):
+        """Test one instrument's or mode's minutes equal the total exactly"""
+        sessions = [
+            PracticeSessionRecord(
+                timestamp="2026-01-09T10:00:00",
+                mode="rhythm",
+                instrument="drums",
+                duration_seconds=seconds
+            )
+            for seconds in (20.1, 33.3, 0.7, 59.9, 12.2)
+        ]
+
+        total_minutes = progress_stats.compute_totals(sessions)
+        assert progress_stats.compute_minutes_by_instrument(sessions) == {"drums": total_minutes}
+        assert progress_stats.compute_minutes_by_mode(sessions) == {"rhythm": total_minutes}
+
     def test_minutes_by_mode(self, sample_sessions):
         """Test breakdown by mode"""
         real_sessions = [s for s in sample_sessions if s.source != "demo"]
@@ -229,6 +430,49 @@ class TestProgressStats:
         # (65.0 + 72.0) / 2 = 68.5
         assert avg == pytest.approx(68.5)
 
+        # Metrics no session has, or that don't exist, give None
+        assert progress_stats.compute_average_metrics(improv_sessions, 'rhythm_accuracy') is None
+        assert progress_stats.compute_average_metrics(improv_sessions, 'no_such_metric') is None
+
+    def test_compute_bundle(self, sample_sessions):
+        """Test the one-pass stats bundle matches the individual functions"""
+        real_sessions = [s for s in sample_sessions if s.source != "demo"]
+
+        bundle = progress_stats.compute_bundle(real_sessions)
+
+        assert bundle.num_sessions == 7
+        assert bundle.total_minutes == progress_stats.compute_totals(real_sessions)
+        assert bundle.minutes_by_instrument == progress_stats.compute_minutes_by_instrument(real_sessions)
+        assert bundle.minutes_by_mode == progress_stats.compute_minutes_by_mode(real_sessions)
+        assert len(bundle.practice_dates) == progress_stats.compute_practice_days(real_sessions)
+        assert bundle.tunes == {"autumn_leaves", "blue_bossa"}
+        assert bundle.sessions_by_mode["intervals"] == [real_sessions[0], real_sessions[6]]
+
+        # Metrics are grouped by mode unless a grouping is given
+        assert bundle.average('chord_tone_ratio', group='improv_midi') == 72.0
+        assert bundle.average('chord_tone_ratio') == pytest.approx(68.5)
+        assert bundle.average('interval_accuracy', group='intervals') == pytest.approx(82.5)
+        assert bundle.average('avg_cents_deviation', instrument='voice') == 25.0
+        assert bundle.average('rhythm_accuracy', group='intervals') is None
+
+        grouped = progress_stats.compute_bundle(
+            real_sessions,
+            metric_group=lambda mode: 'improv' if 'improv' in mode else mode
+        )
+        assert grouped.average('chord_tone_ratio', group='improv') == pytest.approx(68.5)
+        assert grouped.minutes_by_mode == bundle.minutes_by_mode
+
+    def test_most_practiced_tune(self, sample_sessions):
+        """Test most practiced tune by time, with ties going to the first tune"""
+        # Blue Bossa: 25 min, Autumn Leaves: 20 min
+        assert progress_stats.get_most_practiced_tune(sample_sessions) == "blue_bossa"
+
+        tied = [s for s in sample_sessions if s.tune_id]
+        tied[0].duration_seconds = tied[1].duration_seconds
+        assert progress_stats.get_most_practiced_tune(tied) == "autumn_leaves"
+
+        assert progress_stats.get_most_practiced_tune(sample_sessions[:2]) is None
+
     def test_filter_sessions(self, sample_sessions):
         """Test session filtering"""
         # Filter by instrument
@@ -252,6 +496,25 @@ class TestProgressStats:
         )
         assert len(real_only) == 7  # Excludes the demo
 
+    def test_filter_sessions_combined(self, sample_sessions):
+        """Test several criteria together, in any combination"""
+        now = datetime.fromisoformat(sample_sessions[6].timestamp)
+
+        assert progress_stats.filter_sessions(
+            sample_sessions, instrument="keyboard", mode="intervals"
+        ) == [sample_sessions[0], sample_sessions[6]]
+
+        assert progress_stats.filter_sessions(
+            sample_sessions, instrument="keyboard", mode="intervals", since_days=1, now=now
+        ) == [sample_sessions[6]]
+
+        assert progress_stats.filter_sessions(
+            sample_sessions, instrument="keyboard", tune_id="autumn_leaves"
+        ) == []
+
+        # No criteria returns the list as given
+        assert progress_stats.filter_sessions(sample_sessions) is sample_sessions
+
 
 class TestGamification:
     """Test XP, ranks, and badges"""
@@ -289,6 +552,26 @@ class TestGamification:
         # 100 * 1.2 = 120
         assert xp == 120
 
+    def test_compute_xp_bonus_thresholds(self):
+        """Test every bonus applies at exactly its threshold and stacks"""
+        def xp(**metrics):
+            return gamification.compute_xp_for_session(PracticeSessionRecord(
+                timestamp=datetime.now().isoformat(),
+                mode="improv_midi",
+                instrument="keyboard",
+                duration_seconds=600,
+                **metrics
+            ))
+
+        all_bonuses = dict(chord_tone_ratio=70.0, rhythm_accuracy=85.0,
+                           interval_accuracy=80.0, chord_accuracy=80.0)
+        # 100 * (1 + 0.2 + 0.2 + 0.15 + 0.15) = 170 (169 after int rounding)
+        assert xp(**all_bonuses) == 169
+        assert xp(chord_tone_ratio=69.9, rhythm_accuracy=84.9,
+                  interval_accuracy=79.9, chord_accuracy=79.9) == 100
+        # Missing and zero metrics earn no bonus
+        assert xp(chord_tone_ratio=0.0, rhythm_accuracy=85.0) == 120
+
     def test_demo_sessions_give_no_xp(self):
         """Test that demo sessions don't award XP"""
         record = PracticeSessionRecord(
@@ -303,6 +586,41 @@ class TestGamification:
         xp = gamification.compute_xp_for_session(record)
         assert xp == 0
 
+    def test_xp_follows_record_edits(self):
+        """Test XP is derived from the record's current fields, not cached"""
+        record = PracticeSessionRecord(
+            timestamp=datetime.now().isoformat(),
+            mode="rhythm",
+            instrument="drums",
+            duration_seconds=600
+        )
+        assert gamification.compute_xp_for_session(record) == 100
+
+        record.rhythm_accuracy = 90.0
+        assert gamification.compute_xp_for_session(record) == 120
+
+    def test_compute_total_xp_streak_bonus(self):
+        """Test total XP adds the weekly streak bonus to per-session XP"""
+        now = datetime.now()
+
+        def session(days_ago, **kwargs):
+            return PracticeSessionRecord(
+                timestamp=(now - timedelta(days=days_ago)).isoformat(),
+                mode="rhythm",
+                instrument="drums",
+                duration_seconds=600,
+                **kwargs
+            )
+
+        # Old sessions only: no streak, so just the sum of session XP
+        old_sessions = [session(60), session(61, rhythm_accuracy=90.0), session(62, source="demo")]
+        assert gamification.compute_total_xp(old_sessions) == 100 + 120
+
+        # 7-day streak: +10% of the last week's XP (700 XP, demos excluded)
+        week = [session(days_ago) for days_ago in range(7)]
+        week.append(session(0, source="demo"))
+        assert gamification.compute_total_xp(old_sessions + week) == 220 + 700 + 70
+
     def test_determine_rank(self):
         """Test rank determination"""
         # Test each rank threshold
@@ -320,6 +638,26 @@ class TestGamification:
         assert next_rank.name == "Apprentice"
         assert xp_needed == 500  # Need 1000 total, have 500
 
+    def test_rank_info_slots(self):
+        """Test RankInfo instances carry no per-instance __dict__"""
+        rank = gamification.RANKS[0]
+        assert not hasattr(rank, '__dict__')
+        assert rank == gamification.RankInfo("Peasant", 0, rank.description)
+
+    def test_rank_edges(self):
+        """Test ranks below the first threshold and at the top"""
+        assert gamification.determine_rank(-10).name == "Peasant"
+        assert gamification.determine_rank(999).name == "Peasant"
+        assert gamification.determine_rank(10**9).name == "Wizard"
+
+        next_rank, xp_needed = gamification.get_next_rank(-10)
+        assert next_rank.name == "Apprentice"
+        assert xp_needed == 1010
+
+        next_rank, xp_needed = gamification.get_next_rank(50000)
+        assert next_rank.name == "Wizard"
+        assert xp_needed == 0
+
     def test_compute_badges(self, sample_sessions):
         """Test badge computation"""
         real_sessions = [s for s in sample_sessions if s.source != "demo"]
@@ -361,6 +699,25 @@ class TestTeacherJournal:
         # Should mention the streak
         assert "7" in entry or "consecutive" in entry.lower()
 
+    def test_entry_at_fixed_time(self, sample_sessions):
+        """Test the entry's date, window and streak all follow the given now"""
+        # One session a day for the week up to now (the demo goes last)
+        now = datetime(2026, 1, 9, 20, 0)
+        for i, session in enumerate(sample_sessions):
+            session.timestamp = (now - timedelta(days=6 - i, hours=8)).isoformat()
+
+        entry = generate_teacher_entry(sample_sessions, days=7, now=now)
+        assert now.strftime('%B %d, %Y') in entry
+        assert "Practiced all 7 days" in entry
+        assert "**7 consecutive days**" in entry
+        assert entry == generate_teacher_entry(sample_sessions, days=7, now=now)
+
+        # A week later nothing is recent any more
+        later = now + timedelta(days=8)
+        assert "No practice sessions logged" in generate_teacher_entry(sample_sessions, days=7, now=later)
+        assert progress_stats.compute_recent_streak(sample_sessions, days=7, now=later) == 0
+        assert progress_stats.filter_sessions(sample_sessions, since_days=7, now=later) == []
+
     def test_empty_sessions(self):
         """Test journal with no sessions"""
         entry = generate_teacher_entry([], days=7)
@@ -430,3 +787,40 @@ class TestIntegration:
         # Generate journal
         entry = generate_teacher_entry(sessions, days=7)
         assert "intervals" in entry.lower()
+
+    def test_session_manager_buffers_log(self, clean_log):
+        """Test that SessionManager writes logged sessions in batches"""
+        from lyra_live.devices.test_device import TestDeviceProfile
+        from lyra_live.sessions.manager import SessionManager
+
+        manager = SessionManager(TestDeviceProfile(), None)
+        for _ in range(SessionManager.LOG_BUFFER_MAX - 1):
+            manager._log_session(mode="intervals", duration_seconds=60)
+        assert load_sessions() == []
+
+        # A full buffer is written out at once
+        manager._log_session(mode="intervals", duration_seconds=60)
+        assert len(load_sessions()) == SessionManager.LOG_BUFFER_MAX
+
+        # close() writes what is left
+        manager._log_session(mode="chords", duration_seconds=60)
+        manager.close()
+        sessions = load_sessions()
+        assert len(sessions) == SessionManager.LOG_BUFFER_MAX + 1
+        assert sessions[-1].mode == "chords"
+        assert sessions[-1].instrument == "test_device"
+
+    def test_session_manager_context_flushes_log(self, clean_log):
+        """Test that leaving a with block writes buffered sessions, even on interrupt"""
+        from lyra_live.devices.test_device import TestDeviceProfile
+        from lyra_live.sessions.manager import SessionManager
+
+        with pytest.raises(KeyboardInterrupt):
+            with SessionManager(TestDeviceProfile(), None) as manager:
+                manager._log_session(mode="intervals", duration_seconds=60)
+                assert load_sessions() == []
+                raise KeyboardInterrupt
+
+        sessions = load_sessions()
+        assert len(sessions) == 1
+        assert sessions[0].mode == "intervals"
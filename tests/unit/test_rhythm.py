@@ -37,6 +37,36 @@ def test_rhythm_grid_creation():
     assert grid.num_bars == 2
 
 
+def test_rhythm_grid_sorts_beats():
+    """Test that grid beats are kept in time order"""
+    grid = RhythmGrid(
+        tempo_bpm=120,
+        beats=[Beat(500, "snare"), Beat(0, "kick")]
+    )
+    assert [b.time_ms for b in grid.beats] == [0, 500]
+    # Already in order, so no copy is made
+    assert grid.get_sorted_beats() is grid.beats
+
+    # Beats assigned after construction are sorted on demand
+    grid.beats = [Beat(1000, "kick"), Beat(250, "snare")]
+    assert [b.time_ms for b in grid.get_sorted_beats()] == [250, 1000]
+    assert [b.time_ms for b in grid.beats] == [1000, 250]
+
+
+def test_rhythm_grid_beats_for_part():
+    """Test per-drum-part view of grid beats"""
+    grid = RhythmGrid(
+        tempo_bpm=120,
+        beats=[Beat(0, "kick"), Beat(500, "snare"), Beat(1000, "kick")]
+    )
+    assert [b.time_ms for b in grid.get_sorted_beats("kick")] == [0, 1000]
+    assert grid.get_sorted_beats("ride") == []
+
+    # Replacing the beats changes the per-part view
+    grid.beats = [Beat(250, "kick")]
+    assert [b.time_ms for b in grid.get_sorted_beats("kick")] == [250]
+
+
 def test_rhythm_grid_duration():
     """Test RhythmGrid duration calculation"""
     # 120 BPM = 500ms per beat
@@ -194,6 +224,23 @@ def test_rhythm_validation_perfect():
     assert result.average_timing_error_ms == 0.0
 
 
+def test_rhythm_validation_after_in_place_edit():
+    """Test that editing grid beats in place is seen by the next validation"""
+    grid = RhythmGrid(
+        tempo_bpm=120,
+        beats=[Beat(0, "snare"), Beat(500, "snare"), Beat(1000, "snare")]
+    )
+    hits = [Beat(0, "snare"), Beat(500, "snare"), Beat(1000, "snare")]
+    assert RhythmValidator.validate_rhythm(grid, hits).correct_hits == 3
+
+    grid.beats[1] = Beat(1500, "snare")
+    assert [b.time_ms for b in grid.get_sorted_beats()] == [0, 1000, 1500]
+
+    result = RhythmValidator.validate_rhythm(grid, hits)
+    assert result.correct_hits == 2
+    assert result.missed_hits == 1
+
+
 def test_rhythm_validation_rushing():
     """Test rhythm validation with rushing (early hits)"""
     grid = RhythmGrid(
@@ -347,6 +394,36 @@ def test_rhythm_validation_out_of_tolerance():
     assert result.total_expected_hits == 2
 
 
+def test_rhythm_validation_close_hits_pair_optimally():
+    """Test that a hit between two close beats doesn't steal a neighbour's match"""
+    grid = RhythmGrid(
+        tempo_bpm=120,
+        time_signature=(4, 4),
+        num_bars=1,
+        beats=[
+            Beat(100, "snare", 80),
+            Beat(140, "snare", 80)
+        ]
+    )
+
+    # Greedy nearest-match would pair 100 -> 120 and leave 140 unmatched
+    actual_hits = [
+        Beat(70, "snare", 80),
+        Beat(120, "snare", 80)
+    ]
+
+    result = RhythmValidator.validate_rhythm(
+        expected_grid=grid,
+        actual_hits=actual_hits,
+        tolerance_ms=50
+    )
+
+    assert result.correct_hits == 2
+    assert result.missed_hits == 0
+    assert result.extra_hits == 0
+    assert result.per_hit_errors == [-30, -20]
+
+
 def test_drum_part_filter():
     """Test rhythm validation with drum part filtering"""
     grid = RhythmGrid(
@@ -381,6 +458,22 @@ def test_drum_part_filter():
     assert result.correct_hits == 2
 
 
+def test_rhythm_exercise_to_exercise():
+    """Test converting a rhythm exercise to a generic Exercise"""
+    exercise = RhythmExerciseGenerator.generate_straight_pattern(
+        drum_part="snare",
+        subdivision="quarter",
+        tempo_bpm=120
+    )
+
+    generic = exercise.to_exercise()
+
+    assert generic.id == exercise.id
+    assert len(generic.notes) == 4
+    assert [n.duration_ms for n in generic.notes] == [0, 500, 1000, 1500]
+    assert generic.correct_response == generic.notes
+
+
 def test_invalid_subdivision_defaults_to_quarter():
     """Test that invalid subdivision defaults to quarter notes"""
     exercise = RhythmExerciseGenerator.generate_straight_pattern(
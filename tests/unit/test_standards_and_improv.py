@@ -93,6 +93,57 @@ class TestStandardsLibrary:
         for tune in beginner_tunes:
             assert tune.difficulty == 'beginner'
 
+    def test_get_chord_at_time(self):
+        """Test looking up the active chord at a bar/beat position"""
+        tune = StandardTune(
+            id="test_lookup",
+            title="Test Lookup",
+            chord_changes=[
+                ChordChange(0, 1.0, "Dm7", 4.0),
+                ChordChange(1, 1.0, "G7", 2.0),
+                ChordChange(1, 3.0, "Db7", 2.0),
+                ChordChange(2, 1.0, "Cmaj7", 4.0),
+            ]
+        )
+
+        assert tune.get_chord_at_time(0, 1.0) == "Dm7"
+        assert tune.get_chord_at_time(0, 4.5) == "Dm7"
+        assert tune.get_chord_at_time(1, 1.0) == "G7"
+        assert tune.get_chord_at_time(1, 2.9) == "G7"
+        assert tune.get_chord_at_time(1, 3.0) == "Db7"
+        assert tune.get_chord_at_time(5, 1.0) == "Cmaj7"
+
+        # Replacing the changes is picked up by later lookups
+        tune.chord_changes = [ChordChange(0, 2.0, "F7", 4.0)]
+        assert tune.get_chord_at_time(0, 1.0) is None
+        assert tune.get_chord_at_time(0, 2.0) == "F7"
+
+        # So are in-place edits, in either lookup
+        tune.chord_changes[0] = ChordChange(0, 1.0, "Bb7", 4.0)
+        assert tune.get_chord_at_time(0, 1.0) == "Bb7"
+        tune.chord_changes[0].chord_symbol = "Eb7"
+        assert tune.get_chords_at_times([(0, 1.0), (3, 1.0)]) == ["Eb7", "Eb7"]
+
+    def test_get_chords_at_times(self):
+        """Test batch chord lookup matches single lookups, in or out of order"""
+        tune = StandardTune(
+            id="test_batch_lookup",
+            title="Test Batch Lookup",
+            chord_changes=[
+                ChordChange(1, 1.0, "G7", 2.0),
+                ChordChange(0, 2.0, "Dm7", 4.0),
+                ChordChange(1, 2.5, "Db7", 2.0),
+                ChordChange(2, 1.0, "Cmaj7", 4.0),
+            ]
+        )
+
+        positions = [(0, 1.0), (0, 3.0), (1, 1.0), (1, 2.5), (1, 4.0), (3, 2.0)]
+        expected = [None, "Dm7", "G7", "Db7", "Db7", "Cmaj7"]
+
+        assert tune.get_chords_at_times(positions) == expected
+        assert tune.get_chords_at_times(reversed(positions)) == expected[::-1]
+        assert StandardTune(id="empty", title="Empty").get_chords_at_times(positions) == [None] * 6
+
 
 class TestChordParsing:
     """Test chord symbol parsing"""
@@ -137,6 +188,14 @@ class TestChordParsing:
         assert root == 11  # B
         assert quality == "m7b5"
 
+    def test_parse_symbol_variants(self):
+        """Test parsing symbol shorthands and extended qualities"""
+        assert parse_chord_symbol("EbΔ7") == (3, "maj7")
+        assert parse_chord_symbol("F#ø") == (6, "m7b5")
+        assert parse_chord_symbol("Fmaj7#11") == (5, "maj7")
+        assert parse_chord_symbol("G7b9") == (7, "7")
+        assert parse_chord_symbol("Bb") == (10, "maj")
+
     def test_get_chord_intervals(self):
         """Test getting intervals for different chord types"""
         # Major 7th: R, M3, P5, M7
@@ -202,6 +261,39 @@ class TestNoteClassification:
         assert function == "chromatic"
 
 
+class TestImprovNote:
+    """Test ImprovNote derived display fields"""
+
+    def test_note_name_and_octave(self):
+        """Test note name and octave follow the pitch"""
+        note = ImprovNote(time_ms=0, pitch=61, velocity=80, duration_ms=100)
+        assert note.note_name == "C#"
+        assert note.octave == 4
+
+        note.pitch = 47
+        assert note.note_name == "B"
+        assert note.octave == 2
+
+
+class TestAnalysisStats:
+    """Test the slotted stats records"""
+
+    def test_stats_have_no_instance_dict(self):
+        """Test stats records use slots but still copy and compare as dataclasses"""
+        import copy
+        from dataclasses import asdict
+
+        harmonic = HarmonicStats(60.0, 30.0, 10.0, 2, 25.0)
+        rhythmic = RhythmicStats(70.0, 30.0, 4.5, 8, 3)
+
+        for stats in (harmonic, rhythmic):
+            assert not hasattr(stats, '__dict__')
+            assert copy.deepcopy(stats) == stats
+
+        assert asdict(harmonic)['guide_tone_hits'] == 2
+        assert rhythmic.longest_phrase == 8
+
+
 class TestGuideToneDetection:
     """Test guide-tone hit detection"""
 
@@ -290,6 +382,43 @@ class TestGuideToneDetection:
         guide_tone_hits = find_guide_tones(chorus)
         assert guide_tone_hits == 0
 
+    def test_guide_tones_ignore_bars_without_changes(self):
+        """Test that guide tones only count in bars that start a chord change"""
+        tune = StandardTune(
+            id="test_guide_bars",
+            title="Test Guide Bars",
+            chorus_length_bars=4,
+            chord_changes=[
+                ChordChange(0, 1.0, "Cmaj7", 8.0),
+                ChordChange(2, 1.0, "G7", 8.0)
+            ]
+        )
+
+        chorus = ImprovChorus(chorus_number=1, tune=tune, start_time_ms=0)
+        for bar in range(4):
+            note = ImprovNote(
+                time_ms=bar * 2000,
+                pitch=64,
+                velocity=80,
+                duration_ms=400,
+                bar=bar,
+                beat=1.0
+            )
+            note.note_function = "3rd"
+            chorus.notes.append(note)
+
+        # Only bars 0 and 2 have chord changes
+        assert find_guide_tones(chorus) == 2
+
+    def test_analysis_guide_tones_match_find_guide_tones(self):
+        """Test that the analysis reports the same guide-tone count as find_guide_tones"""
+        generator = TestImprovGenerator(seed=42)
+        chorus = generator.generate_guide_tone_focused_solo()
+
+        result = analyze_improvisation(chorus)
+
+        assert result.harmonic_stats.guide_tone_hits == find_guide_tones(chorus)
+
 
 class TestImprovAnalysis:
     """Test complete improvisation analysis"""
@@ -377,6 +506,42 @@ class TestImprovAnalysis:
         assert 0 <= metrics['outside_ratio'] <= 100
         assert 0 <= metrics['overall_score'] <= 100
 
+    def test_calculate_metrics_reuses_result(self):
+        """Test that a precomputed analysis can be passed to calculate_metrics"""
+        generator = TestImprovGenerator(seed=555)
+        chorus = generator.generate_simple_blues_solo(style="chord_tones", note_count=30)
+
+        result = analyze_improvisation(chorus)
+        metrics = calculate_metrics(chorus, result=result)
+
+        assert metrics == calculate_metrics(chorus)
+        assert metrics['overall_score'] == result.overall_score
+
+    def test_notes_by_bar_and_chord_track_changes(self):
+        """Test bar/chord lookups stay current as notes are added and annotated"""
+        generator = TestImprovGenerator(seed=777)
+        chorus = generator.generate_simple_blues_solo(style="chord_tones", note_count=24)
+
+        for bar in range(12):
+            assert chorus.get_notes_in_bar(bar) == [n for n in chorus.notes if n.bar == bar]
+
+        extra = ImprovNote(time_ms=99000, pitch=60, velocity=80, duration_ms=200, bar=3, beat=1.0)
+        chorus.notes.append(extra)
+        assert chorus.get_notes_in_bar(3)[-1] is extra
+
+        # Analysis fills in chord_at_time on every note in place
+        analyze_improvisation(chorus)
+        for symbol in {n.chord_at_time for n in chorus.notes}:
+            assert chorus.get_notes_on_chord(symbol) == [
+                n for n in chorus.notes if n.chord_at_time == symbol
+            ]
+
+        # Sorting and editing notes in place are seen by the next lookup
+        chorus.notes.sort(key=lambda n: -n.time_ms)
+        extra.bar = 4
+        assert chorus.get_notes_in_bar(4)[0] is extra
+        assert extra not in chorus.get_notes_in_bar(3)
+
 
 class TestRhythmicAnalysis:
     """Test rhythmic analysis features"""
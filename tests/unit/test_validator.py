@@ -82,3 +82,56 @@ def test_descending_interval():
     result = ExerciseValidator.validate_interval(expected, actual)
 
     assert result.correct
+
+
+def test_correct_chord_transposed():
+    """Test chord validation accepts the same quality from a different root"""
+    expected = [Note(60, 2000), Note(64, 2000), Note(67, 2000)]  # C major
+    actual = [Note(62, 2000), Note(66, 2000), Note(69, 2000)]    # D major
+
+    result = ExerciseValidator.validate_chord(expected, actual)
+
+    assert result.correct
+    assert "Correct" in result.feedback
+
+
+def test_correct_chord_open_voicing():
+    """Test chord validation ignores the octave of upper chord tones"""
+    expected = [Note(60, 2000), Note(64, 2000), Note(67, 2000)]  # C E G
+    actual = [Note(48, 2000), Note(64, 2000), Note(55, 2000)]    # C3 E4 G3
+
+    result = ExerciseValidator.validate_chord(expected, actual)
+
+    assert result.correct
+
+
+def test_incorrect_chord_quality():
+    """Test chord validation rejects a different quality"""
+    expected = [Note(60, 2000), Note(64, 2000), Note(67, 2000)]  # C major
+    actual = [Note(60, 2000), Note(63, 2000), Note(67, 2000)]    # C minor
+
+    result = ExerciseValidator.validate_chord(expected, actual)
+
+    assert not result.correct
+    assert "Not quite" in result.feedback
+
+
+def test_melody_validation_perfect():
+    """Test melody validation with every note correct"""
+    expected = [Note(60, 500), Note(62, 500), Note(64, 500), Note(65, 500)]
+    actual = [Note(60, 500), Note(62, 500), Note(64, 500), Note(65, 500)]
+
+    result = ExerciseValidator.validate_melody(expected, actual)
+
+    assert result.correct
+    assert "Perfect" in result.feedback
+
+
+def test_melody_validation_no_notes():
+    """Test melody validation with nothing played"""
+    expected = [Note(60, 500), Note(62, 500)]
+
+    result = ExerciseValidator.validate_melody(expected, [])
+
+    assert not result.correct
+    assert "No notes detected" in result.feedback